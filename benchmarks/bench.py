@@ -0,0 +1,806 @@
+"""Benchmarks for jeopardy.py's hot paths, run against the saved pages in benchmarks/pages.
+
+Everything runs offline. `suite` times every hot path at once and can save the timings as a baseline
+(benchmarks/baseline.json) or check them against it. Each path is timed --rounds times and the medians are
+compared, failing if any path got slower than --threshold plus an allowance for how noisy its timings were.
+
+Usage:
+	python3 benchmarks/bench.py suite [--save [FILE]] [--check [FILE]] [--threshold FRACTION] [--rounds N]
+	python3 benchmarks/bench.py extract
+	python3 benchmarks/bench.py importtime [--against GIT_REV]
+	python3 benchmarks/bench.py match [--pairs N]
+	python3 benchmarks/bench.py render
+	python3 benchmarks/bench.py corpus [--games N]
+	python3 benchmarks/bench.py server [--rooms N] [--players N] [--accuracy FRACTION]
+	python3 benchmarks/bench.py stats [--attempts N]
+	python3 benchmarks/bench.py cache [--games N]
+	python3 benchmarks/bench.py ingest [--pages N]
+	python3 benchmarks/bench.py startup
+"""
+import argparse, asyncio, contextlib, io, json, os, platform, random, re, statistics, string, subprocess, sys, tempfile, threading, time, tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+PAGES_DIR = BENCH_DIR / 'pages'
+BASELINE = BENCH_DIR / 'baseline.json'
+SEASON_PAGE = PAGES_DIR / 'season_39.html'
+
+# suite: a path regresses when it takes more than this fraction longer than in the baseline
+REGRESSION_THRESHOLD = 0.25
+# ...plus this many times its measured noise, so a path that times unsteadily on this machine needs a bigger change
+NOISE_ALLOWANCE = 3
+# suite: how many times each path is timed; the median is compared
+SUITE_ROUNDS = 5
+
+sys.path.insert(0, str(BENCH_DIR.parent))
+import jeopardy
+
+"""
+timeIt(func, repeat)
+	returns best time of {repeat} calls to {func}, in milliseconds
+"""
+def timeIt(func, repeat):
+	best = float('inf')
+	for _ in range(repeat):
+		start = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - start)
+	return best * 1000
+
+"""
+peakMemory(func)
+	returns (peak, retained) memory allocated by a call to {func}, in KiB
+
+Retained memory is what is still allocated after the call returns, i.e. what the result keeps alive.
+"""
+def peakMemory(func):
+	tracemalloc.start()
+	result = func()
+	retained, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del result
+	return peak / 1024, retained / 1024
+
+# game page extraction: parse time, peak memory while parsing, and memory kept by the result
+def benchExtract(args):
+	print(f"{'page':<28}{'parse ms':>10}{'peak KiB':>10}{'kept KiB':>10}")
+	for page in sorted(PAGES_DIR.glob('game_*.html')):
+		html = page.read_text(encoding='utf-8')
+		ms = timeIt(lambda: jeopardy.Game.parseGame(html), args.repeat)
+		peak, retained = peakMemory(lambda: jeopardy.Game.parseGame(html))
+		print(f"{page.stem:<28}{ms:>10.2f}{peak:>10.0f}{retained:>10.0f}")
+
+# every correct response on the saved pages
+def pageResponses():
+	responses = []
+	for page in sorted(PAGES_DIR.glob('game_*.html')):
+		data = jeopardy.Game.parseGame(page.read_text(encoding='utf-8'))
+		for round in ("jeopardy_round", "double_jeopardy_round"):
+			responses += [clue[1] for row in data.round(round).clues for clue in row if clue]
+		responses.append(data.final.response)
+	return responses
+
+"""
+matchPairs(count)
+	returns list of (response, answer)
+
+Cycles through exact answers, answers with one typo and wrong answers, for responses off the saved pages.
+"""
+def matchPairs(count):
+	responses = pageResponses()
+	rng = random.Random(0)
+
+	pairs = []
+	while len(pairs) < count:
+		response = rng.choice(responses)
+		kind = len(pairs) % 3
+		if kind == 0:
+			answer = response.lower()
+		elif kind == 1:
+			i = rng.randrange(len(response))
+			answer = response[:i] + rng.choice(string.ascii_lowercase) + response[i + 1:]
+		else:
+			answer = rng.choice(responses)
+		pairs.append((response, answer))
+	return pairs
+
+# Game.standardizeResponse before ResponseMatcher, as the baseline
+def legacyStandardize(originalResponse):
+	stdResponse = originalResponse.lower().replace("&", "and").translate(str.maketrans('', '', string.punctuation))
+	if stdResponse[:2] == 'a ':
+		stdResponse = stdResponse[2:]
+	elif stdResponse[:3] in ('an ', 'to '):
+		stdResponse = stdResponse[3:]
+	elif stdResponse[:4] == 'the ':
+		stdResponse = stdResponse[4:]
+	return stdResponse
+
+# answer matching: old exact comparison vs ResponseMatcher, building the matcher included (as initBoard does)
+def benchMatch(args):
+	pairs = matchPairs(args.pairs)
+
+	def legacy():
+		return sum(legacyStandardize(answer) == legacyStandardize(response) for response, answer in pairs)
+
+	def matcher():
+		return sum(jeopardy.ResponseMatcher(response).matches(answer) for response, answer in pairs)
+
+	print(f"{len(pairs)} clue/answer pairs (1/3 exact, 1/3 one typo, 1/3 wrong)")
+	print(f"{'matcher':<16}{'us/pair':>10}{'accepted':>10}")
+	for name, func in (("exact (legacy)", legacy), ("ResponseMatcher", matcher)):
+		ms = timeIt(func, args.repeat)
+		print(f"{name:<16}{ms * 1000 / len(pairs):>10.2f}{func():>10}")
+
+class Terminal:
+	"""Stands in for sys.stdout: passes everything on to /dev/null, counting the writes and bytes."""
+	def __init__(self):
+		self.fd = os.open(os.devnull, os.O_WRONLY)
+		self.writes = self.bytes = 0
+
+	def write(self, text):
+		data = text.encode('utf-8')
+		os.write(self.fd, data)
+		self.writes += 1
+		self.bytes += len(data)
+		return len(text)
+
+	def flush(self):
+		pass
+
+# Game.printBoard before Screen, as the baseline: a shell to clear the screen, then a print per cell
+def legacyShowBoard(game):
+	os.system('cls||clear')
+	print("{:>{width}}[1]    [2]    [3]    [4]    [5]".format(" ", width=(game.ctgSpacing + 7)))
+	for rowNum, category in enumerate(game.categories):
+		print("[{}] {:>{width}}   ".format(rowNum + 1, category, width=game.ctgSpacing), end='')
+		for i in range(5):
+			if game.boardState[rowNum][i]:
+				print("${:<6}".format(game.dollarAmounts[i]), end='')
+			else:
+				print("---    ", end='')
+		print()
+	print()
+	print("Score: ", end='')
+	print(jeopardy.Back.WHITE + jeopardy.Fore.BLACK + f"{game.score}")
+
+"""
+renderRound(data, show, terminal)
+	returns list of seconds each board transition took
+
+Takes every clue of {data}'s Jeopardy round in turn, calling {show}(game) to bring the board on screen up to
+date after each one.
+"""
+def renderRound(data, show, terminal):
+	game = jeopardy.Game.__new__(jeopardy.Game)
+	game.screen = jeopardy.Screen(terminal)
+	game.newGame(0, data)
+	show(game)
+
+	times = []
+	for ctg in range(6):
+		for amt in range(5):
+			if not game.boardState[ctg][amt]:
+				continue
+			game.boardState[ctg][amt] = False
+			game.score += game.dollarAmounts[amt]
+
+			start = time.perf_counter()
+			show(game)
+			times.append(time.perf_counter() - start)
+	return times
+
+# per-clue board transition: clearing through a shell and reprinting vs Screen's in-place update
+def benchRender(args):
+	data = jeopardy.Game.parseGame((PAGES_DIR / 'game_standard.html').read_text(encoding='utf-8'))
+
+	def screen(game):
+		game.screen.showBoard(game)
+		game.screen.flush()
+
+	# the shell `cls||clear` writes straight to file descriptors 1 and 2
+	os.environ.setdefault('TERM', 'xterm')
+	stdout, savedFds = sys.stdout, (os.dup(1), os.dup(2))
+	devnull = os.open(os.devnull, os.O_WRONLY)
+	os.dup2(devnull, 1)
+	os.dup2(devnull, 2)
+	try:
+		results = []
+		for name, show in (("clear + print (legacy)", legacyShowBoard), ("Screen", screen)):
+			best, terminal = None, None
+			for _ in range(args.repeat):
+				terminal = sys.stdout = Terminal()
+				times = sorted(renderRound(data, show, terminal))
+				if best is None or times[len(times) // 2] < best[len(best) // 2]:
+					best = times
+			results.append((name, best, terminal.writes / (len(best) + 1), terminal.bytes / (len(best) + 1)))
+	finally:
+		sys.stdout = stdout
+		os.dup2(savedFds[0], 1)
+		os.dup2(savedFds[1], 2)
+
+	print(f"{'renderer':<24}{'median us':>10}{'max us':>10}{'writes':>8}{'bytes':>8}   (per clue)")
+	for name, times, writes, size in results:
+		print(f"{name:<24}{times[len(times) // 2] * 1e6:>10.0f}{times[-1] * 1e6:>10.0f}{writes:>8.0f}{size:>8.0f}")
+
+"""
+syntheticGames(count)
+	yields (gameId, GameData) for {count} games
+
+Copies of the saved games with every text made unique, so they pack like real games from many seasons would.
+"""
+def syntheticGames(count):
+	templates = [jeopardy.Game.parseGame(page.read_text(encoding='utf-8')).toDict() for page in sorted(PAGES_DIR.glob('game_*.html'))]
+	for gameId in range(1, count + 1):
+		game = json.loads(json.dumps(templates[gameId % len(templates)]).replace('", "', f' {gameId}", "'))
+		yield gameId, jeopardy.GameData.fromDict(game)
+
+# resident set size of this process, in KiB (Linux only)
+def residentKiB():
+	with open('/proc/self/statm') as statm:
+		return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+# packed corpus: build, open and random access over a synthetic 40-season corpus
+def benchCorpus(args):
+	with tempfile.TemporaryDirectory() as scratchDir:
+		path = Path(scratchDir, 'corpus.bin')
+		start = time.perf_counter()
+		games, clues = jeopardy.Corpus.build(syntheticGames(args.games), path)
+		print(f"built {clues} clues from {games} games in {time.perf_counter() - start:.1f} s, {path.stat().st_size / 2 ** 20:.1f} MiB")
+
+		# opening it in a fresh interpreter, where nothing else has touched the file or the heap
+		report = subprocess.run([sys.executable, __file__, 'corpus-open', '--corpus', str(path), '--games', str(games)],
+			capture_output=True, text=True, check=True).stdout
+		print(report, end='')
+
+		before = residentKiB()
+		corpus = jeopardy.Corpus(path)
+
+		rng = random.Random(0)
+		indexes = [rng.randrange(clues) for _ in range(10000)]
+		ms = timeIt(lambda: [corpus.clue(i) for i in indexes], args.repeat)
+		print(f"random clue: {ms * 1000 / len(indexes):.2f} us")
+
+		gameIds = [rng.randrange(1, games + 1) for _ in range(1000)]
+		ms = timeIt(lambda: [corpus.game(gameId) for gameId in gameIds], args.repeat)
+		print(f"random game: {ms * 1000 / len(gameIds):.1f} us")
+		print(f"resident memory added after the random reads (pages of the file touched): {residentKiB() - before} KiB")
+
+		# --practice: building each filter's pool is one scan of the category table, drawing a board is not
+		practice = jeopardy.PracticeIndex(corpus, 0)
+		for name, filters in [("any", {}), ("DJ $1600", {"round": "DJ", "value": 1600}), ("keyword", {"keyword": "canyon"})]:
+			start = time.perf_counter()
+			pool = practice.pool(**filters)
+			built = time.perf_counter() - start
+			pools = (None, pool) if filters.get("round") == "DJ" else (pool, None)
+			ms = timeIt(lambda: [practice.board("bench", *pools) for _ in range(100)], args.repeat)
+			print(f"practice pool {name}: {len(pool)} categories in {built * 1000:.1f} ms, board: {ms * 10:.1f} us")
+		corpus.close()
+
+# opens the corpus at --corpus and loads one game from it (run by benchCorpus in a fresh interpreter)
+def benchCorpusOpen(args):
+	before = residentKiB()
+	start = time.perf_counter()
+	corpus = jeopardy.Corpus(args.corpus)
+	opened = time.perf_counter()
+	corpus.game(args.games // 2)
+	loaded = time.perf_counter()
+	print(f"open: {(opened - start) * 1000:.3f} ms, first game: {(loaded - opened) * 1000:.3f} ms, "
+		f"resident memory added: {residentKiB() - before} KiB")
+
+"""
+botPlayer(port, room, name, game, accuracy, rng, report, start)
+
+One bot session of the server load test: joins {room} (creating it with {game}, a (gameId, GameData)),
+sends start if {start}, and then plays like a person with no sense of timing. It picks the first open clue,
+buzzes in on every clue after 0-20 ms, answers right {accuracy} of the time and wagers half of what it can.
+The time from each buzz to the server naming who buzzed in first goes into {report}["latency"].
+"""
+async def botPlayer(port, room, name, game, accuracy, rng, report, start):
+	gameId, data = game
+	reader, writer = await asyncio.open_connection('127.0.0.1', port)
+	def send(message):
+		writer.write(json.dumps(message).encode('utf-8') + b"\n")
+
+	send({"type": "join", "room": room, "name": name, "game": gameId})
+	me = None
+	board = None
+	round = None
+	clue = None
+	buzzedAt = None
+
+	async def buzz(delay):
+		nonlocal buzzedAt
+		await asyncio.sleep(delay)
+		buzzedAt = time.perf_counter()
+		send({"type": "buzz"})
+
+	def answer():
+		if clue.get("final"):
+			response = data.final.response
+		else:
+			response = data.round(round).clues[clue["row"]][clue["col"]][1]
+		send({"type": "answer", "text": response if rng.random() < accuracy else "no idea"})
+
+	while line := await reader.readline():
+		message = json.loads(line)
+		report["messages"] += 1
+		kind = message["type"]
+		if kind == "joined":
+			me = message["name"]
+			if start:
+				send({"type": "start"})
+		elif kind == "board":
+			board, round = message["open"], message["round"]
+		elif kind == "control" and message["player"] == me:
+			row, col = next((row, col) for col in range(5) for row in range(6) if board[row][col])
+			send({"type": "choose", "row": row, "col": col})
+		elif kind == "clue":
+			clue = message
+			if message.get("final") or message["dailyDouble"]:
+				if message["player"] == me or message.get("final"):
+					answer()
+			else:
+				asyncio.ensure_future(buzz(rng.uniform(0, 0.02)))
+		elif kind == "buzzed":
+			if buzzedAt is not None:
+				report["latency"].append(time.perf_counter() - buzzedAt)
+				buzzedAt = None
+			if message["player"] == me:
+				answer()
+		elif kind == "wager" and message["player"] == me:
+			send({"type": "wager", "amount": message["maximum"] // 2})
+		elif kind == "reveal":
+			report["clues"] += start
+			if message["row"] is not None:
+				board[message["row"]][message["col"]] = False
+		elif kind == "over":
+			break
+	writer.close()
+
+# user and system CPU seconds used so far by process {pid} (Linux only)
+def cpuSeconds(pid):
+	with open(f'/proc/{pid}/stat') as stat:
+		fields = stat.read().rsplit(')', 1)[1].split()
+	return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+# game night server: --rooms rooms of --players bots each play a whole game at once against a --serve subprocess
+def benchServer(args):
+	with tempfile.TemporaryDirectory() as scratchDir:
+		# a handful of games shared by all the rooms, in a cache of their own
+		games = list(syntheticGames(10))
+		jeopardy.GameCache.cacheDir = Path(scratchDir, 'cache', 'games')
+		jeopardy.Store.path = Path(scratchDir, 'cache', 'jeopardy.db')
+		for gameId, data in games:
+			jeopardy.GameCache.save(gameId, data)
+
+		server = subprocess.Popen([sys.executable, str(BENCH_DIR.parent / 'jeopardy.py'), '--serve', '127.0.0.1:0'],
+			cwd=scratchDir, stdout=subprocess.PIPE, text=True)
+		try:
+			port = int(re.search(r'port (\d+)', server.stdout.readline()).group(1))
+			report = {"messages": 0, "clues": 0, "latency": []}
+			rng = random.Random(0)
+
+			async def run():
+				bots = []
+				for room in range(args.rooms):
+					game = games[room % len(games)]
+					# the room's creator joins and starts once the others are in
+					for player in range(1, args.players):
+						bots.append(asyncio.ensure_future(botPlayer(port, f"room{room}", f"bot{player}", game, args.accuracy, rng, report, False)))
+					await asyncio.sleep(0.01)
+					bots.append(asyncio.ensure_future(botPlayer(port, f"room{room}", "bot0", game, args.accuracy, rng, report, True)))
+				await asyncio.gather(*bots)
+
+			cpuBefore = cpuSeconds(server.pid)
+			start = time.perf_counter()
+			asyncio.run(run())
+			elapsed = time.perf_counter() - start
+			cpu = cpuSeconds(server.pid) - cpuBefore
+		finally:
+			server.terminate()
+			server.wait()
+
+	latency = sorted(report["latency"])
+	sessions = args.rooms * args.players
+	print(f"{args.rooms} rooms x {args.players} players = {sessions} sessions played {report['clues']} clues in {elapsed:.1f} s "
+		f"({report['clues'] / elapsed:.0f} clues/s, {report['messages'] / elapsed:.0f} messages/s delivered)")
+	print(f"server CPU: {cpu:.1f} s ({cpu / elapsed:.0%} of one core)")
+	print(f"buzz to buzzed latency (includes the {jeopardy.BUZZ_WINDOW * 1000:.0f} ms buzz window): "
+		f"p50 {latency[len(latency) // 2] * 1000:.0f} ms, p99 {latency[int(len(latency) * 0.99)] * 1000:.0f} ms")
+
+# --stats: every Analytics breakdown over a Store of --attempts synthetic clue attempts spread over a year
+def benchStats(args):
+	with tempfile.TemporaryDirectory() as scratchDir:
+		store = jeopardy.Store(Path(scratchDir, 'stats.db'), legacy=False)
+		rng = random.Random(0)
+		words = [''.join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 9))) for _ in range(400)]
+		categories = [' '.join(rng.sample(words, rng.randint(1, 3))) for _ in range(3000)]
+		start = int(time.time()) - 365 * 86400
+
+		attempts = []
+		for i in range(args.attempts):
+			gameId = 1 + i // 61
+			round = 'FJ' if i % 61 == 60 else 'J' if i % 61 < 30 else 'DJ'
+			value = 0 if round == 'FJ' else jeopardy.DOLLAR_AMOUNTS['jeopardy_round' if round == 'J' else 'double_jeopardy_round'][i % 5]
+			attempts.append((start + i * 300, gameId, round, categories[(i // 5) % len(categories)], value, int(i % 20 == 0),
+				int(rng.random() < 0.6), int(rng.random() < 0.02)))
+		with store.transaction():
+			store.db.executemany("INSERT INTO attempts (time, game_id, round, category, value, daily_double, correct, overridden) "
+				"VALUES (?, ?, ?, ?, ?, ?, ?, ?)", attempts)
+			store.db.executemany("INSERT INTO season_games (season, position, game_id) VALUES (?, ?, ?)",
+				[(1 + gameId // 230, gameId % 230, gameId) for gameId in range(1, args.attempts // 61 + 2)])
+
+		start = time.perf_counter()
+		import pandas
+		print(f"import pandas: {(time.perf_counter() - start) * 1000:.0f} ms (once per run)")
+
+		start = time.perf_counter()
+		jeopardy.Analytics.load(store)
+		print(f"first load, writing the snapshot: {(time.perf_counter() - start) * 1000:.0f} ms")
+		ms = timeIt(lambda: jeopardy.Analytics.load(store), args.repeat)
+		print(f"load {args.attempts} attempts: {ms:.1f} ms")
+		analytics = jeopardy.Analytics.load(store)
+		ms = timeIt(analytics.report, args.repeat)
+		print(f"every breakdown: {ms:.1f} ms")
+		ms = timeIt(lambda: jeopardy.Analytics.load(store, words[0]).report(), args.repeat)
+		print(f"load and breakdowns for one keyword: {ms:.1f} ms")
+		store.db.close()
+
+# game cache: --games synthetic games saved into a cache capped at half their size, so the second half evicts
+# the first, then loads of the games that are left, against reading the same games as plain JSON
+def benchCache(args):
+	with tempfile.TemporaryDirectory() as scratchDir:
+		jeopardy.GameCache.cacheDir = Path(scratchDir, 'games')
+		jeopardy.Store.path = Path(scratchDir, 'jeopardy.db')
+		games = list(syntheticGames(args.games))
+		rawSize = sum(len(json.dumps(data.toDict(), separators=(',', ':'))) for _, data in games)
+		jeopardy.GameCache.setLimit(rawSize // 2 // 3)
+
+		start = time.perf_counter()
+		for gameId, data in games:
+			jeopardy.GameCache.save(gameId, data)
+		elapsed = time.perf_counter() - start
+		stats = jeopardy.Store.local().cacheStats()
+		print(f"save {args.games} games, evicting down to {stats['limit'] / 2 ** 20:.1f} MiB: {elapsed / args.games * 1e6:.0f} us/game "
+			f"({stats['games']} left, {stats['rawBytes'] / stats['bytes']:.1f}x compression)")
+
+		gameIds = jeopardy.GameCache.gameIds()
+		ms = timeIt(lambda: [jeopardy.GameCache.load(gameId) for gameId in gameIds], max(args.repeat // 4, 1))
+		print(f"load {len(gameIds)} games: {ms * 1000 / len(gameIds):.0f} us/game")
+
+		plainDir = Path(scratchDir, 'plain')
+		plainDir.mkdir()
+		for gameId, data in games[-len(gameIds):]:
+			Path(plainDir, f"{gameId}.json").write_text(json.dumps(data.toDict(), separators=(',', ':')), encoding='utf-8')
+		ms = timeIt(lambda: [jeopardy.GameCache.read(path) for path in plainDir.glob('*.json')], max(args.repeat // 4, 1))
+		print(f"read the same games as plain JSON (no index): {ms * 1000 / len(gameIds):.0f} us/game")
+		jeopardy.Store.local().db.close()
+
+# --ingest: --pages copies of the saved game pages parsed by one worker process, then by one per core
+def benchIngest(args):
+	templates = sorted(PAGES_DIR.glob('game_*.html'))
+	for workers in sorted({1, os.cpu_count() or 1}):
+		with tempfile.TemporaryDirectory() as scratchDir:
+			jeopardy.GameCache.cacheDir = Path(scratchDir, 'games')
+			jeopardy.Store.path = Path(scratchDir, 'jeopardy.db')
+			jeopardy.Store.threadStores = threading.local()
+			pagesDir = Path(scratchDir, 'pages')
+			pagesDir.mkdir()
+			for gameId in range(1, args.pages + 1):
+				Path(pagesDir, f"showgame.php?game_id={gameId}").write_bytes(templates[gameId % len(templates)].read_bytes())
+
+			ingester = jeopardy.Ingester(pagesDir, workers)
+			start = time.perf_counter()
+			with contextlib.redirect_stdout(io.StringIO()):
+				ingester.run()
+			elapsed = time.perf_counter() - start
+			print(f"{workers} worker{'s' if workers > 1 else ''}: {args.pages} pages in {elapsed:.1f} s, {args.pages / elapsed:.1f} pages/s "
+				f"({ingester.counts['ingested']} games saved)")
+			jeopardy.Store.local().db.close()
+
+"""
+firstBoard(command, cwd)
+	returns seconds from starting {command} until its first board is drawn
+
+Runs {command} in {cwd}, turning autoplay down, and stops it as soon as the board's first dollar amount comes out.
+"""
+def firstBoard(command, cwd):
+	start = time.perf_counter()
+	process = subprocess.Popen(command, cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+	process.stdin.write(b"n\n")
+	process.stdin.flush()
+	output = b""
+	while b"$200" not in output:
+		chunk = os.read(process.stdout.fileno(), 65536)
+		if not chunk:
+			raise RuntimeError(f"{command} exited before drawing a board: {output[-500:]!r}")
+		output += chunk
+	elapsed = time.perf_counter() - start
+	process.kill()
+	process.wait()
+	return elapsed
+
+# --daemon: time from running -g until the first board is drawn, by jeopardy.py itself and through jeopardy_client.py
+def benchStartup(args):
+	with tempfile.TemporaryDirectory() as scratchDir:
+		jeopardy.GameCache.cacheDir = Path(scratchDir, 'cache', 'games')
+		jeopardy.Store.path = Path(scratchDir, 'cache', 'jeopardy.db')
+		jeopardy.GameCache.save(8000, jeopardy.Game.parseGame((PAGES_DIR / 'game_standard.html').read_text(encoding='utf-8')))
+		jeopardy.Store.local().db.close()
+
+		script = str(BENCH_DIR.parent / 'jeopardy.py')
+		client = str(BENCH_DIR.parent / 'jeopardy_client.py')
+		runs = max(args.repeat // 2, 1)
+		def report(label, command):
+			times = sorted(firstBoard(command, scratchDir) for _ in range(runs))
+			print(f"{label}: median {times[len(times) // 2] * 1000:.0f} ms, best {times[0] * 1000:.0f} ms")
+
+		report("jeopardy.py -g", [sys.executable, script, '-g', '8000'])
+		daemon = subprocess.Popen([sys.executable, script, '--daemon'], cwd=scratchDir, stdout=subprocess.PIPE, text=True)
+		try:
+			daemon.stdout.readline()
+			daemon.stdout.readline()
+			report("jeopardy_client.py -g (daemon)", [sys.executable, client, '-g', '8000'])
+			report("python3 -S jeopardy_client.py -g (daemon)", [sys.executable, '-S', client, '-g', '8000'])
+		finally:
+			daemon.terminate()
+			daemon.wait()
+
+"""
+suiteCases(scratchDir)
+	returns list of (name, function to time)
+
+Sets up every hot path the suite times. Anything that needs the Store gets a fresh one in {scratchDir}.
+"""
+def suiteCases(scratchDir):
+	cases = []
+	pages = {page.stem: page.read_text(encoding='utf-8') for page in sorted(PAGES_DIR.glob('game_*.html'))}
+	games = {stem: jeopardy.Game.parseGame(html) for stem, html in pages.items()}
+
+	# extraction, and setting up both rounds of the board
+	for stem, html in pages.items():
+		cases.append((f"parseGame/{stem}", lambda html=html: jeopardy.Game.parseGame(html)))
+
+	game = jeopardy.Game.__new__(jeopardy.Game)
+	game.screen = jeopardy.NullScreen()
+	def newGame(data):
+		game.newGame(0, data)
+		game.initBoard("double_jeopardy_round")
+	for stem, data in games.items():
+		cases.append((f"newGame+initBoard/{stem}", lambda data=data: newGame(data)))
+
+	# answer matching
+	pairs = matchPairs(2000)
+	cases.append(("standardizeResponse x2000", lambda: [game.standardizeResponse(answer) for _, answer in pairs]))
+	cases.append(("ResponseMatcher x2000", lambda: [jeopardy.ResponseMatcher(response).matches(answer) for response, answer in pairs]))
+
+	# board rendering: a full draw, and the in-place update after every clue of a round
+	terminal = Terminal()
+	screen = jeopardy.Screen(terminal)
+	game.screen = screen
+	game.newGame(0, games['game_standard'])
+	def drawBoard():
+		for _ in range(20):
+			screen.clear()
+			screen.drawBoard(game)
+			screen.flush()
+	cases.append(("printBoard x20", drawBoard))
+
+	def showBoard(game):
+		game.screen.showBoard(game)
+		game.screen.flush()
+	cases.append(("showBoard round", lambda: renderRound(games['game_standard'], showBoard, terminal)))
+
+	# stats: recording a game's worth of clues and summing them up
+	stats = jeopardy.Stats(jeopardy.Store(Path(scratchDir, 'stats.db'), legacy=False))
+	stats.closed = True # nothing to show at exit
+	def recordGame():
+		for amt in range(61):
+			stats.record(0, "jeopardy_round", "CATEGORY", 200, amt % 20 == 0, amt % 3 != 0, False)
+		stats.record(0, "final_jeopardy_round", "CATEGORY", 0, False, True, False)
+		return stats.summary()
+	cases.append(("Stats record+summary x62", recordGame))
+
+	# season bookkeeping: reading a season page, loading a GameLog and handing out its games
+	seasonHtml = SEASON_PAGE.read_text(encoding='utf-8')
+	cases.append(("parseSeasonPage", lambda: jeopardy.GameLog.parseSeasonPage(seasonHtml)))
+
+	jeopardy.Store.path = Path(scratchDir, 'jeopardy.db')
+	store = jeopardy.Store(legacy=False)
+	store.saveSeasonGames(39, jeopardy.GameLog.parseSeasonPage(seasonHtml))
+	def advanceSeason():
+		store.setProgress(39, 0)
+		gameLog = jeopardy.GameLog(39)
+		return [gameLog.getCurrentGameId() for _ in range(50)]
+	cases.append(("GameLog load+advance x50", advanceSeason))
+
+	return cases
+
+# a fixed amount of plain Python work to measure how fast the machine is running right now
+def calibrationWork():
+	return sum(len(str(i)) for i in range(20000))
+
+"""
+timeCase(func, repeat)
+	returns (best time of {func}, best time of the calibration work), in milliseconds
+
+Runs the calibration work between the calls to {func}, so a case timed while the machine was busier (or on a
+slower machine) can be scaled to what it would have taken under the baseline's conditions.
+"""
+def timeCase(func, repeat):
+	best = calibration = float('inf')
+	for _ in range(repeat):
+		start = time.perf_counter()
+		func()
+		middle = time.perf_counter()
+		calibrationWork()
+		end = time.perf_counter()
+		best = min(best, middle - start)
+		calibration = min(calibration, end - middle)
+	return best * 1000, calibration * 1000
+
+"""
+timeSuite(cases, repeat, rounds)
+	returns {name: [median time, median calibration time, noise]}, times in milliseconds
+
+Times every case in {cases} with timeCase {rounds} times over, going through all of the cases once per round so a
+burst of load on the machine lands on one round of every case instead of every round of one case. The noise is
+how far a case's calibrated rounds typically were from their median, as a fraction of it.
+"""
+def timeSuite(cases, repeat, rounds):
+	runs = {name: [] for name, _ in cases}
+	for _ in range(rounds):
+		for name, func in cases:
+			runs[name].append(timeCase(func, repeat))
+
+	timings = {}
+	for name, times in runs.items():
+		ratios = [ms / calibration for ms, calibration in times]
+		ratio = statistics.median(ratios)
+		noise = statistics.median(abs(r - ratio) for r in ratios) / ratio
+		timings[name] = [round(statistics.median(ms for ms, _ in times), 4),
+			round(statistics.median(calibration for _, calibration in times), 4), round(noise, 4)]
+	return timings
+
+"""
+compareBaseline(timings, baseline, threshold)
+	returns names of the paths that regressed
+
+Prints how each (time, calibration time, noise) in {timings} compares with the {baseline}, after scaling the
+baseline by how the calibration times compare. A path regresses when it took more than {threshold} longer
+than expected from the baseline, plus NOISE_ALLOWANCE times the noise of whichever run was noisier.
+"""
+def compareBaseline(timings, baseline, threshold):
+	regressions = []
+	print(f"\n{'path':<36}{'expected':>10}{'now':>10}{'change':>9}{'allowed':>9}")
+	for name, (ms, calibration, noise) in timings.items():
+		if name not in baseline['timings']:
+			print(f"{name:<36}{'-':>10}{ms:>10.3f}{'new':>9}")
+			continue
+
+		baseMs, baseCalibration, baseNoise = baseline['timings'][name]
+		expected = baseMs * calibration / baseCalibration
+		change = ms / expected - 1
+		allowed = threshold + NOISE_ALLOWANCE * max(noise, baseNoise)
+		flag = ""
+		if change > allowed:
+			regressions.append(name)
+			flag = "  REGRESSION"
+		print(f"{name:<36}{expected:>10.3f}{ms:>10.3f}{change:>+9.0%}{allowed:>+9.0%}{flag}")
+	return regressions
+
+# every hot path, optionally saved as or checked against a baseline
+def benchSuite(args):
+	with tempfile.TemporaryDirectory() as scratchDir:
+		timings = timeSuite(suiteCases(scratchDir), args.repeat, args.rounds)
+	print(f"{'path':<36}{'median ms':>10}{'noise':>9}")
+	for name, (ms, _, noise) in timings.items():
+		print(f"{name:<36}{ms:>10.3f}{noise:>9.1%}")
+
+	if args.save:
+		baseline = {'python': platform.python_version(), 'machine': platform.machine(), 'repeat': args.repeat,
+			'rounds': args.rounds, 'timings': timings}
+		Path(args.save).write_text(json.dumps(baseline, indent='\t') + "\n", encoding='utf-8')
+		print(f"\nBaseline saved to {args.save}")
+
+	if args.check:
+		baseline = json.loads(Path(args.check).read_text(encoding='utf-8'))
+		regressions = compareBaseline(timings, baseline, args.threshold)
+		if regressions:
+			print(f"\n{len(regressions)} path(s) slower than the baseline by more than they're allowed: " + ", ".join(regressions))
+			sys.exit(1)
+		print(f"\nNo path slower than the baseline by more than {args.threshold:.0%} plus its noise allowance.")
+
+"""
+importTime(sourceDir, repeat)
+	returns (best time to import jeopardy in ms, {module: ms} for the modules it imports directly)
+
+Runs `python -X importtime -c "import jeopardy"` in {sourceDir} in a fresh interpreter {repeat} times.
+"""
+def importTime(sourceDir, repeat):
+	best = None
+	for _ in range(repeat):
+		report = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import jeopardy'], cwd=sourceDir,
+			capture_output=True, text=True, check=True).stderr
+
+		# lines look like "import time: self [us] | cumulative | name", with nested imports indented by two
+		# more spaces and listed before the module that imported them
+		children = {}
+		for line in report.splitlines()[1:]:
+			_, cumulative, name = line.split('|')
+			depth = (len(name) - len(name.lstrip()) - 1) // 2
+			if depth == 1:
+				children[name.strip()] = int(cumulative) / 1000
+			elif depth == 0:
+				if name.strip() == 'jeopardy':
+					total = int(cumulative) / 1000
+					break
+				children = {}
+
+		if best is None or total < best[0]:
+			best = (total, children)
+
+	return best
+
+def printImportTime(label, sourceDir, repeat):
+	total, modules = importTime(sourceDir, repeat)
+	slowest = sorted(modules.items(), key=lambda item: -item[1])[:5]
+	print(f"{label:<10}{total:>8.1f} ms   (" + ", ".join(f"{name} {ms:.1f}" for name, ms in slowest) + ")")
+
+# cold-start import time, optionally compared with jeopardy.py as of another git revision
+def benchImportTime(args):
+	printImportTime("current", BENCH_DIR.parent, args.repeat)
+
+	if args.against:
+		with tempfile.TemporaryDirectory() as oldDir:
+			source = subprocess.run(['git', 'show', f"{args.against}:jeopardy.py"], cwd=BENCH_DIR.parent,
+				capture_output=True, text=True, check=True).stdout
+			Path(oldDir, 'jeopardy.py').write_text(source, encoding='utf-8')
+			printImportTime(args.against, oldDir, args.repeat)
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('benchmark', choices=['suite', 'extract', 'importtime', 'match', 'render', 'corpus', 'corpus-open', 'server', 'stats', 'cache', 'ingest', 'startup'])
+	parser.add_argument('--repeat', type=int, default=20, help='Runs per timing; the best one is reported.')
+	parser.add_argument('--against', metavar='GIT_REV', help='importtime: also measure jeopardy.py as of this git revision.')
+	parser.add_argument('--pairs', type=int, default=6000, help='match: number of clue/answer pairs.')
+	parser.add_argument('--games', type=int, default=40 * 230, help='corpus: number of games to pack (40 seasons by default); cache: number of games to save.')
+	parser.add_argument('--corpus', help=argparse.SUPPRESS)
+	parser.add_argument('--rooms', type=int, default=100, help='server: number of rooms playing at once.')
+	parser.add_argument('--players', type=int, default=3, help='server: bots per room.')
+	parser.add_argument('--accuracy', type=float, default=0.6, help='server: fraction of clues the bots get right.')
+	parser.add_argument('--pages', type=int, default=200, help='ingest: number of game pages to parse.')
+	parser.add_argument('--attempts', type=int, default=100000, help='stats: number of recorded clue attempts.')
+	parser.add_argument('--save', nargs='?', const=BASELINE, metavar='FILE', help='suite: save the timings as the baseline.')
+	parser.add_argument('--check', nargs='?', const=BASELINE, metavar='FILE', help='suite: fail if any path is slower than in the baseline.')
+	parser.add_argument('--rounds', type=int, default=SUITE_ROUNDS, help='suite: times to time every path; the median is compared.')
+	parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='suite: slowdown (as a fraction) that counts as a regression.')
+	args = parser.parse_args()
+
+	if args.benchmark == 'suite':
+		benchSuite(args)
+	elif args.benchmark == 'extract':
+		benchExtract(args)
+	elif args.benchmark == 'importtime':
+		benchImportTime(args)
+	elif args.benchmark == 'match':
+		benchMatch(args)
+	elif args.benchmark == 'render':
+		benchRender(args)
+	elif args.benchmark == 'corpus':
+		benchCorpus(args)
+	elif args.benchmark == 'corpus-open':
+		benchCorpusOpen(args)
+	elif args.benchmark == 'server':
+		benchServer(args)
+	elif args.benchmark == 'stats':
+		benchStats(args)
+	elif args.benchmark == 'cache':
+		benchCache(args)
+	elif args.benchmark == 'ingest':
+		benchIngest(args)
+	elif args.benchmark == 'startup':
+		benchStartup(args)
+
+if __name__ == '__main__':
+	main()
@@ -1,709 +1,5132 @@
-import requests, sys, webbrowser, bs4
+# requests and bs4 are slow to import and only needed when something has to be downloaded, so they are
+# imported where they're used; playing cached games never loads them
+import sys, webbrowser, atexit, getpass
 from ast import literal_eval as make_tuple
-from colorama import init as color_init, Fore, Back
-from os import system
+from colorama import init as color_init, deinit as color_deinit, Fore, Back, Style
 from pathlib import Path
-import pandas as pd
 import csv
 import argparse
 import string
+import json
+import os
+import threading
+import time
+import random
+import sqlite3
+import re
+import shutil
+import socket
+import signal
+import gc
+import traceback
+import heapq
+import mmap
+import struct
+import zlib
+import gzip
+from array import array
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 
 color_init(autoreset=True)
 
-class Stats:
-	"""Contains and updates stats for your overall Jeopardy performance
+# bump whenever the extraction logic in Game.extractGame changes, so stale cached boards are re-parsed
+GAME_CACHE_VERSION = 2
+
+# the game cache's default size cap (see --cache-limit) and gzip level: 6 compresses games nearly as well as 9
+# (or lzma) and decompresses in a fraction of the time it takes to parse the JSON
+GAME_CACHE_LIMIT = 512 * 2 ** 20
+GAME_CACHE_COMPRESSION = 6
+
+# the only parts of a game page that get parsed; navigation, contestants, comments etc. are skipped
+GAME_PAGE_IDS = {"game_title", "jeopardy_round", "double_jeopardy_round", "final_jeopardy_round"}
+# id of a clue on the board: clue_{J or DJ}_{category}_{row}
+CLUE_ID = re.compile(r'clue_D?J_([1-6])_([1-5])')
+
+# one row of the attempts table (and formerly one line of cache/events.log) per clue attempt
+EVENT_COLUMNS = ['Time', 'GameId', 'Round', 'Category', 'Value', 'DailyDouble', 'Correct', 'Overridden']
+
+# j-archive's short names for the rounds, as used in clue ids (clue_J_1_1) and the attempts table
+ROUND_CODES = {"jeopardy_round": "J", "double_jeopardy_round": "DJ", "final_jeopardy_round": "FJ"}
+
+# dollar value of each column of the board
+DOLLAR_AMOUNTS = {"jeopardy_round": [200, 400, 600, 800, 1000], "double_jeopardy_round": [400, 800, 1200, 1600, 2000]}
+
+# running totals kept in the totals table
+STATS_TOTALS = ['GamesPlayed', 'CluesAttempted', 'CorrectResponseTotal', 'DailyDoublesAttempted', 'CorrectDailyDoubleTotal',
+	'CorrectFinalJeopardyTotal', 'OverriddenTotal']
+
+# stats shown after a play session
+STATS_SUMMARY_COLUMNS = ['GamesPlayed', 'AvgCorrectResponses', 'AvgCorrectResponsePct', 'CorrectDailyDoublePct', 'CorrectFinalJeopardyPct']
+
+# bump when STORE_SCHEMA changes in a way that needs a migration (see Store.__init__)
+STORE_VERSION = 5
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+
+-- also indexed on show and aired, for -g DATE and --show (see Store.indexShows, which adds them to older databases)
+CREATE TABLE IF NOT EXISTS season_games (
+	season INTEGER NOT NULL,
+	position INTEGER NOT NULL, -- 0 is the season's first game
+	game_id INTEGER NOT NULL,
+	show INTEGER, -- show number, as in "#8961" on the season page
+	aired TEXT, -- YYYY-MM-DD
+	PRIMARY KEY (season, position)
+);
+CREATE INDEX IF NOT EXISTS season_games_game_id ON season_games (game_id);
+
+-- seasons j-archive listed at the last --sync-seasons
+CREATE TABLE IF NOT EXISTS seasons (
+	season INTEGER PRIMARY KEY,
+	games INTEGER NOT NULL,
+	synced INTEGER NOT NULL -- unix time
+);
+
+CREATE TABLE IF NOT EXISTS progress (
+	season INTEGER PRIMARY KEY,
+	played INTEGER NOT NULL DEFAULT 0 -- number of the season's games handed out so far
+);
+
+CREATE TABLE IF NOT EXISTS attempts (
+	id INTEGER PRIMARY KEY,
+	time INTEGER NOT NULL,
+	game_id INTEGER NOT NULL,
+	round TEXT NOT NULL,
+	category TEXT NOT NULL,
+	value INTEGER NOT NULL,
+	daily_double INTEGER NOT NULL,
+	correct INTEGER NOT NULL,
+	overridden INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_game_id ON attempts (game_id);
+CREATE INDEX IF NOT EXISTS attempts_time ON attempts (time);
+
+CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0);
+
+-- every clue of every game that has been extracted, plus a full-text index over it
+CREATE TABLE IF NOT EXISTS clues (
+	id INTEGER PRIMARY KEY,
+	game_id INTEGER NOT NULL,
+	round TEXT NOT NULL, -- ROUND_CODES value
+	row INTEGER NOT NULL, -- category
+	col INTEGER NOT NULL, -- dollar amount
+	value INTEGER NOT NULL, -- 0 for Final Jeopardy
+	daily_double INTEGER NOT NULL,
+	category TEXT NOT NULL,
+	clue TEXT NOT NULL,
+	response TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clues_game_id ON clues (game_id);
+CREATE INDEX IF NOT EXISTS clues_round_value ON clues (round, value);
+CREATE VIRTUAL TABLE IF NOT EXISTS clue_search USING fts5(category, clue, response, content='clues', content_rowid='id');
+CREATE TABLE IF NOT EXISTS indexed_games (game_id INTEGER PRIMARY KEY, title TEXT NOT NULL);
+
+-- spaced-repetition schedule of the clues you've missed (see ReviewQueue)
+CREATE TABLE IF NOT EXISTS reviews (
+	clue_id INTEGER PRIMARY KEY REFERENCES clues (id),
+	due INTEGER NOT NULL, -- unix time
+	interval REAL NOT NULL DEFAULT 0, -- days
+	ease REAL NOT NULL,
+	repetitions INTEGER NOT NULL DEFAULT 0, -- correct reviews in a row
+	lapses INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS reviews_due ON reviews (due);
+
+-- last response to every revalidated request (season pages), for conditional GETs (see Fetcher)
+CREATE TABLE IF NOT EXISTS responses (
+	url TEXT PRIMARY KEY,
+	etag TEXT,
+	last_modified TEXT,
+	fetched INTEGER NOT NULL, -- unix time
+	body BLOB NOT NULL -- zlib-compressed page text
+);
+
+-- every game in the GameCache, for its size cap and least-recently-used eviction without listing the directory
+CREATE TABLE IF NOT EXISTS cached_games (
+	game_id INTEGER PRIMARY KEY,
+	bytes INTEGER NOT NULL, -- size of the compressed file
+	raw_bytes INTEGER NOT NULL, -- size of the JSON in it
+	accessed REAL NOT NULL -- unix time it was last saved or loaded
+);
+CREATE INDEX IF NOT EXISTS cached_games_accessed ON cached_games (accessed);
+
+-- unfinished games, saved after every clue so --resume can pick them back up (see Game.checkpoint)
+CREATE TABLE IF NOT EXISTS checkpoints (
+	id INTEGER PRIMARY KEY,
+	saved INTEGER NOT NULL, -- unix time
+	game_id INTEGER NOT NULL, -- 0 for boards put together from several games
+	season INTEGER, -- season being played through, if any
+	round TEXT NOT NULL, -- ROUND_CODES value
+	board INTEGER NOT NULL, -- bit row * 5 + col is set while that clue is still on the board
+	score INTEGER NOT NULL,
+	position INTEGER NOT NULL, -- currentCtg * 5 + currentAmt
+	auto_mode INTEGER NOT NULL,
+	data BLOB -- zlib-compressed GameData JSON of boards with no game id of their own
+);
+"""
+
+# one checkpoint of an unfinished game, as Game.checkpoint lays it out (the columns of the checkpoints table after
+# id and saved)
+CHECKPOINT_COLUMNS = ['game_id', 'season', 'round', 'board', 'score', 'position', 'auto_mode', 'data']
+
+# packed corpus file (see Corpus): header, then fixed-width game and clue records, then the strings
+CORPUS_MAGIC = b"JCORPUS2"
+# magic, GAME_CACHE_VERSION, games, clues, categories, Jeopardy round categories, then the game table, clue table,
+# category table and strings offsets
+CORPUS_HEADER = struct.Struct('<8sIIIIIIIII')
+CORPUS_GAME = struct.Struct('<IIHI13I3I') # game id, first clue, clue count, title, 6 + 6 + 1 categories, 3 score lists
+CORPUS_CATEGORIES = struct.calcsize('<IIHI') # offset of the categories in a CORPUS_GAME record
+CORPUS_CLUE = struct.Struct('<IBBBBII') # game index, round, row, col, Daily Double number, clue, response
+CORPUS_CATEGORY = struct.Struct('<IBBB') # game index, round, row, bit mask of the columns with a clue
+
+# --stats: category words need STATS_MIN_ATTEMPTS attempts to be ranked, and the STATS_WORDS best and worst are
+# shown; the trend shows the last STATS_TREND_ROWS weeks, with accuracy over a trailing STATS_TREND_WEEKS
+STATS_MIN_ATTEMPTS = 10
+STATS_WORDS = 5
+STATS_TREND_ROWS = 8
+STATS_TREND_WEEKS = 4
+
+# number of results --search shows by default
+SEARCH_LIMIT = 30
+
+# spaced repetition (SM-2): a new or missed clue is due again after REVIEW_FIRST_INTERVAL days, then
+# REVIEW_SECOND_INTERVAL days, then the last interval times the clue's ease factor
+REVIEW_FIRST_INTERVAL = 1
+REVIEW_SECOND_INTERVAL = 6
+REVIEW_EASE = 2.5
+REVIEW_MIN_EASE = 1.3
+
+# answer matching: up to one typo per MATCH_CHARS_PER_EDIT characters of the response, never more than MATCH_MAX_EDITS
+MATCH_CHARS_PER_EDIT = 6
+MATCH_MAX_EDITS = 3
+
+# everything Game.extractRound picks up from a round, in a single walk over its subtree
+ROUND_CLASSES = ["category_name", "clue_value_daily_double", "clue_text", "correct_response", "score_positive", "score_negative"]
+
+# number of upcoming season games loaded in the background while a game is being played
+PREFETCH_DEPTH = 2
+
+J_ARCHIVE_URL = "https://j-archive.com"
+
+# every j-archive request (see Fetcher): retries of connection errors, timeouts, 429s and 5xx responses
+FETCH_RETRIES = 4
+FETCH_BACKOFF = 1.0 # seconds, doubled on every retry
+FETCH_TIMEOUT = 20 # seconds
+
+# season mirroring: concurrent downloads and polite global request rate (requests/second)
+MIRROR_WORKERS = 4
+MIRROR_RATE = 2.0
+
+# --ingest: pages queued per worker process (enough to keep every core busy while results are being saved), and
+# games saved per transaction
+INGEST_QUEUE = 4
+INGEST_BATCH = 100
+
+# --sync-seasons is a short burst of one request per season, so it can use more connections and a faster rate
+SYNC_WORKERS = 8
+SYNC_RATE = 10.0
+
+# game nights (--serve, --join): default port, seconds to buzz in on a clue, to answer or wager, and for the
+# player in control to pick a clue, and how long after the first buzz on a clue later buzzes still count
+SERVER_PORT = 7878
+CLUE_SECONDS = 8
+ANSWER_SECONDS = 15
+CHOOSE_SECONDS = 30
+BUZZ_WINDOW = 0.05
+# longest message line a session may send, and how much unsent output a slow client may pile up before it's dropped
+SESSION_LINE_LIMIT = 2 ** 16
+SESSION_BUFFER_LIMIT = 2 ** 20
+
+# --daemon: the length of the header a client sends first, and how many clients may wait to connect
+DAEMON_HEADER = struct.Struct('!I')
+DAEMON_BACKLOG = 16
+
+# where --profile writes its trace by default
+PROFILE_PATH = "jeopardy-profile.json"
+
+class Profiler:
+	"""Timing spans around the slow parts of loading and playing a game (network, parsing, extraction,
+	cache and Store writes, rendering), turned on with --profile.
+
+	Code marks a span with `with Profiler.span("name"):`. While profiling is off, span() hands back one
+	shared do-nothing context manager, so the spans cost next to nothing. While it's on, every span is
+	recorded with the thread it ran on; at exit the spans are written out as a Chrome trace (open it in
+	chrome://tracing or https://ui.perfetto.dev) and summed up in a table.
 
 	Attributes:
-		- numCorrectResponses: array that holds the number of correct J! and DJ! responses for each game
-		- numCorrectDailyDoubles: array that holds the number of Daily Doubles answered correctly each game
-		- finalJeopardyCorrect: array of bools that reflect whether or not you got the FJ! correct each game
-		- currentGameComplete: used in the self.aggregate() function. If this is false, it will not count the data
-			from the incomplete game.
+		- enabled: whether spans are being recorded
+		- path: where the trace is written
+		- events: Chrome trace "complete" events recorded so far
+		- origin: perf_counter_ns() when profiling started; event timestamps are relative to it
 
 	Methods:
-		- initForNewGame(self)
-		- addCorrectResponse(self, isDailyDouble=False)
-		- addCorrectFinalJeopardy(self)
-		- aggregate(self)
-		- Destructor
-
+		- enable(path=PROFILE_PATH)
+		- span(name, **args)
+		- record(name, args, start, end)
+		- summary()
+		- write()
 	"""
-	numCorrectResponses = []
-	numCorrectDailyDoubles = []
-	finalJeopardyCorrect = []
-	currentGameComplete = False
-
-	# adds new data to the stat arrays
-	def initForNewGame(self):
-		self.numCorrectResponses.append(0)
-		self.numCorrectDailyDoubles.append(0)
-		self.finalJeopardyCorrect.append(False)
-		self.currentGameComplete = False
-	
-	# adds correct response (or correct Daily Double response)
-	def addCorrectResponse(self, isDailyDouble=False):
-		self.numCorrectResponses[-1] += 1
-		if isDailyDouble:
-			self.numCorrectDailyDoubles[-1] += 1
+	enabled = False
+	path = PROFILE_PATH
+	events = []
+	origin = 0
+	noSpan = nullcontext()
+
+	@classmethod
+	def enable(cls, path=PROFILE_PATH):
+		cls.enabled = True
+		cls.path = path
+		cls.origin = time.perf_counter_ns()
+		atexit.register(cls.write)
+
+	@classmethod
+	def span(cls, name, **args):
+		if not cls.enabled:
+			return cls.noSpan
+		return Span(name, args)
+
+	# list.append is atomic, so spans can be recorded from any thread without a lock
+	@classmethod
+	def record(cls, name, args, start, end):
+		cls.events.append({"name": name, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+			"ts": (start - cls.origin) / 1000, "dur": (end - start) / 1000, "args": args})
 
-	# adds correct FJ! response
-	def addCorrectFinalJeopardy(self):
-		self.finalJeopardyCorrect[-1] = True
+	"""
+	summary()
+		returns [(name, count, total ms, max ms)], slowest total first
+	"""
+	@classmethod
+	def summary(cls):
+		spans = {}
+		for event in cls.events:
+			count, total, longest = spans.get(event["name"], (0, 0, 0))
+			spans[event["name"]] = (count + 1, total + event["dur"] / 1000, max(longest, event["dur"] / 1000))
+		return sorted(((name,) + span for name, span in spans.items()), key=lambda span: -span[2])
 
 	"""
-	aggregate(self)
+	write()
 
-	Responsible for creating and updating stats in the store. Creates stats.csv file if it doesn't
-	exist, and uses data within it and within the class' attribute arrays to aggregate overall performance
-	data. Fired upon class' destruction. Does not count stats from incomplete games.
+	Writes the trace to {path} and prints the summary table. Registered to run at exit by enable().
 	"""
-	def aggregate(self):
-		# if game is not complete, don't count the current scores
-		if not self.currentGameComplete:
-			self.numCorrectResponses = self.numCorrectResponses[:-1]
+	@classmethod
+	def write(cls):
+		with open(cls.path, 'w', encoding='utf-8') as trace:
+			json.dump({"traceEvents": cls.events, "displayTimeUnit": "ms"}, trace)
 
-			# if above array is empty, that means only one game was played and incomplete,
-			# therefore we don't bother with any calculation
-			if self.numCorrectResponses == []:
-				return
+		print(f"\n{'span':<24}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}")
+		for name, count, total, longest in cls.summary():
+			print(f"{name:<24}{count:>7}{total:>11.1f}{total / count:>10.2f}{longest:>10.1f}")
+		print(f"Trace written to {cls.path}")
 
-			self.numCorrectDailyDoubles = self.numCorrectDailyDoubles[:-1]
-			self.finalJeopardyCorrect = self.finalJeopardyCorrect[:-1]
 
-		# updating stats in cache
-		statsPath = Path('.', 'cache', 'stats.csv')
-		if statsPath.exists():
-			statsDF = pd.read_csv(statsPath)
-		else:
-			# create stats data frame
-			d = {
-				'GamesPlayed': [0],
-		        'CorrectResponseTotal': [0],
-		        'CorrectDailyDoubleTotal': [0],
-		        'CorrectFinalJeopardyTotal': [0],
-		        'AvgCorrectResponses': [0.0],
-		        'AvgCorrectResponsePct': [0.0],
-		        'CorrectDailyDoublePct': [0.0],
-		        'CorrectFinalJeopardyPct': [0.0]
-		    }
-			statsDF = pd.DataFrame(data=d)
-
-		# game total
-		gamesPlayed = statsDF.at[0, "GamesPlayed"] + len(self.numCorrectResponses)
-		statsDF.at[0, "GamesPlayed"] = gamesPlayed
-
-		# correct responses
-		correctResponseTotal = sum(self.numCorrectResponses)
-		statsDF.at[0, "CorrectResponseTotal"] = statsDF.at[0, "CorrectResponseTotal"] + correctResponseTotal
-		correctResponseAvg = statsDF.at[0, "CorrectResponseTotal"] / gamesPlayed
-		correctResponseAvgPct = correctResponseAvg / 60 # number of clues in standard game
-
-		statsDF.at[0, "AvgCorrectResponses"] = correctResponseAvg
-		statsDF.at[0, "AvgCorrectResponsePct"] = correctResponseAvgPct
-
-		# daily doubles
-		correctDailyDoubleTotal = sum(self.numCorrectDailyDoubles) + statsDF.at[0, "CorrectDailyDoubleTotal"]
-		correctDailyDoublePct = correctDailyDoubleTotal / (3 * gamesPlayed) # three daily doubles per standard game
-		statsDF.at[0, "CorrectDailyDoubleTotal"] = correctDailyDoubleTotal
-		statsDF.at[0, "CorrectDailyDoublePct"] = correctDailyDoublePct
-
-		# final jeopardy
-		correctFinalJeopardyTotal = sum(self.finalJeopardyCorrect) + statsDF.at[0, "CorrectFinalJeopardyTotal"]
-		correctFinalJeopardyPct = correctFinalJeopardyTotal / gamesPlayed # one FJ per standard game
-		statsDF.at[0, "CorrectFinalJeopardyTotal"] = correctFinalJeopardyTotal
-		statsDF.at[0, "CorrectFinalJeopardyPct"] = correctFinalJeopardyPct
-
-		print(statsDF[['GamesPlayed', 'AvgCorrectResponses', 'AvgCorrectResponsePct', 'CorrectDailyDoublePct', 'CorrectFinalJeopardyPct']])
-		statsDF.to_csv(statsPath, index=False)
+class Span:
+	"""One timed span of the Profiler, recorded when its with block exits."""
+	__slots__ = ('name', 'args', 'start')
 
-	# destructor
-	def __del__(self):
-		self.aggregate()
+	def __init__(self, name, args):
+		self.name = name
+		self.args = args
 
+	def __enter__(self):
+		self.start = time.perf_counter_ns()
+		return self
 
-class Game:
-	"""Representation of a Jeopardy! game board.
+	def __exit__(self, *exc):
+		Profiler.record(self.name, self.args, self.start, time.perf_counter_ns())
+		return False
 
-	Attributes:
-		- score: total points one would recieve if this were a real Jeopardy! game.
-		- categories[6]: list of categories for the current round
-		- clues[6][5]: 2D array of {"clue", "response"} dicts, with each row corresponding to a category
-			and each column corresponding to the dollar amount of that clue.
-		- autoMode: bool that determines if player wants to step through the clues automatically, without
-			even looking at the clue board.
-		- dailyDoubleCoords: [row, col] of daily double
-		- title: Show number and date of game
+# --------------------------------------------------------------------------------------------------------------------------------------------------------
 
-		------------- STATE DATA -------------
-		- boardState[6][5]: Stores which questions have been answered or are unavailable (denoted by bool)
-		- cluesRemaining: number of clues unanswered in the round
-		- currentCtg: current category (auto mode)
-		- currentAmt: current $ amount (auto mode)
+class Store:
+	"""SQLite database (cache/jeopardy.db) behind GameLog and Stats: the game ids of each season, how far
+	you've played through each season, every clue attempt and the running stat totals.
 
-		------------- FORMATTING DATA -------------
-		- ctgSpacing: length of longest category name + 1
+	It also holds every clue of every extracted game in a full-text index, for --search, the last copy of
+	every page the Fetcher revalidates, a checkpoint of every unfinished game, for --resume, and the index of
+	the GameCache: every cached game's size and when it was last used, the cache's size cap and its hit counts.
 
-	Methods:
-		- __init__(self, gameId)
-		- printScore(self)
-		- newGame(self, gameId)
-		- initBoard(self, round)
-		- printBoard(self)
-		- stepToNextClue(self)
-		- giveClue(self, ctg, amt)
-		- prompt(self)
-		- autoPrompt(self)
-		- finalJeopardy(self)
-		- printScores(self, round="Jeopardy", selector="jeopardy_round")
-		- play(self)
-	"""
-	autoMode = False
+	The database runs in WAL mode, and everything that reads and then writes happens inside one
+	BEGIN IMMEDIATE transaction, so several terminals can play at once without clobbering each other's
+	progress or stats. The first time it's opened, the old CSV cache files are imported (see migrate()).
 
-	def __init__(self, gameId):
-		self.stats = Stats()
-		self.newGame(gameId)
+	Attributes:
+		- path: location of the database file
+		- db: sqlite3 connection, in autocommit mode; transactions are explicit (see transaction())
 
-		autoplay = input("Would you like to use autoplay? Y/N: ").lower()
-		if autoplay == 'y':
-			self.autoMode = True
+	Methods:
+		- __init__(self, path=None, legacy=True)
+		- local()
+		- transaction(self)
+		- seasonGameIds(self, season)
+		- seasonGames(self, season)
+		- saveSeasonGames(self, season, games)
+		- seasons(self)
+		- saveSeasons(self, seasonGames)
+		- showGameId(self, show)
+		- gamesAired(self, date)
+		- progress(self, season)
+		- setProgress(self, season, played)
+		- claimNextGame(self, season)
+		- recordAttempt(self, event, deltas, clue=None, checkpoint=None)
+		- addReview(self, gameId, clue, now)
+		- dueReviews(self, now, limit)
+		- countDueReviews(self, now)
+		- nextReviewDue(self)
+		- updateReview(self, clueId, due, interval, ease, repetitions)
+		- totals(self)
+		- indexGame(self, gameId, data)
+		- indexGames(self, games)
+		- cachedResponse(self, url)
+		- saveResponse(self, url, etag, lastModified, text)
+		- saveCheckpoint(self, checkpointId, state)
+		- latestCheckpoint(self)
+		- cachedGameIds(self)
+		- isGameCached(self, gameId)
+		- addCachedGames(self, entries)
+		- recordCacheLoad(self, gameId, hit)
+		- cacheLimit(self)
+		- setCacheLimit(self, limit)
+		- evictCachedGames(self, keep=())
+		- cacheStats(self)
+		- searchClues(self, query, round=None, value=None, season=None, limit=SEARCH_LIMIT)
+		- migrate(self)
+		- indexCachedGames(self)
+		- scheduleMissedClues(self)
+		- compressCachedGames(self)
+		- indexShows(self)
+	"""
+	path = Path('.', 'cache', 'jeopardy.db')
+	threadStores = threading.local()
+	insertCheckpointSql = f"INSERT INTO checkpoints (saved, {', '.join(CHECKPOINT_COLUMNS)}) VALUES (?{', ?' * len(CHECKPOINT_COLUMNS)})"
+	updateCheckpointSql = f"UPDATE checkpoints SET saved = ?, {', '.join(f'{column} = ?' for column in CHECKPOINT_COLUMNS)} WHERE id = ?"
+
+	# {legacy}: import the old cache files and index the cached games into a new database
+	def __init__(self, path=None, legacy=True):
+		if path is not None:
+			self.path = Path(path)
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+
+		self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+		self.db.execute("PRAGMA journal_mode=WAL")
+		self.db.execute("PRAGMA synchronous=NORMAL")
+		self.db.executescript(STORE_SCHEMA)
+
+		with self.transaction():
+			row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+			version = int(row[0]) if row else 0
+
+			if version < 1 and legacy:
+				self.migrate()
+			if version < 2 and legacy:
+				self.indexCachedGames()
+			if version < 3:
+				self.scheduleMissedClues()
+			if version < 4 and legacy:
+				self.compressCachedGames()
+			if version < 5:
+				self.indexShows()
+			if version < STORE_VERSION:
+				self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (STORE_VERSION,))
+
+	# a Store for the calling thread, for code that can run on worker threads (a connection can't be shared)
+	@classmethod
+	def local(cls):
+		store = getattr(cls.threadStores, 'store', None)
+		if store is None:
+			store = cls.threadStores.store = cls()
+		return store
+
+	# BEGIN IMMEDIATE takes the write lock up front, so no other session can sneak in between a read and a write
+	@contextmanager
+	def transaction(self):
+		self.db.execute("BEGIN IMMEDIATE")
+		try:
+			yield self.db
+		except BaseException:
+			self.db.execute("ROLLBACK")
+			raise
+		self.db.execute("COMMIT")
+
+	# game ids of {season}, oldest game first (empty if the season hasn't been scraped yet)
+	def seasonGameIds(self, season):
+		rows = self.db.execute("SELECT game_id FROM season_games WHERE season = ? ORDER BY position", (season,))
+		return [gameId for gameId, in rows]
+
+	# (gameId, show number, air date) of every game of {season}, oldest game first, as GameLog.parseSeasonPage reads them
+	def seasonGames(self, season):
+		return self.db.execute("SELECT game_id, show, aired FROM season_games WHERE season = ? ORDER BY position", (season,)).fetchall()
+
+	def saveSeasonGames(self, season, games):
+		with self.transaction():
+			self.replaceSeasonGames(season, games)
+
+	def replaceSeasonGames(self, season, games):
+		self.db.execute("DELETE FROM season_games WHERE season = ?", (season,))
+		self.db.executemany("INSERT INTO season_games (season, position, game_id, show, aired) VALUES (?, ?, ?, ?, ?)",
+			[(season, position, *game) for position, game in enumerate(games)])
+
+	# seasons found by the last --sync-seasons, in order (empty if it has never been run)
+	def seasons(self):
+		return [season for season, in self.db.execute("SELECT season FROM seasons ORDER BY season")]
 
-	def printScore(self):
-		print("Score: ", end='')
-		print(Back.WHITE + Fore.BLACK + f"{self.score}")
+	"""
+	saveSeasons(self, seasonGames)
 
+	Replaces the list of seasons and the games of every one of them with {seasonGames}, {season: (gameId, show
+	number, air date) of each game, oldest game first}, in one transaction. Seasons that are new get their
+	progress started at zero.
 	"""
-	newGame(self, gameId)
+	def saveSeasons(self, seasonGames):
+		now = int(time.time())
+		with self.transaction():
+			self.db.execute("DELETE FROM seasons")
+			self.db.executemany("INSERT INTO seasons (season, games, synced) VALUES (?, ?, ?)",
+				[(season, len(games), now) for season, games in seasonGames.items()])
+			for season, games in seasonGames.items():
+				self.replaceSeasonGames(season, games)
+			self.db.executemany("INSERT OR IGNORE INTO progress (season, played) VALUES (?, 0)", [(season,) for season in seasonGames])
+
+	# game id of show #{show}, or None if it isn't on any season page scraped so far
+	def showGameId(self, show):
+		row = self.db.execute("SELECT game_id FROM season_games WHERE show = ? LIMIT 1", (show,)).fetchone()
+		return row[0] if row else None
+
+	# (gameId, show number) of every game that aired on {date} (YYYY-MM-DD), in show order; a tournament day can have two
+	def gamesAired(self, date):
+		return self.db.execute("SELECT DISTINCT game_id, show FROM season_games WHERE aired = ? ORDER BY show, game_id", (date,)).fetchall()
+
+	# number of games of {season} handed out so far
+	def progress(self, season):
+		row = self.db.execute("SELECT played FROM progress WHERE season = ?", (season,)).fetchone()
+		return row[0] if row else 0
+
+	def setProgress(self, season, played):
+		with self.transaction():
+			self.db.execute("INSERT INTO progress (season, played) VALUES (?, ?) "
+				"ON CONFLICT (season) DO UPDATE SET played = excluded.played", (season, played))
 
-	Retrieves and reads HTML data for game #{gameId}
 	"""
-	def newGame(self, gameId):
-		# reset member vars
-		self.score = 0
-		self.boardState = [ [False] * 5 for _ in range(6)]
-		self.cluesRemaining = 0
-		self.dailyDoubleCoords = [6, 6]
+	claimNextGame(self, season)
+		returns (gameId, number of the season's games handed out so far)
 
-		self.gameId = gameId
+	Atomically hands out the next unplayed game of {season}, so two sessions never get the same game.
+	At the end of the season, progress is reset to zero and gameId is None.
+	"""
+	def claimNextGame(self, season):
+		with self.transaction():
+			played = self.progress(season)
+			row = self.db.execute("SELECT game_id FROM season_games WHERE season = ? AND position = ?", (season, played)).fetchone()
+			played = played + 1 if row else 0
+			self.db.execute("INSERT INTO progress (season, played) VALUES (?, ?) "
+				"ON CONFLICT (season) DO UPDATE SET played = excluded.played", (season, played))
 
-		# loading categories
-		res = requests.get(f"http://www.j-archive.com/showgame.php?game_id={gameId}")
-		res.raise_for_status()
-		self.page = bs4.BeautifulSoup(res.text, features="html.parser")
+		return (row[0] if row else None), played
 
-		# check if game exists
-		error = self.page.select('#content .error')
-		if (error):
-			print("Game does not exist.")
-			sys.exit()
+	"""
+	recordAttempt(self, event, deltas, clue=None, checkpoint=None)
 
-		# initialize board/stats and print game info
-		system('cls||clear')
-		self.title = self.page.select('#game_title > h1')
-		print(f"\n{self.title[0].getText()}\n")
+	Adds one clue attempt ({event}, laid out as EVENT_COLUMNS) and its {deltas} to the totals in a single
+	transaction, so the totals always match the attempts. If the attempt was a miss, the {clue} (its text)
+	is scheduled for review in the same transaction. So is the game's {checkpoint}, (checkpointId, state) as
+	saveCheckpoint takes them, so a resumed game never plays a clue that was already recorded.
+	"""
+	def recordAttempt(self, event, deltas, clue=None, checkpoint=None):
+		with self.transaction():
+			self.db.execute("INSERT INTO attempts (time, game_id, round, category, value, daily_double, correct, overridden) "
+				"VALUES (?, ?, ?, ?, ?, ?, ?, ?)", event)
+			self.addTotals(deltas)
+
+			if clue is not None and not int(event[6]):
+				self.addReview(event[1], clue, event[0])
+			if checkpoint is not None:
+				self.writeCheckpoint(*checkpoint)
+
+	def addTotals(self, deltas):
+		self.db.executemany("INSERT INTO totals (name, value) VALUES (?, ?) "
+			"ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+			[(name, delta) for name, delta in deltas.items() if delta])
+
+	# {STATS_TOTALS: count} over all recorded history
+	def totals(self):
+		totals = {name: 0 for name in STATS_TOTALS}
+		totals.update(self.db.execute("SELECT name, value FROM totals"))
+		return totals
 
-		self.initBoard()
-		self.stats.initForNewGame()
+	"""
+	addReview(self, gameId, clue, now)
 
+	Schedules the {clue} (its text) of game #{gameId}, just missed at unix time {now}, for review a day later.
+	A clue that was already being reviewed starts over, with a lower ease. Clues of games that aren't in the
+	index (e.g. ones played with --simulate) are left out.
 	"""
-	initBoard(self, round)
-		round is in ["jeopardy_round", "double_jeopardy_round"]
+	def addReview(self, gameId, clue, now):
+		row = self.db.execute("SELECT id FROM clues WHERE game_id = ? AND clue = ?", (gameId, clue)).fetchone()
+		if row is None:
+			return
+
+		self.db.execute("INSERT INTO reviews (clue_id, due, interval, ease) VALUES (?, ?, ?, ?) "
+			"ON CONFLICT (clue_id) DO UPDATE SET due = excluded.due, interval = excluded.interval, repetitions = 0, "
+			"lapses = lapses + 1, ease = max(?, ease - 0.2)",
+			(row[0], int(now + REVIEW_FIRST_INTERVAL * 86400), REVIEW_FIRST_INTERVAL, REVIEW_EASE, REVIEW_MIN_EASE))
 
-	Initializes the categories, dollar amounts, and clues for the specified {round}.
 	"""
-	def initBoard(self, round="jeopardy_round"):
-		self.cluesRemaining = 0
-		self.currentCtg = self.currentAmt = 0
+	dueReviews(self, now, limit)
+		returns list of (due, clueId, category, round, value, clue, response, interval, ease, repetitions),
+		soonest due first
 
-		# setting dollar amounts
-		if round == "double_jeopardy_round":
-			self.dollarAmounts = [400, 800, 1200, 1600, 2000]
-		else:
-			round = "jeopardy_round" # default
-			self.dollarAmounts = [200, 400, 600, 800, 1000]
-		
-		# loading categories
-		html_categories = self.page.select(f'#{round} .category_name')
-		self.categories = [c.getText() for c in html_categories]
-		self.ctgSpacing = max([len(c) for c in self.categories]) + 1
-
-		# loading clues
-		self.clues = [[{} for _ in range(5)] for _ in range(6)]
-
-		# populating board with clues
-		html_clues_and_responses = self.page.select(f"#{round} .clue_text")
-
-		html_clues = []
-		html_responses = []
-		for clue in html_clues_and_responses:
-			if (clue['id'][-1] == 'r'):
-				html_responses.append(clue.find(class_="correct_response"))
-			else:
-				html_clues.append(clue)
+	The (at most {limit}) clues due for review at unix time {now}. Only the due slice of the reviews_due
+	index and those clues' rows are read.
+	"""
+	def dueReviews(self, now, limit):
+		return self.db.execute("SELECT r.due, r.clue_id, c.category, c.round, c.value, c.clue, c.response, r.interval, r.ease, r.repetitions "
+			"FROM reviews r JOIN clues c ON c.id = r.clue_id WHERE r.due <= ? ORDER BY r.due LIMIT ?", (int(now), limit)).fetchall()
 
-		html_dd_info = self.page.select(f"#{round} td > div")
-		for clue, correctResponse, info in zip(html_clues, html_responses, html_dd_info):
-			# clue gathering
-			row = int(clue["id"][-3]) - 1 # category
-			col = int(clue["id"][-1]) - 1 # dollar amount
+	def countDueReviews(self, now):
+		return self.db.execute("SELECT count(*) FROM reviews WHERE due <= ?", (int(now),)).fetchone()[0]
 
-			self.boardState[row][col] = True
-			self.cluesRemaining += 1
+	# unix time of the next review, or None if there's nothing to review
+	def nextReviewDue(self):
+		return self.db.execute("SELECT min(due) FROM reviews").fetchone()[0]
 
-			# is this the Daily Double?
-			if info.find(class_="clue_value_daily_double"):
-				self.dailyDoubleCoords = [row, col]
+	def updateReview(self, clueId, due, interval, ease, repetitions):
+		with self.transaction():
+			self.db.execute("UPDATE reviews SET due = ?, interval = ?, ease = ?, repetitions = ?, "
+				"lapses = lapses + (? = 0) WHERE clue_id = ?", (int(due), interval, ease, repetitions, repetitions, clueId))
 
-			self.clues[row][col] = {
-				"clue": clue.getText(),
-				"response": correctResponse.getText()
-			}
+	"""
+	indexGame(self, gameId, data)
 
+	Adds every clue of game #{gameId} ({data} is its GameData) to the clues table and the search index.
+	Games that are already indexed are left alone.
 	"""
-	printBoard(self)
+	def indexGame(self, gameId, data):
+		with Profiler.span("index game", gameId=gameId), self.transaction():
+			self.addGameToIndex(gameId, data)
+
+	# indexGame for a batch of (gameId, data), in one transaction
+	def indexGames(self, games):
+		with Profiler.span("index games", count=len(games)), self.transaction():
+			for gameId, data in games:
+				self.addGameToIndex(gameId, data)
+
+	def addGameToIndex(self, gameId, data):
+		if self.db.execute("SELECT 1 FROM indexed_games WHERE game_id = ?", (gameId,)).fetchone():
+			return
+
+		clues = []
+		for round in ("jeopardy_round", "double_jeopardy_round"):
+			roundData = data.round(round)
+			if roundData is None:
+				continue
+			for row, category in enumerate(roundData.categories):
+				for col, clue in enumerate(roundData.clues[row]):
+					if clue is not None:
+						clues.append((gameId, ROUND_CODES[round], row, col, DOLLAR_AMOUNTS[round][col],
+							int((row, col) in roundData.dailyDoubles), category, clue[0], clue[1]))
+		if data.final is not None:
+			clues.append((gameId, "FJ", 0, 0, 0, 0, data.final.category, data.final.clue, data.final.response))
+
+		self.db.executemany("INSERT INTO clues (game_id, round, row, col, value, daily_double, category, clue, response) "
+			"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", clues)
+		self.db.execute("INSERT INTO clue_search (rowid, category, clue, response) "
+			"SELECT id, category, clue, response FROM clues WHERE game_id = ?", (gameId,))
+		self.db.execute("INSERT INTO indexed_games (game_id, title) VALUES (?, ?)", (gameId, data.title))
+
+	# (etag, lastModified, page text) of the stored response to {url}, or None
+	def cachedResponse(self, url):
+		row = self.db.execute("SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)).fetchone()
+		return (row[0], row[1], zlib.decompress(row[2]).decode('utf-8')) if row else None
+
+	def saveResponse(self, url, etag, lastModified, text):
+		with self.transaction():
+			self.db.execute("INSERT OR REPLACE INTO responses (url, etag, last_modified, fetched, body) VALUES (?, ?, ?, ?, ?)",
+				(url, etag, lastModified, int(time.time()), zlib.compress(text.encode('utf-8'))))
 
-	Prints the categories and current clues available for the round.
 	"""
-	def printBoard(self):
-		# column headers
-		print("{:>{width}}[1]    [2]    [3]    [4]    [5]".format(" ", width=(self.ctgSpacing + 7)))
+	saveCheckpoint(self, checkpointId, state)
+		returns the checkpoint's id
 
-		rowNum = 0
-		for category in self.categories:
-			print("[{}] {:>{width}}   ".format(rowNum + 1, category, width=self.ctgSpacing), end='')
+	Saves the {state} of an unfinished game (laid out as CHECKPOINT_COLUMNS) over checkpoint #{checkpointId}, or
+	as a new checkpoint if {checkpointId} is None. A {state} of None deletes the checkpoint: the game is over.
+	"""
+	def saveCheckpoint(self, checkpointId, state):
+		with self.transaction():
+			return self.writeCheckpoint(checkpointId, state)
 
-			# print $ amounts
-			for i in range(5):
-				if self.boardState[rowNum][i]:
-					print("${:<6}".format(self.dollarAmounts[i]), end='')
-				else:
-					print("---    ", end='')
+	def writeCheckpoint(self, checkpointId, state):
+		if state is None:
+			self.db.execute("DELETE FROM checkpoints WHERE id = ?", (checkpointId,))
+			return None
 
-			print()
-			rowNum += 1
+		if checkpointId is None:
+			return self.db.execute(self.insertCheckpointSql, (int(time.time()), *state)).lastrowid
 
-		print()
-		self.printScore()
+		self.db.execute(self.updateCheckpointSql, (int(time.time()), *state, checkpointId))
+		return checkpointId
 
-	"""
-	stepToNextClue(self)
+	# (checkpointId, state laid out as CHECKPOINT_COLUMNS) of the most recently saved unfinished game, or None
+	def latestCheckpoint(self):
+		row = self.db.execute(f"SELECT id, {', '.join(CHECKPOINT_COLUMNS)} FROM checkpoints ORDER BY saved DESC, id DESC LIMIT 1").fetchone()
+		return (row[0], row[1:]) if row else None
 
-	Advances to the next clue in the category. If none are left, advances
-	to the next category.
-	"""
-	def stepToNextClue(self):
-		if (self.cluesRemaining <= 0):
-			return
+	# ids of every game in the GameCache, in order
+	def cachedGameIds(self):
+		return [gameId for gameId, in self.db.execute("SELECT game_id FROM cached_games ORDER BY game_id")]
 
-		while (not self.boardState[self.currentCtg][self.currentAmt]):
-			if self.currentAmt == 4: # end of the category
-				self.currentAmt = 0
-				self.currentCtg += 1
-			else:
-				self.currentAmt += 1
+	def isGameCached(self, gameId):
+		return self.db.execute("SELECT 1 FROM cached_games WHERE game_id = ?", (gameId,)).fetchone() is not None
 
+	"""
+	addCachedGames(self, entries)
+		returns ids of the games evicted to make room
 
+	Adds the games just written to the GameCache, {entries} of (gameId, size of the file, size before
+	compression), to the index as the most recently used games, and evicts the least recently used other
+	games if that puts the cache over its cap (see evictCachedGames). The caller deletes the evicted games' files.
 	"""
-	giveClue(self, ctg, amt)
+	def addCachedGames(self, entries):
+		now = time.time()
+		with self.transaction():
+			self.db.executemany("INSERT OR REPLACE INTO cached_games (game_id, bytes, raw_bytes, accessed) VALUES (?, ?, ?, ?)",
+				[(gameId, size, rawSize, now) for gameId, size, rawSize in entries])
+			return self.evictCachedGames(keep={gameId for gameId, _, _ in entries})
+
+	# a GameCache load of game #{gameId}: a {hit} makes it the most recently used game; hits and misses are counted
+	def recordCacheLoad(self, gameId, hit):
+		with self.transaction():
+			if hit:
+				self.db.execute("UPDATE cached_games SET accessed = ? WHERE game_id = ?", (time.time(), gameId))
+			self.db.execute("INSERT INTO meta (key, value) VALUES (?, 1) ON CONFLICT (key) DO UPDATE SET value = value + 1",
+				("game_cache_hits" if hit else "game_cache_misses",))
+
+	# size cap of the GameCache in bytes, GAME_CACHE_LIMIT unless --cache-limit has set another
+	def cacheLimit(self):
+		row = self.db.execute("SELECT value FROM meta WHERE key = 'game_cache_limit'").fetchone()
+		return int(row[0]) if row else GAME_CACHE_LIMIT
+
+	# returns ids of the games evicted to fit under the new {limit}; the caller deletes their files
+	def setCacheLimit(self, limit):
+		with self.transaction():
+			self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('game_cache_limit', ?)", (int(limit),))
+			return self.evictCachedGames()
 
-	Displays the clue in {ctg} for {amt}. Lets user input an answer, interprets it, and updates
-	their score.
 	"""
-	def giveClue(self, ctg, amt):
-		points = self.dollarAmounts[amt]
-		isDailyDouble = False
+	evictCachedGames(self, keep=())
+		returns ids of the evicted games
 
-		# displaying clue
-		print()
-		print(f'[{ctg + 1}] {self.categories[ctg]} for ', end='')
-		print(Back.GREEN + Fore.BLACK + f'${self.dollarAmounts[amt]}', end='')
-		print(":")
+	Drops the least recently used games from the index until the cache fits under cacheLimit(), but never
+	the games in {keep}, nor unfinished games, which --resume loads from the cache (only boards with no game id
+	keep their data in their checkpoint). Runs inside the caller's transaction; the caller deletes the evicted
+	games' files.
+	"""
+	def evictCachedGames(self, keep=()):
+		excess = self.db.execute("SELECT coalesce(sum(bytes), 0) FROM cached_games").fetchone()[0] - self.cacheLimit()
+		evicted = []
+		if excess <= 0:
+			return evicted
+
+		for gameId, size in self.db.execute("SELECT game_id, bytes FROM cached_games "
+				"WHERE game_id NOT IN (SELECT game_id FROM checkpoints) ORDER BY accessed, game_id"):
+			if excess <= 0:
+				break
+			if gameId not in keep:
+				evicted.append(gameId)
+				excess -= size
+
+		self.db.executemany("DELETE FROM cached_games WHERE game_id = ?", [(gameId,) for gameId in evicted])
+		return evicted
 
-		# Daily Double logic
-		if [ctg, amt] == self.dailyDoubleCoords:
-			isDailyDouble = True
-			self.printScore()
-			print(Back.LIGHTMAGENTA_EX + "\nDaily Double! Enter wager:", end='')
-			points = int(input(" "))
-			
-			# getting valid point value
-			validPointMax = 1000 if self.score < 1000 else self.score
-			while (points > validPointMax):
-				points = int(input(f"Please enter a value up to ${validPointMax}: "))
+	"""
+	cacheStats(self)
+		returns {"games", "bytes", "rawBytes", "oldest", "limit", "hits", "misses", "pages", "pageBytes"}
 
-			print()
+	What --cache-stats reports: the number of cached games, their size on disk and before compression, when
+	the least recently used one was last used (unix time, None for an empty cache), the size cap, the GameCache's
+	hits and misses over all sessions, and the number and compressed size of the pages kept for revalidation.
+	"""
+	def cacheStats(self):
+		games, size, rawSize, oldest = self.db.execute("SELECT count(*), coalesce(sum(bytes), 0), coalesce(sum(raw_bytes), 0), "
+			"min(accessed) FROM cached_games").fetchone()
+		counts = dict(self.db.execute("SELECT key, value FROM meta WHERE key IN ('game_cache_hits', 'game_cache_misses')"))
+		pages, pageBytes = self.db.execute("SELECT count(*), coalesce(sum(length(body)), 0) FROM responses").fetchone()
+
+		return {
+			"games": games, "bytes": size, "rawBytes": rawSize, "oldest": oldest, "limit": self.cacheLimit(),
+			"hits": int(counts.get("game_cache_hits", 0)), "misses": int(counts.get("game_cache_misses", 0)),
+			"pages": pages, "pageBytes": pageBytes
+		}
 
-		# print clue
-		print(Fore.YELLOW + self.clues[ctg][amt]["clue"])
-		print()
+	"""
+	searchClues(self, query, round=None, value=None, season=None, limit=SEARCH_LIMIT)
+		returns list of (gameId, round, value, category, clue, response), best match first
 
-		# if in auto mode, show score
-		if (self.autoMode):
-			self.printScore()
+	Full-text search over categories, clues and responses. Every word of {query} has to match. Results can be
+	narrowed down to a round (ROUND_CODES value), a dollar value and a season.
+	"""
+	def searchClues(self, query, round=None, value=None, season=None, limit=SEARCH_LIMIT):
+		# quote every word, so punctuation in the query can't be taken for FTS5 syntax
+		match = " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+		if not match:
+			return []
+
+		sql = ("SELECT c.game_id, c.round, c.value, c.category, c.clue, c.response "
+			"FROM clue_search JOIN clues c ON c.id = clue_search.rowid")
+		conditions = ["clue_search MATCH ?"]
+		params = [match]
+
+		if season is not None:
+			sql += " JOIN season_games s ON s.game_id = c.game_id"
+			conditions.append("s.season = ?")
+			params.append(season)
+		if round is not None:
+			conditions.append("c.round = ?")
+			params.append(round)
+		if value is not None:
+			conditions.append("c.value = ?")
+			params.append(value)
+
+		sql += " WHERE " + " AND ".join(conditions) + " ORDER BY clue_search.rank LIMIT ?"
+		params.append(limit)
+		return self.db.execute(sql, params).fetchall()
 
-		correctResponseOriginal = self.clues[ctg][amt]['response']
-		correctResponse = self.standardizeResponse(correctResponseOriginal)
+	"""
+	migrate(self)
+
+	One-time import of the CSV-era cache, run inside the transaction that creates the database:
+		- cache/{season}.csv: game ids of each season
+		- cache/gamelog.csv: played-game count of each season, one line per season
+		- cache/events.log: every recorded clue attempt
+		- cache/stats_snapshot.json, or else cache/stats.csv: the totals from before the events log
+	The old files are left where they are, but aren't read or written anymore.
+	"""
+	def migrate(self):
+		cacheDir = self.path.parent
+
+		for seasonPath in cacheDir.glob('*.csv'):
+			if seasonPath.stem.isdigit():
+				with open(seasonPath, newline='') as cache:
+					gameIds = [int(id) for id in next(csv.reader(cache), [])]
+				self.db.executemany("INSERT OR IGNORE INTO season_games (season, position, game_id) VALUES (?, ?, ?)",
+					[(int(seasonPath.stem), position, gameId) for position, gameId in enumerate(gameIds)])
+
+		try:
+			with open(cacheDir / 'gamelog.csv') as gameLog:
+				played = [int(line) for line in gameLog if line.strip()]
+		except OSError:
+			played = []
+		self.db.executemany("INSERT OR IGNORE INTO progress (season, played) VALUES (?, ?)",
+			[(season + 1, count) for season, count in enumerate(played) if count])
+
+		# totals: snapshot (or legacy stats.csv) plus whatever the events log has past the snapshot's offset
+		try:
+			with open(cacheDir / 'stats_snapshot.json', encoding='utf-8') as snapshotFile:
+				snapshot = json.load(snapshotFile)
+			totals = {name: snapshot["totals"].get(name, 0) for name in STATS_TOTALS}
+			offset = snapshot["offset"]
+		except (OSError, ValueError, KeyError):
+			totals = self.legacyTotals(cacheDir / 'stats.csv')
+			offset = 0
+
+		try:
+			with open(cacheDir / 'events.log', 'rb') as log:
+				events = log.read()
+		except OSError:
+			events = b''
+
+		position = 0
+		for line in events.splitlines(keepends=True):
+			event = next(csv.reader([line.decode('utf-8')]), [])
+			if len(event) == len(EVENT_COLUMNS) and event[0] != EVENT_COLUMNS[0]:
+				self.db.execute("INSERT INTO attempts (time, game_id, round, category, value, daily_double, correct, overridden) "
+					"VALUES (?, ?, ?, ?, ?, ?, ?, ?)", event)
+				if position >= offset:
+					Stats.add(totals, event)
+			position += len(line)
+
+		self.addTotals(totals)
+
+	# one-time indexing of the games that were cached before the search index existed (as plain JSON files)
+	def indexCachedGames(self):
+		for gamePath in GameCache.cacheDir.glob('*.json'):
+			if gamePath.stem.isdigit():
+				try:
+					data = GameCache.read(gamePath)
+				except GameCache.readErrors:
+					continue
+				self.addGameToIndex(int(gamePath.stem), data)
+
+	# one-time review scheduling of the clues missed before reviews existed, due a day after the last miss.
+	# attempts only say which game, round, category and value a clue was, which is enough to find it
+	def scheduleMissedClues(self):
+		self.db.execute("INSERT OR IGNORE INTO reviews (clue_id, due, interval, ease) "
+			"SELECT c.id, max(a.time) + ?, ?, ? FROM attempts a JOIN clues c ON c.game_id = a.game_id AND c.round = a.round "
+			"AND c.category = a.category AND c.value = a.value WHERE a.correct = 0 GROUP BY c.id",
+			(REVIEW_FIRST_INTERVAL * 86400, REVIEW_FIRST_INTERVAL, REVIEW_EASE))
 
-		# answer prompt
-		answer = input("Type answer here or press enter to pass: ").lower()
-		print()
-		answer = self.standardizeResponse(answer) if answer != '' else answer
+	"""
+	compressCachedGames(self)
 
-		# interpreting response and updating score
-		wrongAnswer = False
-		passed = False
+	One-time move of the plain JSON game cache (cache/games/{gameId}.json) to compressed files in the cache
+	index. Each game starts out as last used when its file was last written. Unreadable files are left alone.
+	"""
+	def compressCachedGames(self):
+		for gamePath in GameCache.cacheDir.glob('*.json'):
+			if not gamePath.stem.isdigit():
+				continue
+			try:
+				data = GameCache.read(gamePath)
+			except GameCache.readErrors:
+				continue
+
+			size, rawSize = GameCache.write(int(gamePath.stem), data)
+			self.db.execute("INSERT OR REPLACE INTO cached_games (game_id, bytes, raw_bytes, accessed) VALUES (?, ?, ?, ?)",
+				(int(gamePath.stem), size, rawSize, gamePath.stat().st_mtime))
+			gamePath.unlink()
 
-		# Pass
-		if answer == '':
-			print(f"Correct response: ", end='')
-			print(Fore.YELLOW + f"{correctResponseOriginal}")
-			passed = True
+	"""
+	indexShows(self)
 
-			if isDailyDouble:
-				self.score -= points
-				wrongAnswer = True
-		# Correct
-		elif answer == correctResponse:
-			print(Back.GREEN + Fore.BLACK + "Correct!")
-			self.score += points
-			
-			self.stats.addCorrectResponse(isDailyDouble)
-		# Incorrect
-		else:
-			wrongAnswer = True
-			print(f"Correct response: ", end='')
-			print(Fore.RED + f"{correctResponseOriginal}")
-			self.score -= points
+	One-time addition of the show number and air date columns to the season games of an older database, and of
+	their indexes. They're filled in from the season pages kept for revalidation; seasons scraped before those
+	were kept get theirs the next time their page is read (--sync-seasons or --mirror-season).
+	"""
+	def indexShows(self):
+		columns = {column for _, column, *_ in self.db.execute("PRAGMA table_info(season_games)")}
+		if "show" not in columns:
+			self.db.execute("ALTER TABLE season_games ADD COLUMN show INTEGER")
+			self.db.execute("ALTER TABLE season_games ADD COLUMN aired TEXT")
+		self.db.execute("CREATE INDEX IF NOT EXISTS season_games_show ON season_games (show)")
+		self.db.execute("CREATE INDEX IF NOT EXISTS season_games_aired ON season_games (aired)")
+
+		for url, body in self.db.execute("SELECT url, body FROM responses WHERE url LIKE '%showseason.php?season=%'").fetchall():
+			games = GameLog.parseSeasonPage(zlib.decompress(body).decode('utf-8'))
+			self.db.executemany("UPDATE season_games SET show = ?, aired = ? WHERE game_id = ?",
+				[(show, aired, gameId) for gameId, show, aired in games])
 
-		# logging board state
-		self.boardState[ctg][amt] = False
-		self.cluesRemaining -= 1
-		print(f"Score: {self.score}\n")
+	"""
+	legacyTotals(path)
+		returns totals
 
-		# did we make a judgement error?
-		if wrongAnswer or passed:
-			answer = input("Press enter to continue, or another key and then enter if you actually got it right. ")
-			if answer != '':
-				if wrongAnswer:
-					self.score += 2 * points
-				else:
-					self.score += points
+	Totals from the old single-row stats.csv, which only kept correct-answer counts. Attempts are estimated
+	the way it used to compute its percentages: 60 clues, 3 Daily Doubles and one Final Jeopardy per game.
+	"""
+	@staticmethod
+	def legacyTotals(path):
+		totals = {name: 0 for name in STATS_TOTALS}
+		try:
+			with open(path, newline='') as statsFile:
+				row = next(csv.DictReader(statsFile))
+		except (OSError, StopIteration):
+			return totals
+
+		gamesPlayed = int(row["GamesPlayed"])
+		totals["GamesPlayed"] = gamesPlayed
+		totals["CluesAttempted"] = 60 * gamesPlayed
+		totals["CorrectResponseTotal"] = int(row["CorrectResponseTotal"])
+		totals["DailyDoublesAttempted"] = 3 * gamesPlayed
+		totals["CorrectDailyDoubleTotal"] = int(row["CorrectDailyDoubleTotal"])
+		totals["CorrectFinalJeopardyTotal"] = int(row["CorrectFinalJeopardyTotal"])
+		return totals
+
+
+class GameCache:
+	"""Persistent cache of extracted game boards, so a game only has to be fetched and parsed once.
+
+	Each game is stored as gzipped compact JSON in cache/games/{gameId}.json.gz holding everything
+	Game needs to play it (categories, clues, responses, Daily Doubles, Final Jeopardy, scores).
+	Entries written by an older GAME_CACHE_VERSION are treated as misses and overwritten.
+
+	The Store keeps an index of the cached games (size, and when each was last saved or loaded), so the cache
+	is capped in size (GAME_CACHE_LIMIT, or --cache-limit) by evicting the least recently used games without
+	ever listing the directory, and it counts hits and misses across sessions for --cache-stats.
 
-				self.stats.addCorrectResponse(isDailyDouble)
-			
-			return
-		
-		input("Press enter to continue.")
+	Attributes:
+		- cacheDir: directory holding the cached games
+		- hits: number of games served from the cache this session
+		- misses: number of games that had to be fetched from j-archive this session
+		- readErrors: exceptions read() raises for missing, unreadable and out-of-date entries
 
+	Methods:
+		- path(gameId)
+		- read(path)
+		- write(gameId, data)
+		- load(gameId)
+		- save(gameId, data)
+		- saveMany(games)
+		- contains(gameId)
+		- gameIds()
+		- setLimit(limit)
 	"""
-	prompt(self)
+	cacheDir = Path('.', 'cache', 'games')
+	hits = 0
+	misses = 0
+	counterLock = threading.Lock() # games can be loaded from the prefetch thread
+	readErrors = (OSError, EOFError, zlib.error, ValueError, KeyError, TypeError)
+
+	@classmethod
+	def path(cls, gameId):
+		return cls.cacheDir / f"{gameId}.json.gz"
+
+	# GameData in the cache file at {path}, or in a plain JSON file from before the cache was compressed
+	@staticmethod
+	def read(path):
+		raw = path.read_bytes()
+		return GameData.fromDict(json.loads(gzip.decompress(raw) if path.suffix == '.gz' else raw))
 
-	Contains most of the gameplpay logic. Prints the board, lets the user pick a clue, displays the clue, 
-	and lets them answer. Also interprets the answer and updates the score accordingly.
 	"""
-	def prompt(self):
-		self.printBoard()
-		print()
-		clueInput = input("Enter a clue coordinate (e.g., 14) or press enter to automatically move on to the next clue: ")
+	write(gameId, data)
+		returns (size of the file, size of the JSON in it)
 
-		ctg = amt = 0
-		if clueInput == '': # auto-continue
-			self.stepToNextClue()
+	Writes game #{gameId} to its cache file. The file is written to a temp file and then renamed into place,
+	so a crash or a second terminal never sees a half-written entry.
+	"""
+	@classmethod
+	def write(cls, gameId, data):
+		cls.cacheDir.mkdir(parents=True, exist_ok=True)
+		raw = json.dumps(data.toDict(), separators=(',', ':')).encode('utf-8')
+		packed = gzip.compress(raw, GAME_CACHE_COMPRESSION, mtime=0)
+
+		path = cls.path(gameId)
+		tmpPath = path.with_name(f"{gameId}.{os.getpid()}.{threading.get_ident()}.tmp")
+		with open(tmpPath, 'wb') as cached:
+			cached.write(packed)
+		os.replace(tmpPath, path)
+		return len(packed), len(raw)
 
-			ctg = self.currentCtg
-			amt = self.currentAmt
-		else: # coordinates input
-			while True:
-				coords = int(clueInput)
-				ctg = (coords // 10) - 1
-				amt = (coords % 10) - 1
+	"""
+	load(gameId)
+		returns GameData, or None on a miss
 
-				if (ctg < 0) or (ctg > 5) or (amt < 0) or (amt > 4):
-					clueInput = input("Invalid coordinates, try again: ")
-				elif not self.boardState[ctg][amt]:
-					clueInput = input("Clue unavailable, try again: ")
-				else: # valid clue
-					break
+	Reads game #{gameId} from the cache. Missing, unreadable and out-of-date entries count as misses.
+	"""
+	@classmethod
+	def load(cls, gameId):
+		try:
+			with Profiler.span("cache load", gameId=gameId):
+				data = cls.read(cls.path(gameId))
+		except cls.readErrors:
+			data = None
+
+		with cls.counterLock:
+			if data is None:
+				cls.misses += 1
+			else:
+				cls.hits += 1
 
-		system('cls||clear')
-		self.giveClue(ctg, amt)
+		Store.local().recordCacheLoad(gameId, data is not None)
+		return data
 
-	def autoPrompt(self):
-		self.stepToNextClue()
-		self.giveClue(self.currentCtg, self.currentAmt)
+	"""
+	save(gameId, data)
 
+	Writes game #{gameId} to the cache and adds its clues to the search index. If that puts the cache over
+	its size cap, the games that were used longest ago are deleted.
 	"""
-	finalJeopardy(self)
+	@classmethod
+	def save(cls, gameId, data):
+		with Profiler.span("cache write", gameId=gameId):
+			size, rawSize = cls.write(gameId, data)
+
+		store = Store.local()
+		store.indexGame(gameId, data)
+		for evicted in store.addCachedGames([(gameId, size, rawSize)]):
+			cls.path(evicted).unlink(missing_ok=True)
+
+	# save() for a batch of (gameId, data): both indexes are updated in one transaction each for the whole batch
+	@classmethod
+	def saveMany(cls, games):
+		with Profiler.span("cache write", count=len(games)):
+			entries = [(gameId, *cls.write(gameId, data)) for gameId, data in games]
+
+		store = Store.local()
+		store.indexGames(games)
+		for evicted in store.addCachedGames(entries):
+			cls.path(evicted).unlink(missing_ok=True)
+
+	# whether game #{gameId} is cached, going by the index (the game isn't read, and this doesn't count as a use)
+	@staticmethod
+	def contains(gameId):
+		return Store.local().isGameCached(gameId)
+
+	# ids of every cached game, in order
+	@staticmethod
+	def gameIds():
+		return Store.local().cachedGameIds()
 
-	Plays through the Final Jeopardy round
 	"""
-	def finalJeopardy(self):
-		# displaying category
-		category = self.page.select('.final_round .category_name')
-		print(f"Category: {category[0].getText()}")
-		self.printScore()
+	setLimit(limit)
+		returns number of games evicted
 
-		wager = 0
-		wagerAnswer = input("\nEnter your wager: ")
-		if wagerAnswer != "":
-			wager = int(wagerAnswer)
+	Caps the cache at {limit} bytes from now on, and evicts the least recently used games right away if it's
+	over the new cap.
+	"""
+	@classmethod
+	def setLimit(cls, limit):
+		evicted = Store.local().setCacheLimit(limit)
+		for gameId in evicted:
+			cls.path(gameId).unlink(missing_ok=True)
+		return len(evicted)
+
+
+class Corpus:
+	"""Every cached game packed into one file (cache/corpus.bin) that is read through mmap, so any game or
+	clue can be looked up without loading, parsing or even reading the rest. Built with --build-corpus.
+
+	Layout, all integers little-endian:
+		- header (CORPUS_HEADER): magic, GAME_CACHE_VERSION, number of games, clues and categories, offsets of the tables
+		- game table (CORPUS_GAME per game, sorted by game id): id, first clue and number of clues, and the
+			strings of its title, 13 categories (6 J, 6 DJ, Final) and 3 score lists
+		- clue table (CORPUS_CLUE per clue, grouped by game): index of its game, round (0 J, 1 DJ, 2 FJ), row,
+			column, Daily Double number (0 if it isn't one) and the strings of its clue and response
+		- category table (CORPUS_CATEGORY per Jeopardy and Double Jeopardy category with any clues, all the
+			Jeopardy round ones first): index of its game, round, row and which of its 5 clues there are
+		- strings: each one a 4-byte length and UTF-8 text, stored once however often it's used
+	Fixed-width tables mean game #i, clue #i and category #i are a single struct unpack at a computed offset, and
+	finding a game by id is a binary search over the game table.
 
-		# getting clue
-		finalClue = self.page.select('#clue_FJ')[0].getText()
-		print(Fore.YELLOW + f"\n{finalClue}")
+	Attributes:
+		- path: location of the corpus file
+		- map: the file's mmap
+		- games, clues, categories: number of games, clues and categories in the corpus
+		- jeopardyCategories: number of categories from Jeopardy rounds, which come first in the category table
+		- gameTable, clueTable, categoryTable, strings: offsets of the tables and the strings
 
-		# getting correct response
-		correct_response = self.page.select("#clue_FJ_r .correct_response")[0].getText()
+	Methods:
+		- __init__(self, path=None)
+		- shared()
+		- build(games, path=None)
+		- string(self, offset)
+		- gameId(self, index)
+		- findGame(self, gameId)
+		- game(self, gameId)
+		- clue(self, index)
+		- category(self, index)
+		- close(self)
+	"""
+	path = Path('.', 'cache', 'corpus.bin')
+	sharedCorpus = None
+	sharedLock = threading.Lock()
 
-		# answer prompt
-		answer = input("\nType answer here: ").lower()
-		print()
+	"""
+	__init__(self, path=None)
 
-		# Correct
-		if answer == correct_response.lower():
-			print(Back.GREEN + Fore.BLACK + "Correct!")
-			self.score += wager
-			self.stats.addCorrectFinalJeopardy()
-		# Incorrect
-		else:
-			print(f"Correct response: ", end='')
-			print(Fore.RED + f"{correct_response}")
-			self.score -= wager
+	Opens the corpus at {path}. Raises OSError if it can't be read and ValueError if it isn't a corpus
+	or was packed by another GAME_CACHE_VERSION.
+	"""
+	def __init__(self, path=None):
+		if path is not None:
+			self.path = Path(path)
+
+		with open(self.path, 'rb') as corpusFile:
+			self.map = mmap.mmap(corpusFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+		if len(self.map) < CORPUS_HEADER.size:
+			raise ValueError(f"{self.path} is not a corpus")
+		(magic, version, self.games, self.clues, self.categories, self.jeopardyCategories,
+			self.gameTable, self.clueTable, self.categoryTable, self.strings) = CORPUS_HEADER.unpack_from(self.map)
+		if magic != CORPUS_MAGIC or version != GAME_CACHE_VERSION:
+			raise ValueError(f"{self.path} is not a version {GAME_CACHE_VERSION} corpus")
+
+	# the corpus at Corpus.path, opened once and shared by every thread, or None if there isn't a usable one
+	@classmethod
+	def shared(cls):
+		with cls.sharedLock:
+			if cls.sharedCorpus is None:
+				try:
+					cls.sharedCorpus = cls()
+				except (OSError, ValueError):
+					cls.sharedCorpus = False
+			return cls.sharedCorpus or None
 
-			answer = input("Press enter to continue, or another key if you actually got it right. ")
-			if answer != '':
-				self.score += 2 * wager
-				self.stats.addCorrectFinalJeopardy()
+	"""
+	build(games, path=None)
+		returns (number of games, number of clues)
 
+	Packs {games}, an iterable of (gameId, GameData) in increasing gameId order, into a corpus file. Games are
+	streamed, so only the packed bytes are held in memory. The file is written to a temp file and renamed
+	into place. Games missing their Double Jeopardy round or Final Jeopardy are left out.
 	"""
-	printScores(self, round="Jeopardy", selector="jeopardy_round")
+	@classmethod
+	def build(cls, games, path=None):
+		path = Path(path) if path is not None else cls.path
+		strings = {}
+		heap = bytearray()
+		gameTable = bytearray()
+		clueTable = bytearray()
+		categoryTables = (bytearray(), bytearray())
+		clueCount = 0
+		lastId = None
+
+		def intern(text):
+			offset = strings.get(text)
+			if offset is None:
+				encoded = text.encode('utf-8')
+				offset = strings[text] = len(heap)
+				heap.extend(struct.pack('<I', len(encoded)))
+				heap.extend(encoded)
+			return offset
+
+		for gameId, data in games:
+			if lastId is not None and gameId <= lastId:
+				raise ValueError(f"games must be in increasing id order, got {gameId} after {lastId}")
+			lastId = gameId
+
+			# the tables have room for whole games only; the rest are still played from the GameCache
+			if data.doubleJeopardyRound is None or data.final is None:
+				continue
+			index = len(gameTable) // CORPUS_GAME.size
+			rounds = (data.jeopardyRound, data.doubleJeopardyRound)
+			categories = [intern(round.categories[row] if row < len(round.categories) else "") for round in rounds for row in range(6)]
+			categories.append(intern(data.final.category))
+			scores = [intern("\n".join(scores)) for scores in (rounds[0].scores, rounds[1].scores, data.final.scores)]
+
+			first = clueCount
+			for roundIndex, round in enumerate(rounds):
+				for row, cells in enumerate(round.clues):
+					mask = sum(1 << col for col, clue in enumerate(cells) if clue is not None)
+					if mask:
+						categoryTables[roundIndex].extend(CORPUS_CATEGORY.pack(index, roundIndex, row, mask))
+
+					for col, clue in enumerate(cells):
+						if clue is not None:
+							dailyDouble = round.dailyDoubles.index((row, col)) + 1 if (row, col) in round.dailyDoubles else 0
+							clueTable.extend(CORPUS_CLUE.pack(index, roundIndex, row, col, dailyDouble, intern(clue[0]), intern(clue[1])))
+							clueCount += 1
+			clueTable.extend(CORPUS_CLUE.pack(index, 2, 0, 0, 0, intern(data.final.clue), intern(data.final.response)))
+			clueCount += 1
+
+			gameTable.extend(CORPUS_GAME.pack(gameId, first, clueCount - first, intern(data.title), *categories, *scores))
+
+		gameCount = len(gameTable) // CORPUS_GAME.size
+		categoryTable = categoryTables[0] + categoryTables[1]
+		gameTableOffset = CORPUS_HEADER.size
+		clueTableOffset = gameTableOffset + len(gameTable)
+		categoryTableOffset = clueTableOffset + len(clueTable)
+		stringsOffset = categoryTableOffset + len(categoryTable)
+
+		# string offsets are relative to the start of the strings section
+		header = CORPUS_HEADER.pack(CORPUS_MAGIC, GAME_CACHE_VERSION, gameCount, clueCount, len(categoryTable) // CORPUS_CATEGORY.size,
+			len(categoryTables[0]) // CORPUS_CATEGORY.size, gameTableOffset, clueTableOffset, categoryTableOffset, stringsOffset)
+
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmpPath = path.with_suffix(f".{os.getpid()}.tmp")
+		with open(tmpPath, 'wb') as corpusFile:
+			corpusFile.write(header)
+			corpusFile.write(gameTable)
+			corpusFile.write(clueTable)
+			corpusFile.write(categoryTable)
+			corpusFile.write(heap)
+		os.replace(tmpPath, path)
+
+		with cls.sharedLock:
+			cls.sharedCorpus = None
+		return gameCount, clueCount
+
+	# the string stored at {offset} in the strings section
+	def string(self, offset):
+		start = self.strings + offset + 4
+		length, = struct.unpack_from('<I', self.map, start - 4)
+		return self.map[start:start + length].decode('utf-8')
+
+	def gameId(self, index):
+		return struct.unpack_from('<I', self.map, self.gameTable + index * CORPUS_GAME.size)[0]
+
+	# index of game #{gameId} in the game table, or None
+	def findGame(self, gameId):
+		low, high = 0, self.games
+		while low < high:
+			middle = (low + high) // 2
+			if self.gameId(middle) < gameId:
+				low = middle + 1
+			else:
+				high = middle
+		return low if low < self.games and self.gameId(low) == gameId else None
 
-	Prints your score and the other players' scores after a round. Does not print others' scores til
-	after Double Jeopardy.
 	"""
-	def printScores(self, round="Jeopardy", selector="jeopardy_round"):
-		print(f"\nScore after {round} round: ", end='')
-		print(Fore.GREEN + f"{self.score}")
+	game(self, gameId)
+		returns GameData, or None if the game isn't in the corpus
 
-		scores = self.page.find(id=selector).find_all(class_=["score_positive", "score_negative"])
-		print(f"Other scores: ", end='')
-		for score in scores[:3]:
-			print(f"{score.getText()} ", end='')
-		print()
-		
-		input("Press enter to continue.")
+	Unpacks game #{gameId} from its game table entry and its run of the clue table.
+	"""
+	def game(self, gameId):
+		index = self.findGame(gameId)
+		if index is None:
+			return None
+
+		_, first, count, title, *strings = CORPUS_GAME.unpack_from(self.map, self.gameTable + index * CORPUS_GAME.size)
+		categories, scores = strings[:13], strings[13:]
+
+		boards = ([[None] * 5 for _ in range(6)], [[None] * 5 for _ in range(6)])
+		dailyDoubles = ([], [])
+		final = None
+		for clueIndex in range(first, first + count):
+			_, round, row, col, dailyDouble, clue, response = CORPUS_CLUE.unpack_from(self.map, self.clueTable + clueIndex * CORPUS_CLUE.size)
+			if round == 2:
+				final = (self.string(clue), self.string(response))
+				continue
+
+			boards[round][row][col] = (self.string(clue), self.string(response))
+			if dailyDouble:
+				dailyDoubles[round].append((dailyDouble, (row, col)))
+
+		rounds = []
+		for round in range(2):
+			names = [self.string(offset) for offset in categories[round * 6:round * 6 + 6]]
+			while names and names[-1] == "":
+				names.pop()
+			rounds.append(RoundData(tuple(names), tuple(map(tuple, boards[round])), tuple(coords for _, coords in sorted(dailyDoubles[round])),
+				self.scores(scores[round])))
+
+		return GameData(self.string(title), rounds[0], rounds[1],
+			FinalData(self.string(categories[12]), final[0], final[1], self.scores(scores[2])))
+
+	def scores(self, offset):
+		text = self.string(offset)
+		return tuple(text.split("\n")) if text else ()
 
 	"""
-	play(self)
+	clue(self, index)
+		returns (gameId, round, value, category, clue, response) of clue #{index}
 
-	This takes us through the game. It goes through the jeopardy round until there are no clues left,
-	then goes through the double jeopardy round, then to final jeopardy.
+	Laid out like Store.searchClues results, with {round} a ROUND_CODES value and {value} 0 for Final Jeopardy.
 	"""
-	def play(self):
-		if self.autoMode:
-			system('cls||clear')
-			print(f"\n{self.title[0].getText()}\n")
-			print("Welcome to the Jeopardy Round. Here is your board:\n")
-			self.printBoard()
-			input("Press enter to play.")
+	def clue(self, index):
+		gameIndex, round, row, col, _, clue, response = CORPUS_CLUE.unpack_from(self.map, self.clueTable + index * CORPUS_CLUE.size)
+		gameRecord = self.gameTable + gameIndex * CORPUS_GAME.size
+		gameId, = struct.unpack_from('<I', self.map, gameRecord)
+		category, = struct.unpack_from('<I', self.map, gameRecord + CORPUS_CATEGORIES + 4 * (12 if round == 2 else round * 6 + row))
 
-		promptFunc = self.autoPrompt if self.autoMode else self.prompt
+		roundName = list(ROUND_CODES)[round]
+		value = DOLLAR_AMOUNTS[roundName][col] if round < 2 else 0
+		return gameId, ROUND_CODES[roundName], value, self.string(category), self.string(clue), self.string(response)
 
-		while(self.cluesRemaining > 0):
-			system('cls||clear')
-			promptFunc()
+	"""
+	category(self, index)
+		returns (gameId, category, [(clue, response) or None for each of its 5 columns])
 
-		system('cls||clear')
-		self.printScores()
-		self.initBoard("double_jeopardy_round")
+	Category #{index} of the category table, with its clues read off its game's run of the clue table.
+	"""
+	def category(self, index):
+		gameIndex, round, row, _ = CORPUS_CATEGORY.unpack_from(self.map, self.categoryTable + index * CORPUS_CATEGORY.size)
+		gameId, first, count, _, *strings = CORPUS_GAME.unpack_from(self.map, self.gameTable + gameIndex * CORPUS_GAME.size)
 
-		if (self.autoMode):
-			system('cls||clear')
-			print(f"\n{self.title[0].getText()}\n")
-			print("Welcome to the Double Jeopardy Round. Here is your board:\n")
-			self.printBoard()
-			input("Press enter to play.")
+		cells = [None] * 5
+		for clueIndex in range(first, first + count):
+			_, clueRound, clueRow, col, _, clue, response = CORPUS_CLUE.unpack_from(self.map, self.clueTable + clueIndex * CORPUS_CLUE.size)
+			if clueRound == round and clueRow == row:
+				cells[col] = (self.string(clue), self.string(response))
+		return gameId, self.string(strings[round * 6 + row]), cells
 
-		while (self.cluesRemaining > 0):
-			system('cls||clear')
-			promptFunc()
+	def close(self):
+		self.map.close()
 
-		self.printScores("Double Jeopardy", "double_jeopardy_round")
 
-		print("Welcome to Final Jeopardy.\n")
-		self.finalJeopardy()
-		self.stats.currentGameComplete = True
-		self.printScores("Final Jeopardy", "final_jeopardy_round")
-		
+class Frozen:
+	"""Base class for the immutable game records below. Values are given to __init__ in __slots__ order
+	(trailing ones left out are None) and can't be reassigned afterwards.
 	"""
-	standardizeResponse(self, originalResponse)
-		returns stdResponse (string)
+	__slots__ = ()
 
-	transform current response to minimize small, trivial differences from user input:
-		- make lowercase
-		- strip all punctuation
-		- remove leading articles (a and an)
-		- change "&" to "and"
-	"""
-	def standardizeResponse(self, originalResponse):
-		stdResponse = originalResponse.lower()
-		stdResponse = stdResponse.replace("&", "and")
-		stdResponse = stdResponse.translate(str.maketrans('', '', string.punctuation))
-
-		if stdResponse == '':
-			return stdResponse
-
-		if stdResponse[0] == 'a' or stdResponse[0] == 't':
-			firstWord = stdResponse.split(' ')[0]
-			if firstWord == 'a':
-				stdResponse = stdResponse[2:]
-			elif firstWord == 'an' or firstWord == 'to':
-				stdResponse = stdResponse[3:]
-			elif firstWord == 'the':
-				stdResponse = stdResponse[4:]
-		
-		return stdResponse
+	def __init__(self, *values):
+		values += (None,) * (len(self.__slots__) - len(values))
+		for name, value in zip(self.__slots__, values):
+			object.__setattr__(self, name, value)
 
-# --------------------------------------------------------------------------------------------------------------------------------------------------------
+	def __setattr__(self, name, value):
+		raise AttributeError(f"{type(self).__name__} is immutable")
 
-class GameLog:
-	gameIds = []
-	idIndex = 0
-	season = 0
-	seasonCachePath = ""
+	def __delattr__(self, name):
+		raise AttributeError(f"{type(self).__name__} is immutable")
 
-	def __init__(self, season):
-		if season < 1 or season > 40:
-			print("There are only 40 seasons of Jeopardy available.")
-			sys.exit()
+	# slots are set through object.__setattr__, so pickling has to go through __init__ too
+	def __reduce__(self):
+		return (type(self), tuple(getattr(self, name) for name in self.__slots__))
 
-		self.season = season
 
-		gameLogCachePath = Path('.', 'cache', 'gamelog.csv')
-		if not gameLogCachePath.exists():
-			with open(gameLogCachePath, 'w') as gameLog:
-				for i in range(39):
-					gameLog.write("0\n")
+class RoundData(Frozen):
+	"""One round's board.
 
-		# read file with season/game mapping
-		self.df = pd.read_csv(gameLogCachePath, header=None)
-		self.idIndex = self.df.iat[season - 1, 0]
-		self.seasonCachePath = Path('.', 'cache', f"{season}.csv")
+	Attributes:
+		- categories: tuple of category names
+		- clues[6][5]: tuple of tuples of (clue, response), or None where the clue wasn't revealed
+		- dailyDoubles: tuple of (row, col) of the round's Daily Doubles
+		- scores: the contestants' scores after the round
+		- sources[6][5]: game id each clue comes from, for boards put together from several games
+			(None for a regular game's round)
+	"""
+	__slots__ = ("categories", "clues", "dailyDoubles", "scores", "sources")
+
+	def toDict(self):
+		d = {
+			"categories": self.categories,
+			"clues": self.clues,
+			"dailyDoubles": self.dailyDoubles,
+			"scores": self.scores
+		}
+		if self.sources is not None:
+			d["sources"] = self.sources
+		return d
+
+	@staticmethod
+	def fromDict(d):
+		return RoundData(
+			tuple(d["categories"]),
+			tuple(tuple(tuple(clue) if clue else None for clue in row) for row in d["clues"]),
+			tuple(tuple(coords) for coords in d["dailyDoubles"]),
+			tuple(d["scores"]),
+			tuple(map(tuple, d["sources"])) if "sources" in d else None
+		)
+
+
+class FinalData(Frozen):
+	"""Final Jeopardy: category, clue, response and the contestants' final scores."""
+	__slots__ = ("category", "clue", "response", "scores")
+
+	def toDict(self):
+		return {name: getattr(self, name) for name in self.__slots__}
+
+	@staticmethod
+	def fromDict(d):
+		return FinalData(d["category"], d["clue"], d["response"], tuple(d["scores"]))
+
+
+class GameData(Frozen):
+	"""Everything needed to play a game, extracted once from its j-archive page.
+
+	Attributes:
+		- title: show number and air date
+		- jeopardyRound: RoundData (None for a board of Double Jeopardy categories only, see PracticeIndex.board)
+		- doubleJeopardyRound: RoundData (None for a single-round board, see fromClues, or a page without one)
+		- final: FinalData (None for a single-round board, or a page without Final Jeopardy)
+
+	Methods:
+		- round(self, round)
+		- toDict(self)
+		- fromDict(d)
+		- fromClues(title, clues, round="jeopardy_round")
+	"""
+	__slots__ = ("title", "jeopardyRound", "doubleJeopardyRound", "final")
+
+	# RoundData for {round} in ["jeopardy_round", "double_jeopardy_round"]
+	def round(self, round):
+		return self.doubleJeopardyRound if round == "double_jeopardy_round" else self.jeopardyRound
+
+	def toDict(self):
+		return {
+			"version": GAME_CACHE_VERSION,
+			"title": self.title,
+			"rounds": {
+				"jeopardy_round": self.jeopardyRound.toDict() if self.jeopardyRound else None,
+				"double_jeopardy_round": self.doubleJeopardyRound.toDict() if self.doubleJeopardyRound else None
+			},
+			"final": self.final.toDict() if self.final else None
+		}
+
+	"""
+	fromDict(d)
+		returns GameData
+
+	Rebuilds a GameData from toDict() output. Raises ValueError for data from another GAME_CACHE_VERSION.
+	"""
+	@staticmethod
+	def fromDict(d):
+		if d.get("version") != GAME_CACHE_VERSION:
+			raise ValueError(f"game data version {d.get('version')} is not {GAME_CACHE_VERSION}")
+
+		return GameData(
+			d["title"],
+			RoundData.fromDict(d["rounds"]["jeopardy_round"]) if d["rounds"]["jeopardy_round"] else None,
+			RoundData.fromDict(d["rounds"]["double_jeopardy_round"]) if d["rounds"]["double_jeopardy_round"] else None,
+			FinalData.fromDict(d["final"]) if d["final"] else None
+		)
+
+	"""
+	fromClues(title, clues, round="jeopardy_round")
+		returns GameData with only {round}, or None if none of {clues} are from it
+
+	Puts together a board out of clues from any number of games, e.g. search results. {clues} is a list of
+	(gameId, round, value, category, clue, response); only the ones from {round} are used, each in the column
+	of its dollar value, so it's played and recorded at its real round and value. Clues sharing a category go
+	in the same row (the first one of a value wins its cell), and the first 6 categories make the board.
+	"""
+	@staticmethod
+	def fromClues(title, clues, round="jeopardy_round"):
+		amounts = DOLLAR_AMOUNTS[round]
+		categories = {}
+		for gameId, clueRound, value, category, clue, response in clues:
+			if clueRound != ROUND_CODES[round] or value not in amounts:
+				continue
+			if category not in categories and len(categories) == 6:
+				continue
+			cells = categories.setdefault(category, [None] * 5)
+			col = amounts.index(value)
+			if cells[col] is None:
+				cells[col] = (gameId, (clue, response))
+		if not categories:
+			return None
+
+		categories = list(categories.items())
+		board = tuple(tuple(cell[1] if cell else None for cell in cells) for _, cells in categories) + ((None,) * 5,) * (6 - len(categories))
+		sources = tuple(tuple(cell[0] if cell else None for cell in cells) for _, cells in categories) + ((None,) * 5,) * (6 - len(categories))
+		roundData = RoundData(tuple(category for category, _ in categories), board, (), (), sources)
+		return GameData(title, roundData, None) if round == "jeopardy_round" else GameData(title, None, roundData)
+
+
+class Stats:
+	"""Records every clue you attempt and keeps your overall Jeopardy performance up to date.
+
+	Each clue attempt is written to the Store as soon as it's judged, in the same transaction that updates the
+	running totals, so quitting or crashing mid-game never loses what was already played and reading the
+	stats never has to go through the attempts.
+
+	Attributes:
+		- store: Store the attempts and totals live in
+		- recorded: number of clues recorded this session
+
+	Methods:
+		- record(self, gameId, round, category, value, isDailyDouble, correct, overridden, clue=None, checkpoint=None)
+		- add(totals, event)
+		- summary(self)
+		- printSummary(self)
+		- close(self)
+		- Destructor
+
+	"""
+
+	def __init__(self, store=None):
+		self.store = store if store is not None else Store()
+		self.recorded = 0
+		self.closed = False
+
+		# __del__ alone may run after the interpreter has started tearing down (e.g. on sys.exit)
+		atexit.register(self.close)
+
+	"""
+	record(self, gameId, round, category, value, isDailyDouble, correct, overridden, clue=None, checkpoint=None)
+
+	Records one clue attempt and adds it to the running totals. {round} is a key of ROUND_CODES, {value}
+	is the clue's dollar value on the board (0 for Final Jeopardy), and {overridden} means the player
+	claimed the clue as correct after it was judged wrong. A missed {clue} (its text) is kept for --review,
+	and the game's {checkpoint} (see Game.checkpoint) is saved along with the attempt.
+	"""
+	def record(self, gameId, round, category, value, isDailyDouble, correct, overridden, clue=None, checkpoint=None):
+		event = [int(time.time()), gameId, ROUND_CODES[round], category, value, int(isDailyDouble), int(correct), int(overridden)]
+
+		deltas = {name: 0 for name in STATS_TOTALS}
+		self.add(deltas, event)
+		with Profiler.span("stats record"):
+			self.store.recordAttempt(event, deltas, clue, checkpoint)
+		self.recorded += 1
+
+	"""
+	add(totals, event)
+
+	Adds one attempt (laid out as EVENT_COLUMNS) to {totals}.
+	"""
+	@staticmethod
+	def add(totals, event):
+		_, _, round, _, _, isDailyDouble, correct, overridden = event
+		correct = int(correct)
+
+		if round == "FJ":
+			totals["GamesPlayed"] += 1 # Final Jeopardy is the last clue of every game
+			totals["CorrectFinalJeopardyTotal"] += correct
+		else:
+			totals["CluesAttempted"] += 1
+			totals["CorrectResponseTotal"] += correct
+			if int(isDailyDouble):
+				totals["DailyDoublesAttempted"] += 1
+				totals["CorrectDailyDoubleTotal"] += correct
+
+		totals["OverriddenTotal"] += int(overridden)
+
+	"""
+	summary(self)
+		returns {STATS_SUMMARY_COLUMNS: value}
+	"""
+	def summary(self):
+		totals = self.store.totals()
+		gamesPlayed = max(totals["GamesPlayed"], 1)
+
+		return {
+			'GamesPlayed': totals["GamesPlayed"],
+			'AvgCorrectResponses': totals["CorrectResponseTotal"] / gamesPlayed,
+			'AvgCorrectResponsePct': totals["CorrectResponseTotal"] / max(totals["CluesAttempted"], 1),
+			'CorrectDailyDoublePct': totals["CorrectDailyDoubleTotal"] / max(totals["DailyDoublesAttempted"], 1),
+			'CorrectFinalJeopardyPct': totals["CorrectFinalJeopardyTotal"] / gamesPlayed
+		}
+
+	def printSummary(self):
+		summary = self.summary()
+		print("  ".join(STATS_SUMMARY_COLUMNS))
+		print("  ".join(f"{summary[column]:>{len(column)}.4g}" for column in STATS_SUMMARY_COLUMNS))
+
+	"""
+	close(self)
+
+	Shows the overall stats if anything was played this session. Fired at exit and upon class' destruction.
+	"""
+	def close(self):
+		if self.closed:
+			return
+		self.closed = True
+
+		if self.recorded:
+			self.printSummary()
+
+	# destructor
+	def __del__(self):
+		self.close()
+
+
+class Analytics:
+	"""Breakdowns of your accuracy over every recorded clue attempt, for --stats.
+
+	The attempts (with the season of their game) are loaded once into a pandas DataFrame, by way of a columnar
+	snapshot of the attempts table (see columns()), and every table is a vectorized group-by over it. Keyword breakdowns first total the attempts
+	per distinct category and only then split the category names into words, so the string work is done once
+	per category rather than once per attempt. pandas (and numpy) are imported here and nowhere else, so
+	playing never pays for them.
+
+	Attributes:
+		- attempts: DataFrame with one row per attempt: time (datetime), game_id, round (ROUND_CODES value),
+			category, value, daily_double, correct, overridden and season (-1 if the game's season isn't known)
+
+	Methods:
+		- __init__(self, attempts)
+		- load(store, keyword=None)
+		- columns(store)
+		- accuracy(grouped)
+		- overall(self)
+		- byRound(self)
+		- byValue(self)
+		- byDailyDouble(self)
+		- bySeason(self)
+		- byWord(self, minimum=STATS_MIN_ATTEMPTS, count=STATS_WORDS)
+		- trend(self, window=STATS_TREND_WEEKS)
+		- report(self)
+	"""
+
+	def __init__(self, attempts):
+		self.attempts = attempts
+
+	"""
+	load(store, keyword=None)
+		returns Analytics
+
+	Builds the attempts DataFrame from {store}'s columns (see columns()), keeping only the attempts whose
+	category has {keyword} in it (ignoring case) if one is given. Seasons are looked up by game id every time,
+	so a --sync-seasons is reflected straight away.
+	"""
+	@staticmethod
+	def load(store, keyword=None):
+		with Profiler.span("import pandas"):
+			import numpy as np
+			import pandas as pd
+
+		with Profiler.span("stats load"):
+			columns = Analytics.columns(store)
+			codes = columns["category"]
+			categories = columns["categories"]
+
+			# keyword matching only has to look at each distinct category once
+			if keyword:
+				matching = np.flatnonzero(np.char.find(np.char.lower(categories), keyword.lower()) >= 0)
+				keep = np.isin(codes, matching)
+				columns = {name: column[keep] if name != "categories" else column for name, column in columns.items()}
+				codes = columns["category"]
+
+			gameIds = columns["game_id"]
+			seasonOf = np.full(int(gameIds.max(initial=0)) + 1, -1, dtype=np.int64)
+			for gameId, season in store.db.execute("SELECT game_id, min(season) FROM season_games WHERE game_id <= ? GROUP BY game_id", (len(seasonOf) - 1,)):
+				seasonOf[gameId] = season
+
+			attempts = pd.DataFrame({
+				"time": pd.to_datetime(columns["time"], unit='s'),
+				"game_id": gameIds,
+				"round": pd.Categorical.from_codes(columns["round"], categories=list(ROUND_CODES.values())),
+				"category": pd.Categorical.from_codes(codes, categories=categories) if len(categories) else pd.Categorical(codes.astype(str)),
+				"value": columns["value"],
+				"daily_double": columns["daily_double"],
+				"correct": columns["correct"],
+				"overridden": columns["overridden"],
+				"season": seasonOf[gameIds]
+			})
+		return Analytics(attempts)
+
+	"""
+	columns(store)
+		returns {column: numpy array} of every attempt in {store}, plus "categories", the distinct category names
+		"category" holds codes into
+
+	Turning 100k+ sqlite rows into Python objects takes longer than all of the analysis, so the attempts are
+	kept as columns in a snapshot next to the database (attempts.npz), and only the attempts recorded since
+	it was written are read out of the Store and appended (after which the snapshot is rewritten). A snapshot
+	that doesn't match the attempts table, e.g. after the database was replaced, is rebuilt from scratch.
+	"""
+	@staticmethod
+	def columns(store):
+		import numpy as np
+
+		path = store.path.parent / 'attempts.npz' if str(store.path) != ':memory:' else None
+		columns = None
+		count, lastId = store.db.execute("SELECT count(*), coalesce(max(id), 0) FROM attempts").fetchone()
+		try:
+			with np.load(path, allow_pickle=False) as snapshot:
+				columns = {name: snapshot[name] for name in snapshot.files}
+			snapshotId, snapshotCount = columns.pop("last")
+			if snapshotId > lastId or snapshotCount > count:
+				columns = None
+		except (OSError, TypeError, KeyError, ValueError):
+			columns = None
+
+		if columns is None:
+			snapshotId, snapshotCount = 0, 0
+			columns = {"time": np.zeros(0, np.int64), "game_id": np.zeros(0, np.int64), "round": np.zeros(0, np.int8),
+				"category": np.zeros(0, np.int32), "value": np.zeros(0, np.int64), "daily_double": np.zeros(0, bool),
+				"correct": np.zeros(0, bool), "overridden": np.zeros(0, bool), "categories": np.zeros(0, str)}
+
+		if snapshotId < lastId:
+			rows = store.db.execute("SELECT time, game_id, round, category, value, daily_double, correct, overridden FROM attempts "
+				"WHERE id > ? ORDER BY id", (int(snapshotId),)).fetchall()
+			new = list(zip(*rows))
+			categories = list(columns["categories"])
+			codes = {category: code for code, category in enumerate(categories)}
+			rounds = {round: code for code, round in enumerate(ROUND_CODES.values())}
+
+			added = {
+				"time": np.array(new[0], np.int64),
+				"game_id": np.array(new[1], np.int64),
+				"round": np.array([rounds[round] for round in new[2]], np.int8),
+				"category": np.array([codes.setdefault(category, len(codes)) for category in new[3]], np.int32),
+				"value": np.array(new[4], np.int64),
+				"daily_double": np.array(new[5], np.int64).astype(bool),
+				"correct": np.array(new[6], np.int64).astype(bool),
+				"overridden": np.array(new[7], np.int64).astype(bool)
+			}
+			columns = {name: np.concatenate([columns[name], column]) for name, column in added.items()}
+			columns["categories"] = np.array(list(codes), dtype=str)
+
+			if path is not None:
+				with Profiler.span("stats snapshot"):
+					tmpPath = path.with_suffix(f".{os.getpid()}.tmp")
+					with open(tmpPath, 'wb') as snapshotFile:
+						np.savez(snapshotFile, last=np.array([lastId, count], np.int64), **columns)
+					os.replace(tmpPath, path)
+
+		return columns
+
+	"""
+	accuracy(grouped)
+		returns DataFrame with attempts, correct and accuracy columns
+
+	Totals the correct column of {grouped} (a group-by) into counts and an accuracy fraction.
+	"""
+	@staticmethod
+	def accuracy(grouped):
+		table = grouped["correct"].agg(["size", "sum"])
+		table.columns = ["attempts", "correct"]
+		table = table[table["attempts"] > 0]
+		table["accuracy"] = table["correct"] / table["attempts"]
+		return table
+
+	# attempts, accuracy and overrides over the whole board (Final Jeopardy apart), and games played
+	def overall(self):
+		board = self.attempts[self.attempts["round"] != "FJ"]
+		final = self.attempts[self.attempts["round"] == "FJ"]
+		return {
+			"games": len(final),
+			"clues": len(board),
+			"accuracy": board["correct"].mean() if len(board) else 0.0,
+			"overridden": int(self.attempts["overridden"].sum())
+		}
+
+	def byRound(self):
+		return self.accuracy(self.attempts.groupby("round", observed=True))
+
+	# dollar values of the Jeopardy and Double Jeopardy rounds
+	def byValue(self):
+		board = self.attempts[self.attempts["round"] != "FJ"]
+		return self.accuracy(board.groupby(["round", "value"], observed=True))
+
+	def byDailyDouble(self):
+		board = self.attempts[self.attempts["round"] != "FJ"]
+		table = self.accuracy(board.groupby("daily_double"))
+		table.index = table.index.map({False: "regular clues", True: "Daily Doubles"})
+		return table
+
+	def bySeason(self):
+		table = self.accuracy(self.attempts.groupby("season"))
+		table.index = table.index.map(lambda season: "unknown" if season < 0 else season)
+		return table
+
+	"""
+	byWord(self, minimum=STATS_MIN_ATTEMPTS, count=STATS_WORDS)
+		returns (strongest, weakest) DataFrames
+
+	Accuracy by the words in category names, over the words with at least {minimum} attempts: the {count}
+	best and worst. Short words ("THE", "OF") are left out.
+	"""
+	def byWord(self, minimum=STATS_MIN_ATTEMPTS, count=STATS_WORDS):
+		perCategory = self.accuracy(self.attempts.groupby("category", observed=True))[["attempts", "correct"]]
+		# a word that's in a category name twice still only counts once for it
+		words = perCategory.index.to_series().str.lower().str.findall(r"[a-z0-9']{4,}").map(lambda words: list(dict.fromkeys(words)))
+		perWord = perCategory.assign(word=words.values).explode("word").dropna(subset=["word"])
+		perWord = perWord.groupby("word")[["attempts", "correct"]].sum()
+		perWord = perWord[perWord["attempts"] >= minimum]
+		perWord["accuracy"] = perWord["correct"] / perWord["attempts"]
+		ranked = perWord.sort_values(["accuracy", "attempts"], ascending=[False, False])
+		# with few words, the weakest are only the ones that aren't already among the strongest
+		return ranked.head(count), ranked.tail(max(min(count, len(ranked) - count), 0)).iloc[::-1]
+
+	"""
+	trend(self, window=STATS_TREND_WEEKS)
+		returns DataFrame indexed by week
+
+	Weekly attempts and accuracy, with the accuracy over the trailing {window} weeks alongside. Weeks with
+	nothing played are skipped.
+	"""
+	def trend(self, window=STATS_TREND_WEEKS):
+		weekly = self.attempts.set_index("time")["correct"].resample("W").agg(["size", "sum"])
+		weekly.columns = ["attempts", "correct"]
+		rolling = weekly.rolling(window, min_periods=1).sum()
+		weekly["accuracy"] = weekly["correct"] / weekly["attempts"]
+		weekly[f"last {window} weeks"] = rolling["correct"] / rolling["attempts"]
+		return weekly[weekly["attempts"] > 0]
+
+	# [(title, DataFrame)] of every breakdown, in the order --stats prints them
+	def report(self):
+		strongest, weakest = self.byWord()
+		return [
+			("By round", self.byRound()),
+			("By dollar value", self.byValue()),
+			("Daily Doubles", self.byDailyDouble()),
+			("By season", self.bySeason()),
+			("Strongest category words", strongest),
+			("Weakest category words", weakest),
+			("Weekly trend", self.trend().tail(STATS_TREND_ROWS))
+		]
+
+
+class ReviewQueue:
+	"""Spaced repetition (SM-2) over the clues you've missed, for --review.
+
+	A clue missed in a game is scheduled for review a day later (see Store.addReview). Every review grades the
+	answer from 0 to 5 and pushes the next one further out the better the clue has been going: 1 day, then
+	6 days, then the last interval times the clue's ease factor, which a good answer raises and a poor one
+	lowers. A miss starts the clue over.
+
+	Only the clues that are due are loaded, never whole games, into a heap ordered by due time. Clues missed
+	during a session go back on the heap behind everything that was due, to come up once more at the end.
+
+	Attributes:
+		- store: Store the review schedule lives in
+		- now: unix time the session started at
+		- heap: [(due, clueId, review)] still to go this session, review being a Store.dueReviews row
+		- relearned: number of clues put back on the heap this session
+
+	Methods:
+		- __init__(self, store, now=None)
+		- loadDue(self, limit)
+		- next(self)
+		- grade(self, review, quality)
+		- schedule(interval, ease, repetitions, quality)
+	"""
+
+	def __init__(self, store, now=None):
+		self.store = store
+		self.now = now if now is not None else time.time()
+		self.heap = []
+		self.relearned = 0
+
+	# loads up to {limit} due clues, returns how many
+	def loadDue(self, limit):
+		self.heap = [(review[0], review[1], review) for review in self.store.dueReviews(self.now, limit)]
+		heapq.heapify(self.heap)
+		return len(self.heap)
+
+	def next(self):
+		return heapq.heappop(self.heap)[2]
+
+	"""
+	grade(self, review, quality)
+		returns days until the clue's next review
+
+	Reschedules the clue of {review} (a Store.dueReviews row) after an answer graded {quality}, 0 to 5; under
+	3 is a miss, which also puts the clue back on this session's heap. A clue that is only up again because
+	it was missed earlier in the session isn't rescheduled a second time.
+	"""
+	def grade(self, review, quality):
+		due, clueId, _, _, _, _, _, interval, ease, repetitions = review
+		relearning = due > self.now
+		if quality < 3 and not relearning:
+			self.relearned += 1
+			heapq.heappush(self.heap, (self.now + self.relearned, clueId, (self.now + self.relearned,) + review[1:]))
+
+		if relearning:
+			return interval
+
+		interval, ease, repetitions = self.schedule(interval, ease, repetitions, quality)
+		self.store.updateReview(clueId, self.now + interval * 86400, interval, ease, repetitions)
+		return interval
+
+	"""
+	schedule(interval, ease, repetitions, quality)
+		returns (interval, ease, repetitions) after an answer graded {quality}
+
+	The SM-2 update: {interval} in days, {ease} the clue's ease factor, {repetitions} its correct answers in a row.
+	A miss starts the repetitions over without touching the ease.
+	"""
+	@staticmethod
+	def schedule(interval, ease, repetitions, quality):
+		if quality < 3:
+			return REVIEW_FIRST_INTERVAL, ease, 0
+
+		ease = max(REVIEW_MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+		if repetitions == 0:
+			return REVIEW_FIRST_INTERVAL, ease, 1
+		if repetitions == 1:
+			return REVIEW_SECOND_INTERVAL, ease, 2
+		return round(interval * ease, 1), ease, repetitions + 1
+
+
+class PracticeIndex:
+	"""Samples categories out of the Corpus for --practice boards.
+
+	Each filter (round, value, seasons, keyword) is turned into a pool, an array of the indices of the
+	category table entries that pass it, the first time it's used. A scan of the table builds it once, and
+	from then on every category drawn is a random index into the pool, however many games the corpus holds.
+	Category names are only decoded for keyword filters, once per distinct name.
+
+	Attributes:
+		- corpus: Corpus the categories come from
+		- pools: {(round, value, seasons, keyword): array of category table indices}
+		- random: random.Random used for draws
+
+	Methods:
+		- __init__(self, corpus, seed=None)
+		- pool(self, round=None, value=None, gameIds=None, keyword=None)
+		- draw(self, pool, count=6)
+		- board(self, title, jeopardyPool=None, doubleJeopardyPool=None)
+	"""
+
+	def __init__(self, corpus, seed=None):
+		self.corpus = corpus
+		self.pools = {}
+		self.random = random.Random(seed)
+
+	"""
+	pool(self, round=None, value=None, gameIds=None, keyword=None)
+		returns array of category table indices
+
+	The categories of {round} ("J" or "DJ", or either) with a clue worth {value}, from one of {gameIds} (a
+	set, or None for any game) and with {keyword} in their name. Pools are kept, so asking again is free.
+	"""
+	def pool(self, round=None, value=None, gameIds=None, keyword=None):
+		key = (round, value, frozenset(gameIds) if gameIds is not None else None, keyword.lower() if keyword else None)
+		if key in self.pools:
+			return self.pools[key]
+
+		with Profiler.span("practicePool", round=round, value=value, keyword=keyword):
+			corpus = self.corpus
+			start, end = {"J": (0, corpus.jeopardyCategories), "DJ": (corpus.jeopardyCategories, corpus.categories)}.get(round, (0, corpus.categories))
+
+			# the columns {value} is in, per round
+			masks = [sum(1 << col for col, amount in enumerate(amounts) if value is None or amount == value) for amounts in DOLLAR_AMOUNTS.values()]
+			gameIndices = None
+			if gameIds is not None:
+				gameIndices = {corpus.findGame(gameId) for gameId in gameIds} - {None}
+			names = {}
+
+			pool = array('I')
+			table = memoryview(corpus.map)[corpus.categoryTable + start * CORPUS_CATEGORY.size:corpus.categoryTable + end * CORPUS_CATEGORY.size]
+			for index, (gameIndex, roundIndex, row, mask) in enumerate(CORPUS_CATEGORY.iter_unpack(table), start):
+				if not mask & masks[roundIndex] or (gameIndices is not None and gameIndex not in gameIndices):
+					continue
+				if key[3]:
+					offset, = struct.unpack_from('<I', corpus.map, corpus.gameTable + gameIndex * CORPUS_GAME.size + CORPUS_CATEGORIES + 4 * (roundIndex * 6 + row))
+					if offset not in names:
+						names[offset] = key[3] in corpus.string(offset).lower()
+					if not names[offset]:
+						continue
+				pool.append(index)
+			table.release()
+
+		self.pools[key] = pool
+		return pool
+
+	"""
+	draw(self, pool, count=6)
+		returns [(gameId, category, cells)] as given by Corpus.category
+
+	Picks {count} categories out of {pool} at random, avoiding repeated names while there are enough to go
+	around. Fewer come back if the pool is smaller than {count}.
+	"""
+	def draw(self, pool, count=6):
+		if len(pool) <= count:
+			return [self.corpus.category(index) for index in pool]
+
+		drawn = {}
+		names = set()
+		attempt = 0
+		while len(drawn) < count:
+			attempt += 1
+			index = pool[self.random.randrange(len(pool))]
+			if index in drawn:
+				continue
+			gameId, category, cells = self.corpus.category(index)
+			# past a few tries a repeated name beats an endless search of a pool that's mostly one name
+			if category in names and attempt < count * 10:
+				continue
+			drawn[index] = (gameId, category, cells)
+			names.add(category)
+		return list(drawn.values())
+
+	"""
+	board(self, title, jeopardyPool=None, doubleJeopardyPool=None)
+		returns GameData, or None if both pools are empty
+
+	A Jeopardy round of categories drawn from {jeopardyPool} and a Double Jeopardy round of categories drawn from
+	{doubleJeopardyPool} (pools of that round's categories, see pool()), each category with the clues it had in its
+	own game, in the columns they were in, so they're played and recorded at their real round and value. A round
+	whose pool is empty or None is left out.
+	"""
+	def board(self, title, jeopardyPool=None, doubleJeopardyPool=None):
+		rounds = []
+		for pool in (jeopardyPool, doubleJeopardyPool):
+			categories = self.draw(pool) if pool else []
+			if not categories:
+				rounds.append(None)
+				continue
+
+			# short pools make short boards, the missing rows left empty like a regular board's unrevealed clues
+			empty = [(None, None, (None,) * 5)] * (6 - len(categories))
+			rounds.append(RoundData(tuple(category for _, category, _ in categories), tuple(tuple(cells) for _, _, cells in categories + empty),
+				(), (), tuple((gameId,) * 5 for gameId, _, _ in categories + empty)))
+
+		if rounds == [None, None]:
+			return None
+		return GameData(title, *rounds)
+
+
+class ResponseMatcher:
+	"""Decides whether a typed answer matches a clue's correct response.
+
+	The response is normalized once, when the matcher is built, into every form j-archive allows for it:
+		- "(Emily) Dickinson": with and without the parenthetical
+		- "Comet (or Quartz)", "Truman (Harry S. Truman accepted)": each alternate on its own
+	An answer is accepted if it normalizes to one of those, or is within a few typos of one (see
+	MATCH_CHARS_PER_EDIT). Responses with digits in them have to match exactly.
+
+	Attributes:
+		- response: the correct response as j-archive shows it
+		- accepted: frozenset of its normalized forms
+
+	Methods:
+		- normalize(text)
+		- alternates(response)
+		- accepts(self, answer)
+		- matches(self, answer)
+		- withinDistance(a, b, maxDistance)
+	"""
+	punctuation = str.maketrans('', '', string.punctuation)
+	leadingWords = {"a", "an", "the", "to"}
+	questionWords = {"what", "who", "where", "when"}
+	questionVerbs = {"is", "are", "was", "were"}
+
+	def __init__(self, response):
+		self.response = response
+		self.accepted = frozenset(filter(None, map(self.normalize, self.alternates(response))))
+
+	"""
+	normalize(text)
+		returns normalized text (string)
+
+	transform a response to minimize small, trivial differences from user input:
+		- make lowercase
+		- change "&" to "and"
+		- strip all punctuation and extra whitespace
+		- remove a leading "what is" (or who/where/when is/are/was/were)
+		- remove leading articles (a, an, the) and "to"
+	"""
+	@staticmethod
+	def normalize(text):
+		words = text.lower().replace("&", "and").translate(ResponseMatcher.punctuation).split()
+
+		if len(words) > 2 and words[0] in ResponseMatcher.questionWords and words[1] in ResponseMatcher.questionVerbs:
+			words = words[2:]
+		if words and words[0] in ResponseMatcher.leadingWords:
+			words = words[1:]
+
+		return " ".join(words)
+
+	"""
+	alternates(response)
+		returns set of un-normalized forms of {response} that count as correct
+	"""
+	@staticmethod
+	def alternates(response):
+		alternates = {
+			re.sub(r'\([^)]*\)', ' ', response), # without parentheticals
+			response.replace('(', ' ').replace(')', ' ') # with them
+		}
+
+		for parenthetical in re.findall(r'\(([^)]*)\)', response):
+			parenthetical = parenthetical.strip()
+			if parenthetical.lower().startswith("or "):
+				alternates.add(parenthetical[3:])
+			elif parenthetical.lower().endswith(" accepted"):
+				alternates.add(parenthetical[:-len(" accepted")])
+
+		return alternates
+
+	# does {answer} (already normalized) count as correct?
+	def accepts(self, answer):
+		if answer in self.accepted:
+			return True
+
+		for accepted in self.accepted:
+			if any(c.isdigit() for c in accepted):
+				continue
+			maxDistance = min(len(accepted) // MATCH_CHARS_PER_EDIT, MATCH_MAX_EDITS)
+			if maxDistance and self.withinDistance(answer, accepted, maxDistance):
+				return True
+
+		return False
+
+	# does {answer}, as typed, count as correct?
+	def matches(self, answer):
+		return self.accepts(self.normalize(answer))
+
+	"""
+	withinDistance(a, b, maxDistance)
+		returns bool
+
+	Whether the Levenshtein distance between {a} and {b} is at most {maxDistance}. Only the diagonal band
+	of the table that can stay within {maxDistance} is filled in, and it gives up as soon as a whole row
+	is over the limit.
+	"""
+	@staticmethod
+	def withinDistance(a, b, maxDistance):
+		if abs(len(a) - len(b)) > maxDistance:
+			return False
+
+		tooFar = maxDistance + 1
+		previous = [j if j <= maxDistance else tooFar for j in range(len(b) + 1)]
+		for i in range(1, len(a) + 1):
+			current = [tooFar] * (len(b) + 1)
+			if i <= maxDistance:
+				current[0] = i
+
+			rowMin = current[0]
+			for j in range(max(1, i - maxDistance), min(len(b), i + maxDistance) + 1):
+				distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+				current[j] = min(distance, tooFar)
+				rowMin = min(rowMin, current[j])
+
+			if rowMin > maxDistance:
+				return False
+			previous = current
+
+		return previous[len(b)] <= maxDistance
+
+
+class Screen:
+	"""Buffered ANSI terminal output for a game, in place of running `cls`/`clear` through a shell.
+
+	Writes are collected in a buffer and sent to the terminal in one go, right before the player is asked
+	for input. The board is drawn in full once per round; after that, showing it again only rewrites the
+	cells and score that changed since it was drawn and erases the panel under it, where the clues are
+	shown. If the panel pushed the board off the top of the terminal, or the board doesn't fit its width,
+	the board is drawn in full instead.
+
+	Member variables:
+		- out: stream the frames are written to (sys.stdout by default)
+		- buffer: output not yet written to {out}
+		- row, col: where the cursor is, counted from the top left of the screen since it was last cleared
+		- columns, lines: size of the terminal when the screen was last cleared
+		- drawn: (categories, boardState, score) of the board on screen, or None if there isn't one
+		- boardTop: row of the board's column headers
+		- panelTop: first row under the board
+		- cellCol: column of the first dollar amount on the board
+
+	Methods:
+		- __init__(self, out=None)
+		- write(self, text="", end="\\n")
+		- flush(self)
+		- input(self, prompt="")
+		- clear(self)
+		- clearPanel(self)
+		- showBoard(self, game)
+		- drawBoard(self, game)
+	"""
+	ansiCodes = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+
+	def __init__(self, out=None):
+		self.out = out if out is not None else sys.stdout
+		self.buffer = []
+		self.drawn = None
+		self.boardTop = self.panelTop = self.cellCol = 0
+		self.clear()
+
+	def write(self, text="", end="\n"):
+		text += end
+		self.buffer.append(text)
+		self.advance(text)
+
+	def flush(self):
+		with Profiler.span("flush screen"):
+			if self.buffer:
+				self.out.write("".join(self.buffer))
+				self.buffer.clear()
+			self.out.flush()
+
+	"""
+	input(self, prompt="")
+		returns what the player typed (string)
+
+	Sends the buffered frame and {prompt} to the terminal in a single write, then reads a line.
+	"""
+	def input(self, prompt=""):
+		self.write(prompt, end='')
+		self.flush()
+		answer = input()
+		self.advance(answer + "\n")
+		return answer
+
+	# keeps track of where the cursor ends up after {text} is printed, wrapping at the terminal's width
+	def advance(self, text):
+		for i, line in enumerate(self.ansiCodes.sub('', text).split("\n")):
+			if i:
+				self.row += 1
+				self.col = 0
+			self.col += len(line)
+			while self.col > self.columns:
+				self.row += 1
+				self.col -= self.columns
+
+	def moveTo(self, row, col):
+		self.buffer.append(f"\x1b[{row + 1};{col + 1}H")
+		self.row, self.col = row, col
+
+	def clear(self):
+		self.buffer.append("\x1b[H\x1b[2J")
+		self.row = self.col = 0
+		self.drawn = None
+		self.columns, self.lines = shutil.get_terminal_size()
+
+	"""
+	clearPanel(self)
+
+	Erases everything under the board, or the whole screen if the board is no longer on it.
+	"""
+	def clearPanel(self):
+		if self.drawn is None or self.row >= self.lines:
+			self.clear()
+		else:
+			self.moveTo(self.panelTop, 0)
+			self.buffer.append("\x1b[J")
+
+	"""
+	showBoard(self, game)
+
+	Brings the board on screen up to date with {game}: only the cells and score that changed are rewritten
+	when the same board is still on screen, otherwise the screen is cleared and the board drawn in full.
+	Either way the cursor is left on the (erased) panel under the board.
+	"""
+	def showBoard(self, game):
+		with Profiler.span("show board"):
+			if self.drawn is None or self.drawn[0] is not game.categories or self.row >= self.lines:
+				self.clear()
+				self.drawBoard(game)
+				return
+
+			categories, boardState, score = self.drawn
+			for ctg in range(6):
+				for amt in range(5):
+					if boardState[ctg][amt] != game.boardState[ctg][amt]:
+						self.moveTo(self.boardTop + 1 + ctg, self.cellCol + 7 * amt)
+						self.buffer.append(self.cell(game, ctg, amt))
+
+			if score != game.score:
+				self.moveTo(self.panelTop - 1, 0)
+				self.buffer.append("\x1b[K" + self.scoreLine(game.score))
+
+			self.drawn = (categories, [row[:] for row in game.boardState], game.score)
+			self.clearPanel()
+
+	"""
+	drawBoard(self, game)
+
+	Prints the categories and the dollar amounts of the clues still available, followed by the score.
+	"""
+	def drawBoard(self, game):
+		with Profiler.span("draw board"):
+			self.boardTop = self.row
+			self.cellCol = game.ctgSpacing + 7
+
+			# column headers
+			self.write("{:>{width}}[1]    [2]    [3]    [4]    [5]".format(" ", width=self.cellCol))
+
+			for ctg, category in enumerate(game.categories):
+				amounts = "".join(self.cell(game, ctg, amt) for amt in range(5))
+				self.write("[{}] {:>{width}}   {}".format(ctg + 1, category, amounts, width=game.ctgSpacing))
+
+			self.write()
+			self.write(self.scoreLine(game.score))
+			self.panelTop = self.row
+
+			# cells can only be rewritten in place if no line of the board wrapped or scrolled away
+			fits = self.cellCol + 7 * 5 <= self.columns and self.panelTop < self.lines
+			self.drawn = (game.categories, [row[:] for row in game.boardState], game.score) if fits else None
+
+	@staticmethod
+	def cell(game, ctg, amt):
+		return "${:<6}".format(game.dollarAmounts[amt]) if game.boardState[ctg][amt] else "---    "
+
+	@staticmethod
+	def scoreLine(score):
+		return "Score: " + Back.WHITE + Fore.BLACK + f"{score}" + Style.RESET_ALL
+
+
+class NullScreen(Screen):
+	"""Screen that shows nothing, for games played without a terminal (see --simulate)."""
+
+	def write(self, text="", end="\n"):
+		pass
+
+	def flush(self):
+		pass
+
+	def clear(self):
+		pass
+
+	def clearPanel(self):
+		pass
+
+	def showBoard(self, game):
+		pass
+
+	def drawBoard(self, game):
+		pass
+
+
+class Player:
+	"""Answers everything a Game asks for, by asking the person at the terminal.
+
+	Each method gets the prompt the game would show and returns what was typed in reply, as a string;
+	the Game validates and interprets it. Subclasses answer from somewhere else (a script, a bot).
+
+	Attributes:
+		- screen: Screen the prompts are shown on
+
+	Methods:
+		- __init__(self, screen)
+		- ask(self, prompt)
+		- autoplay(self, prompt)
+		- chooseClue(self, game, prompt)
+		- wager(self, game, prompt, maximum)
+		- respond(self, game, prompt, response)
+		- override(self, game, prompt)
+		- pause(self, game, prompt)
+	"""
+
+	def __init__(self, screen):
+		self.screen = screen
+
+	def ask(self, prompt):
+		return self.screen.input(prompt)
+
+	# Y to have the clues given in order
+	def autoplay(self, prompt):
+		return self.ask(prompt)
+
+	# clue coordinates (e.g. 14), or nothing to take the next clue
+	def chooseClue(self, game, prompt):
+		return self.ask(prompt)
+
+	# a Daily Double or Final Jeopardy wager of up to {maximum}
+	def wager(self, game, prompt, maximum):
+		return self.ask(prompt)
+
+	# an answer to the clue whose correct response is {response}, or nothing to pass
+	def respond(self, game, prompt, response):
+		return self.ask(prompt)
+
+	# anything but nothing to claim a clue judged wrong was actually right
+	def override(self, game, prompt):
+		return self.ask(prompt)
+
+	def pause(self, game, prompt):
+		return self.ask(prompt)
+
+
+class ScriptedPlayer(Player):
+	"""Player that replies to each prompt with the next line of an answer script (see --answers).
+
+	Attributes:
+		- lines: iterator over the script's remaining lines
+	"""
+
+	def __init__(self, screen, lines):
+		super().__init__(screen)
+		self.lines = iter(lines)
+
+	def ask(self, prompt):
+		answer = next(self.lines, None)
+		if answer is None:
+			raise EOFError("The answer script ran out of lines.")
+
+		self.screen.write(prompt + answer)
+		self.screen.flush()
+		return answer
+
+
+class BotPlayer(Player):
+	"""Player that answers from the correct responses, getting each clue right with a fixed probability.
+
+	It plays in autoplay mode, wagers a random amount, and misses by passing or giving a wrong answer
+	(never overriding), so all of Game's scoring paths get exercised.
+
+	Attributes:
+		- accuracy: probability of giving the correct response
+		- rng: random.Random the bot's choices are drawn from
+	"""
+
+	def __init__(self, screen, accuracy, seed=None):
+		super().__init__(screen)
+		self.accuracy = accuracy
+		self.rng = random.Random(seed)
+
+	def autoplay(self, prompt):
+		return 'y'
+
+	def chooseClue(self, game, prompt):
+		return ''
+
+	def wager(self, game, prompt, maximum):
+		return str(self.rng.randint(0, maximum))
+
+	def respond(self, game, prompt, response):
+		if self.rng.random() < self.accuracy:
+			return response
+		return self.rng.choice(('', 'no idea'))
+
+	def override(self, game, prompt):
+		return ''
+
+	def pause(self, game, prompt):
+		return ''
+
+
+class Game:
+	"""Representation of a Jeopardy! game board.
+
+	Attributes:
+		- score: total points one would recieve if this were a real Jeopardy! game.
+		- categories[6]: list of categories for the current round
+		- clues[6][5]: 2D array of {"clue", "response"} dicts, with each row corresponding to a category
+			and each column corresponding to the dollar amount of that clue.
+		- autoMode: bool that determines if player wants to step through the clues automatically, without
+			even looking at the clue board.
+		- dailyDoubleCoords: tuple of (row, col) of the round's daily doubles
+		- title: Show number and date of game
+		- matchers[6][5]: ResponseMatcher for each clue of the round
+		- clueSources[6][5]: game id of each clue, for boards put together from several games (else None)
+		- data: GameData for the game, loaded from GameCache when possible
+		- screen: Screen everything is shown on
+		- player: Player answering the game's prompts (the person at the terminal by default)
+		- stats: Stats the clue attempts are recorded to
+		- season: season the game is part of when playing through one (else None), for --resume
+
+		------------- STATE DATA -------------
+		- boardState[6][5]: Stores which questions have been answered or are unavailable (denoted by bool)
+		- boardMask: boardState as a 30-bit mask, bit row * 5 + col set while that clue is on the board (for checkpoints)
+		- cluesRemaining: number of clues unanswered in the round
+		- currentCtg: current category (auto mode)
+		- currentAmt: current $ amount (auto mode)
+		- round: round currently being played ("jeopardy_round", "double_jeopardy_round" or "final_jeopardy_round")
+		- checkpointId: id of the game's checkpoint in the Store, once it has been saved (see checkpoint())
+		- packedData: compressed GameData of a board with no game id, kept for its checkpoints
+
+		------------- FORMATTING DATA -------------
+		- ctgSpacing: length of longest category name + 1
+
+	Methods:
+		- __init__(self, gameId, data=None, screen=None, player=None, stats=None, season=None, checkpoint=None)
+		- resume(checkpoint, screen=None, player=None, stats=None)
+		- printScore(self)
+		- newGame(self, gameId, data=None)
+		- checkpoint(self)
+		- saveCheckpoint(self)
+		- restore(self, checkpointId, state)
+		- loadGame(gameId)
+		- parseGame(html)
+		- extractGame(page)
+		- extractRound(roundDiv)
+		- initBoard(self, round)
+		- printBoard(self)
+		- stepToNextClue(self)
+		- giveClue(self, ctg, amt)
+		- prompt(self)
+		- autoPrompt(self)
+		- finalJeopardy(self)
+		- printScores(self, round="Jeopardy", selector="jeopardy_round")
+		- playRound(self, name)
+		- play(self)
+	"""
+	autoMode = False
+
+	# {checkpoint}: (checkpointId, state) of a saved game to pick back up instead of starting afresh (see resume())
+	def __init__(self, gameId, data=None, screen=None, player=None, stats=None, season=None, checkpoint=None):
+		self.stats = stats if stats is not None else Stats()
+		self.screen = screen if screen is not None else Screen()
+		self.player = player if player is not None else Player(self.screen)
+		self.season = season
+		self.newGame(gameId, data)
+
+		if checkpoint is not None:
+			self.restore(*checkpoint)
+			return
+
+		autoplay = self.player.autoplay("Would you like to use autoplay? Y/N: ").lower()
+		if autoplay == 'y':
+			self.autoMode = True
+
+	"""
+	resume(checkpoint, screen=None, player=None, stats=None)
+		returns Game
+
+	Picks a game back up from its {checkpoint}, as Store.latestCheckpoint returns it. Its board comes from the
+	corpus or the GameCache (it was cached when it was first loaded), or from the checkpoint itself for boards
+	with no game id, so nothing has to be downloaded.
+	"""
+	@classmethod
+	def resume(cls, checkpoint, screen=None, player=None, stats=None):
+		_, state = checkpoint
+		gameId, season, packedData = state[0], state[1], state[-1]
+		data = GameData.fromDict(json.loads(zlib.decompress(packedData))) if packedData is not None else None
+		return cls(gameId, data, screen, player, stats, season, checkpoint)
+
+	def printScore(self):
+		self.screen.write(Screen.scoreLine(self.score))
+
+	"""
+	newGame(self, gameId, data=None)
+
+	Loads game #{gameId}, from the cache if it has been played before or from j-archive otherwise.
+	{data} can be passed in if the game has already been loaded (e.g. by the Prefetcher).
+	"""
+	def newGame(self, gameId, data=None):
+		# reset member vars
+		self.score = 0
+		self.boardState = [ [False] * 5 for _ in range(6)]
+		self.boardMask = 0
+		self.cluesRemaining = 0
+		self.dailyDoubleCoords = ()
+		self.checkpointId = None
+		self.packedData = None
+
+		self.gameId = gameId
+
+		# check if game exists
+		try:
+			self.data = data if data is not None else self.loadGame(gameId)
+		except OSError as e:
+			print(f"Couldn't download game {gameId}: {e}")
+			sys.exit()
+		if self.data is None:
+			print("Game does not exist.")
+			sys.exit()
+
+		# initialize board/stats and print game info
+		self.screen.clear()
+		self.title = self.data.title
+		self.screen.write(f"\n{self.title}\n")
+
+		self.initBoard("jeopardy_round" if self.data.jeopardyRound is not None else "double_jeopardy_round")
+
+	"""
+	checkpoint(self)
+		returns (checkpointId, state), state laid out as CHECKPOINT_COLUMNS
+
+	The game as Store.saveCheckpoint keeps it, small enough to save after every clue: the clues left in the
+	round are boardMask and where autoplay is up to is a single number. Everything else comes from the game's
+	data, which only has to be saved for boards that can't be loaded again by game id.
+	"""
+	def checkpoint(self):
+		if self.packedData is None and not self.gameId:
+			self.packedData = zlib.compress(json.dumps(self.data.toDict(), separators=(',', ':')).encode('utf-8'))
+
+		return self.checkpointId, (self.gameId, self.season, ROUND_CODES[self.round], self.boardMask, self.score,
+			self.currentCtg * 5 + self.currentAmt, int(self.autoMode), self.packedData)
+
+	# saves the game as it is between clues, e.g. at the start of a round
+	def saveCheckpoint(self):
+		self.checkpointId = self.stats.store.saveCheckpoint(*self.checkpoint())
+
+	"""
+	restore(self, checkpointId, state)
+
+	Puts the game back the way checkpoint() saved it as {state}, once its data has been loaded (see resume()).
+	"""
+	def restore(self, checkpointId, state):
+		_, self.season, round, board, self.score, position, autoMode, self.packedData = state
+		if round != "J":
+			self.initBoard("double_jeopardy_round")
+		if round == "FJ":
+			self.round = "final_jeopardy_round"
+
+		self.boardMask = board
+		self.boardState = [[bool(board >> (row * 5 + col) & 1) for col in range(5)] for row in range(6)]
+		self.cluesRemaining = bin(board).count('1')
+		self.currentCtg, self.currentAmt = divmod(position, 5)
+		self.autoMode = bool(autoMode)
+		self.checkpointId = checkpointId
+
+	"""
+	loadGame(gameId)
+		returns GameData, or None if the game doesn't exist
+
+	Serves game #{gameId} from the packed Corpus if there is one, then from the GameCache, falling back to
+	fetching and parsing its j-archive page (and caching the result) on a miss.
+	"""
+	@staticmethod
+	def loadGame(gameId):
+		corpus = Corpus.shared()
+		if corpus is not None:
+			with Profiler.span("corpus load", gameId=gameId):
+				data = corpus.game(gameId)
+			if data is not None:
+				return data
+
+		data = GameCache.load(gameId)
+		if data is not None:
+			return data
+
+		data = Game.parseGame(Fetcher.shared().fetch(f"showgame.php?game_id={gameId}"))
+		if data is not None:
+			GameCache.save(gameId, data)
+		return data
+
+	"""
+	parseGame(html)
+		returns GameData, or None if {html} is j-archive's "no such game" page
+
+	Only the title, the three rounds and the error message are parsed (see GAME_PAGE_IDS), and the
+	tree is torn down as soon as the game has been extracted from it.
+	"""
+	@staticmethod
+	def parseGame(html):
+		with Profiler.span("import bs4"):
+			import bs4
+		with Profiler.span("soup"):
+			strainer = bs4.SoupStrainer(lambda name, attrs: attrs.get('id') in GAME_PAGE_IDS or attrs.get('class') == 'error')
+			page = bs4.BeautifulSoup(html, features="html.parser", parse_only=strainer)
+
+		try:
+			if page.find(class_='error'):
+				return None
+
+			with Profiler.span("extract"):
+				return Game.extractGame(page)
+		finally:
+			# the tree is full of reference cycles; break them now rather than waiting on the gc.
+			# a strained parse doesn't link its top-level subtrees together, so each one is torn down separately
+			with Profiler.span("soup teardown"):
+				for subtree in list(page.contents):
+					subtree.decompose()
+				page.decompose()
+
+	"""
+	extractGame(page)
+		returns GameData, or None if the page has no Jeopardy round to play
+
+	Pulls everything needed to play a game out of its parsed j-archive page. Some archived games are missing
+	the Double Jeopardy round or Final Jeopardy; those are left out (None) and the game ends without them.
+	"""
+	@staticmethod
+	def extractGame(page):
+		rounds = []
+		for round in ("jeopardy_round", "double_jeopardy_round"):
+			categories, clues, dailyDoubles, scores = Game.extractRound(page.find(id=round))
+
+			board = [[None] * 5 for _ in range(6)]
+			for clueId, clue in clues.items():
+				position = CLUE_ID.fullmatch(clueId) # clue_J_{category}_{row}
+				if position:
+					board[int(position[1]) - 1][int(position[2]) - 1] = tuple(clue)
+
+			if not any(map(any, board)):
+				rounds.append(None)
+				continue
+			rounds.append(RoundData(
+				tuple(categories),
+				tuple(tuple(row) for row in board),
+				tuple((int(position[1]) - 1, int(position[2]) - 1) for position in map(CLUE_ID.fullmatch, dailyDoubles) if position),
+				tuple(scores)
+			))
+		if rounds[0] is None:
+			return None
+
+		categories, clues, _, scores = Game.extractRound(page.find(id="final_jeopardy_round"))
+		final = None
+		if categories and "clue_FJ" in clues:
+			clue, response = clues["clue_FJ"]
+			final = FinalData(categories[0], clue, response, tuple(scores))
+
+		title = page.find(id="game_title")
+		return GameData(title.h1.getText() if title and title.h1 else "", rounds[0], rounds[1], final)
+
+	"""
+	extractRound(roundDiv)
+		returns (categories, {clueId: [clue, response]}, [Daily Double clueIds], scores)
+
+	Walks a round's subtree once, in document order: category names come first, then each clue's header
+	(which says whether it's a Daily Double), its text and its response, then the scores after the round.
+	"""
+	@staticmethod
+	def extractRound(roundDiv):
+		categories = []
+		clues = {}
+		dailyDoubles = []
+		scores = []
+		if roundDiv is None:
+			return categories, clues, dailyDoubles, scores
+
+		isDailyDouble = False
+		responseFor = None
+		for tag in roundDiv.find_all(class_=ROUND_CLASSES):
+			classes = tag['class']
+			if "category_name" in classes:
+				categories.append(tag.getText())
+			elif "clue_value_daily_double" in classes:
+				isDailyDouble = True
+			elif "clue_text" in classes:
+				clueId = tag.get('id', '')
+				if clueId.endswith('_r'):
+					responseFor = clueId[:-2]
+				else:
+					clues[clueId] = [tag.getText(), '']
+					if isDailyDouble:
+						dailyDoubles.append(clueId)
+						isDailyDouble = False
+			elif "correct_response" in classes:
+				if responseFor in clues:
+					clues[responseFor][1] = tag.getText()
+			elif len(scores) < 3: # only the first table of scores
+				scores.append(tag.getText())
+
+		return categories, clues, dailyDoubles, scores
+
+	"""
+	initBoard(self, round)
+		round is in ["jeopardy_round", "double_jeopardy_round"]
+
+	Initializes the categories, dollar amounts, and clues for the specified {round}.
+	"""
+	def initBoard(self, round="jeopardy_round"):
+		with Profiler.span("initBoard", round=round):
+			self.round = round
+			self.cluesRemaining = 0
+			self.boardMask = 0
+			self.currentCtg = self.currentAmt = 0
+
+			# setting dollar amounts
+			if round != "double_jeopardy_round":
+				round = self.round = "jeopardy_round" # default
+			self.dollarAmounts = DOLLAR_AMOUNTS[round]
+
+			roundData = self.data.round(round)
+
+			# loading categories
+			self.categories = roundData.categories
+			self.clueSources = roundData.sources
+			self.ctgSpacing = max([len(c) for c in self.categories]) + 1
+			self.dailyDoubleCoords = roundData.dailyDoubles
+
+			# populating board with clues, and getting every response ready for matching
+			self.clues = [[{} for _ in range(5)] for _ in range(6)]
+			self.matchers = [[None] * 5 for _ in range(6)]
+			for row in range(6):
+				for col in range(5):
+					clue = roundData.clues[row][col]
+					if clue is None:
+						continue
+
+					self.boardState[row][col] = True
+					self.boardMask |= 1 << (row * 5 + col)
+					self.cluesRemaining += 1
+					self.clues[row][col] = {
+						"clue": clue[0],
+						"response": clue[1]
+					}
+					self.matchers[row][col] = ResponseMatcher(clue[1])
+
+	"""
+	printBoard(self)
+
+	Prints the categories and current clues available for the round (see Screen.drawBoard).
+	"""
+	def printBoard(self):
+		self.screen.drawBoard(self)
+
+	"""
+	stepToNextClue(self)
+
+	Advances to the next clue in the category. If none are left, advances
+	to the next category.
+	"""
+	def stepToNextClue(self):
+		if (self.cluesRemaining <= 0):
+			return
+
+		while (not self.boardState[self.currentCtg][self.currentAmt]):
+			if self.currentAmt == 4: # end of the category
+				self.currentAmt = 0
+				self.currentCtg += 1
+			else:
+				self.currentAmt += 1
+
+
+	"""
+	giveClue(self, ctg, amt)
+
+	Displays the clue in {ctg} for {amt}. Lets user input an answer, interprets it, and updates
+	their score.
+	"""
+	def giveClue(self, ctg, amt):
+		points = self.dollarAmounts[amt]
+		isDailyDouble = False
+
+		# displaying clue
+		self.screen.write()
+		self.screen.write(f'[{ctg + 1}] {self.categories[ctg]} for ' + Back.GREEN + Fore.BLACK + f'${self.dollarAmounts[amt]}' + Style.RESET_ALL + ":")
+
+		# Daily Double logic
+		if (ctg, amt) in self.dailyDoubleCoords:
+			isDailyDouble = True
+			self.printScore()
+			self.screen.write("\n" + Back.LIGHTMAGENTA_EX + "Daily Double! Enter wager:" + Style.RESET_ALL, end='')
+			validPointMax = 1000 if self.score < 1000 else self.score
+			points = int(self.player.wager(self, " ", validPointMax))
+			
+			# getting valid point value
+			while (points > validPointMax):
+				points = int(self.player.wager(self, f"Please enter a value up to ${validPointMax}: ", validPointMax))
+
+			self.screen.write()
+
+		# print clue
+		self.screen.write(Fore.YELLOW + self.clues[ctg][amt]["clue"] + Style.RESET_ALL)
+		self.screen.write()
+
+		# if in auto mode, show score
+		if (self.autoMode):
+			self.printScore()
+
+		correctResponseOriginal = self.clues[ctg][amt]['response']
+
+		# answer prompt
+		answer = self.player.respond(self, "Type answer here or press enter to pass: ", correctResponseOriginal)
+		self.screen.write()
+		answer = self.standardizeResponse(answer)
+
+		# interpreting response and updating score
+		wrongAnswer = False
+		passed = False
+
+		# Pass
+		if answer == '':
+			self.screen.write("Correct response: " + Fore.YELLOW + f"{correctResponseOriginal}" + Style.RESET_ALL)
+			passed = True
+
+			if isDailyDouble:
+				self.score -= points
+				wrongAnswer = True
+		# Correct
+		elif self.matchers[ctg][amt].accepts(answer):
+			self.screen.write(Back.GREEN + Fore.BLACK + "Correct!" + Style.RESET_ALL)
+			self.score += points
+		# Incorrect
+		else:
+			wrongAnswer = True
+			self.screen.write("Correct response: " + Fore.RED + f"{correctResponseOriginal}" + Style.RESET_ALL)
+			self.score -= points
+
+		# logging board state
+		self.boardState[ctg][amt] = False
+		self.boardMask &= ~(1 << (ctg * 5 + amt))
+		self.cluesRemaining -= 1
+		self.screen.write(f"Score: {self.score}\n")
+
+		# did we make a judgement error?
+		overridden = False
+		if wrongAnswer or passed:
+			answer = self.player.override(self, "Press enter to continue, or another key and then enter if you actually got it right. ")
+			if answer != '':
+				if wrongAnswer:
+					self.score += 2 * points
+				else:
+					self.score += points
+
+				overridden = True
+		else:
+			self.player.pause(self, "Press enter to continue.")
+
+		correct = overridden or not (wrongAnswer or passed)
+		gameId = self.clueSources[ctg][amt] if self.clueSources else self.gameId
+		self.stats.record(gameId, self.round, self.categories[ctg], self.dollarAmounts[amt], isDailyDouble, correct, overridden,
+			self.clues[ctg][amt]["clue"], self.checkpoint())
+
+	"""
+	prompt(self)
+
+	Contains most of the gameplpay logic. Prints the board, lets the user pick a clue, displays the clue, 
+	and lets them answer. Also interprets the answer and updates the score accordingly. The board stays
+	on screen above the clue, and only the clue taken and the score are redrawn on it afterwards.
+	"""
+	def prompt(self):
+		self.screen.showBoard(self)
+		self.screen.write()
+		clueInput = self.player.chooseClue(self, "Enter a clue coordinate (e.g., 14) or press enter to automatically move on to the next clue: ")
+
+		ctg = amt = 0
+		if clueInput == '': # auto-continue
+			self.stepToNextClue()
+
+			ctg = self.currentCtg
+			amt = self.currentAmt
+		else: # coordinates input
+			while True:
+				coords = int(clueInput)
+				ctg = (coords // 10) - 1
+				amt = (coords % 10) - 1
+
+				if (ctg < 0) or (ctg > 5) or (amt < 0) or (amt > 4):
+					clueInput = self.player.chooseClue(self, "Invalid coordinates, try again: ")
+				elif not self.boardState[ctg][amt]:
+					clueInput = self.player.chooseClue(self, "Clue unavailable, try again: ")
+				else: # valid clue
+					break
+
+		self.screen.clearPanel()
+		self.giveClue(ctg, amt)
+
+	def autoPrompt(self):
+		self.screen.clear()
+		self.stepToNextClue()
+		self.giveClue(self.currentCtg, self.currentAmt)
+
+	"""
+	finalJeopardy(self)
+
+	Plays through the Final Jeopardy round
+	"""
+	def finalJeopardy(self):
+		final = self.data.final
+
+		# displaying category
+		self.screen.write(f"Category: {final.category}")
+		self.printScore()
+
+		wager = 0
+		wagerAnswer = self.player.wager(self, "\nEnter your wager: ", max(self.score, 0))
+		if wagerAnswer != "":
+			wager = int(wagerAnswer)
+
+		# getting clue
+		self.screen.write("\n" + Fore.YELLOW + f"{final.clue}" + Style.RESET_ALL)
+
+		# getting correct response
+		correct_response = final.response
+
+		# answer prompt
+		answer = self.player.respond(self, "\nType answer here: ", correct_response)
+		self.screen.write()
+
+		# Correct
+		correct = overridden = False
+		if ResponseMatcher(correct_response).matches(answer):
+			self.screen.write(Back.GREEN + Fore.BLACK + "Correct!" + Style.RESET_ALL)
+			self.score += wager
+			correct = True
+		# Incorrect
+		else:
+			self.screen.write("Correct response: " + Fore.RED + f"{correct_response}" + Style.RESET_ALL)
+			self.score -= wager
+
+			answer = self.player.override(self, "Press enter to continue, or another key if you actually got it right. ")
+			if answer != '':
+				self.score += 2 * wager
+				correct = overridden = True
+
+		# the game is over: its checkpoint goes with the last attempt
+		self.stats.record(self.gameId, "final_jeopardy_round", final.category, 0, False, correct, overridden, final.clue, (self.checkpointId, None))
+		self.checkpointId = None
+
+	"""
+	printScores(self, round="Jeopardy", selector="jeopardy_round")
+
+	Prints your score and the other players' scores after a round. Does not print others' scores til
+	after Double Jeopardy.
+	"""
+	def printScores(self, round="Jeopardy", selector="jeopardy_round"):
+		self.screen.write(f"\nScore after {round} round: " + Fore.GREEN + f"{self.score}" + Style.RESET_ALL)
+
+		scores = self.data.final.scores if selector == "final_jeopardy_round" else self.data.round(selector).scores
+		if scores:
+			self.screen.write("Other scores: " + "".join(f"{score} " for score in scores))
+		
+		self.player.pause(self, "Press enter to continue.")
+
+	"""
+	playRound(self, name)
+
+	Goes through the clues left in the current round ({name}, as it's announced in auto mode). The game is
+	checkpointed before the first clue, so even a game quit right away can be resumed.
+	"""
+	def playRound(self, name):
+		self.saveCheckpoint()
+
+		if self.autoMode:
+			self.screen.clear()
+			self.screen.write(f"\n{self.title}\n")
+			self.screen.write(f"Welcome to the {name} Round. Here is your board:\n")
+			self.printBoard()
+			self.player.pause(self, "Press enter to play.")
+
+		promptFunc = self.autoPrompt if self.autoMode else self.prompt
+
+		while (self.cluesRemaining > 0):
+			promptFunc()
+
+		self.screen.clear()
+
+	"""
+	play(self)
+
+	This takes us through the game. It goes through the jeopardy round until there are no clues left,
+	then goes through the double jeopardy round, then to final jeopardy. Single-round boards stop after
+	the jeopardy round. A resumed game starts from the round it was left in.
+	"""
+	def play(self):
+		if self.round == "jeopardy_round":
+			self.playRound("Jeopardy")
+			self.printScores()
+
+			# boards put together from search results only have one round
+			if self.data.doubleJeopardyRound is None:
+				self.checkpointId = self.stats.store.saveCheckpoint(self.checkpointId, None)
+				return
+
+			self.initBoard("double_jeopardy_round")
+
+		if self.round == "double_jeopardy_round":
+			self.playRound("Double Jeopardy")
+			self.printScores("Double Jeopardy", "double_jeopardy_round")
+			self.round = "final_jeopardy_round"
+
+		# some archived games end without Final Jeopardy
+		if self.data.final is None:
+			self.checkpointId = self.stats.store.saveCheckpoint(self.checkpointId, None)
+			return
+
+		self.saveCheckpoint()
+		self.screen.write("Welcome to Final Jeopardy.\n")
+		self.finalJeopardy()
+		self.printScores("Final Jeopardy", "final_jeopardy_round")
+		
+	"""
+	standardizeResponse(self, originalResponse)
+		returns stdResponse (string)
+
+	transform current response to minimize small, trivial differences from user input (see ResponseMatcher.normalize)
+	"""
+	def standardizeResponse(self, originalResponse):
+		return ResponseMatcher.normalize(originalResponse)
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class GameLog:
+	"""Walks through a season one game at a time, remembering how far you've gotten in the Store.
+
+	Attributes:
+		- season: season being played
+		- gameIds: the season's game ids, oldest game first
+		- idIndex: number of the season's games handed out so far
+		- store: Store holding the season's game ids and progress
+
+	Methods:
+		- __init__(self, season)
+		- scrapeGameIdsForSeason(self)
+		- parseSeasonPage(html)
+		- parseSeasonList(html)
+		- getCurrentGameId(self)
+		- getNextGameId(self)
+		- upcomingGameIds(self, count)
+	"""
+	gameIds = []
+	idIndex = 0
+	season = 0
+
+	def __init__(self, season):
+		self.season = season
+		self.store = Store()
+
+		# seasons after the last --sync-seasons may well exist, so only the ones before the first are ruled out
+		seasons = self.store.seasons()
+		if season < (seasons[0] if seasons else 1):
+			print(f"Jeopardy seasons start at {seasons[0] if seasons else 1}.")
+			sys.exit()
+
+		self.gameIds = self.store.seasonGameIds(season)
+		if not self.gameIds:
+			self.scrapeGameIdsForSeason()
+		if not self.gameIds:
+			print(f"j-archive has no games for season {season}." + (f" The latest season is {seasons[-1]}." if seasons else ""))
+			sys.exit()
+
+		self.idIndex = self.store.progress(season)
+
+	"""
+	scrapeGameIdsForSeason(self)
+
+	Given a season, scrapes the game IDs for that season and places them into the store, as well as this
+	object's self.gameIds array
+	"""
+	def scrapeGameIdsForSeason(self):
+		# read in season page
+		games = self.parseSeasonPage(Fetcher.shared().fetch(f"showseason.php?season={self.season}", revalidate=True))
+		self.store.saveSeasonGames(self.season, games)
+		self.gameIds = [gameId for gameId, _, _ in games]
+
+	"""
+	parseSeasonPage(html)
+		returns list of (gameId, show number, air date), oldest game first
+
+	Reads the games off a j-archive season page (which lists the newest game first). Each game's link reads
+	"#8961, aired 2023-09-11"; the show number or air date is None if a link doesn't have it.
+	"""
+	@staticmethod
+	def parseSeasonPage(html):
+		with Profiler.span("import bs4"):
+			import bs4
+		with Profiler.span("parse season"):
+			seasonPage = bs4.BeautifulSoup(html, features="html.parser")
+			# a season that doesn't exist (yet) gets a page with no table
+			if seasonPage.table is None:
+				return []
+			games = []
+			for a in seasonPage.table.find_all('a'):
+				text = a.get_text()
+				show = re.search(r'#(\d+)', text)
+				aired = re.search(r'\d{4}-\d{2}-\d{2}', text)
+				games.append((int(a.get('href').split('=')[1]), int(show[1]) if show else None, aired[0] if aired else None))
+		games.reverse()
+		return games
+
+	"""
+	parseSeasonList(html)
+		returns list of season numbers, in order
+
+	Reads the regular seasons off j-archive's season list (listseasons.php). Special collections it also lists
+	(pilots, Super Jeopardy! and the like) have names instead of numbers, and are left out.
+	"""
+	@staticmethod
+	def parseSeasonList(html):
+		return sorted({int(season) for season in re.findall(r'showseason\.php\?season=(\d+)"', html)})
+
+	"""
+	getCurrentGameId(self)
+
+	Hands out the next game of the season and records it as played. Another terminal playing the same
+	season at the same time gets a different game. If you've reached the end, it tells you and resets
+	your progress in the season to zero.
+	"""
+	def getCurrentGameId(self):
+		id, self.idIndex = self.store.claimNextGame(self.season)
+
+		# have we reached the end of the season?
+		if id is None:
+			print("END OF SEASON REACHED.")
+			sys.exit()
+
+		return id
+
+	"""
+	getNextGameId(self)
+
+	Gets the next game ID in the current season you're playing through. If you've reached the end,
+	it tells you and resets your progress in the season to zero.
+	"""
+	def getNextGameId(self):
+		self.idIndex += 1
+		if self.idIndex > len(self.gameIds):
+			self.store.setProgress(self.season, 0)
+			print("END OF SEASON REACHED.")
+			sys.exit()
+
+		self.store.setProgress(self.season, self.idIndex)
+		return self.getCurrentGameId()
+
+	# ids of the next {count} games in the season, after the one most recently handed out
+	def upcomingGameIds(self, count):
+		return self.gameIds[self.idIndex:self.idIndex + count]
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class Prefetcher:
+	"""Loads upcoming games on a background thread while the current game is being played, so the
+	next game in a season starts without waiting on j-archive.
+
+	Attributes:
+		- depth: maximum number of games loaded ahead of the one being played
+		- pending: ids scheduled but not yet picked up by the worker, in play order
+		- inFlight: id the worker is currently loading, if any
+		- loaded: {gameId: GameData} for games the worker has finished loading
+		- cancelled: set once the session is over; the worker exits as soon as it sees it
+
+	Methods:
+		- schedule(self, gameIds)
+		- get(self, gameId)
+		- cancel(self)
+		- run(self)
+	"""
+
+	def __init__(self, depth=PREFETCH_DEPTH):
+		self.depth = depth
+		self.pending = []
+		self.inFlight = None
+		self.loaded = {}
+		self.cancelled = False
+		self.condition = threading.Condition()
+
+		# daemon thread, so a blocking request never holds up quitting
+		self.worker = threading.Thread(target=self.run, daemon=True)
+		self.worker.start()
+
+	"""
+	schedule(self, gameIds)
+
+	Replaces the prefetch window with the first {depth} of {gameIds}. Games that fell out of the
+	window are forgotten.
+	"""
+	def schedule(self, gameIds):
+		with self.condition:
+			window = list(gameIds)[:self.depth]
+			self.pending = [id for id in window if id not in self.loaded and id != self.inFlight]
+			self.loaded = {id: data for id, data in self.loaded.items() if id in window}
+			self.condition.notify_all()
+
+	"""
+	get(self, gameId)
+		returns GameData, or None if the game doesn't exist
+
+	Hands over game #{gameId}, waiting for the worker if it is loading it right now. Games that were
+	never prefetched (or whose prefetch failed) are loaded on the calling thread.
+	"""
+	def get(self, gameId):
+		with self.condition:
+			if gameId in self.pending:
+				self.pending.remove(gameId)
+
+			while self.inFlight == gameId:
+				self.condition.wait()
+
+			if gameId in self.loaded:
+				return self.loaded.pop(gameId)
+
+		return Game.loadGame(gameId)
+
+	# stops the worker and drops anything it hasn't loaded yet
+	def cancel(self):
+		with self.condition:
+			self.cancelled = True
+			self.pending = []
+			self.loaded = {}
+			self.condition.notify_all()
+
+	# worker loop
+	def run(self):
+		while True:
+			with self.condition:
+				while not self.pending and not self.cancelled:
+					self.condition.wait()
+
+				if self.cancelled:
+					return
+
+				gameId = self.inFlight = self.pending.pop(0)
+
+			try:
+				data = Game.loadGame(gameId)
+				failed = False
+			except Exception:
+				# get() retries on the main thread, where the error is reported normally
+				failed = True
+
+			with self.condition:
+				self.inFlight = None
+				if not failed and not self.cancelled:
+					self.loaded[gameId] = data
+				self.condition.notify_all()
+
+
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class RateLimiter:
+	"""Spaces out requests made from any number of threads to at most {rate} per second.
+
+	Methods:
+		- wait(self)
+	"""
+
+	def __init__(self, rate):
+		self.interval = 1 / rate if rate > 0 else 0
+		self.nextSlot = 0.0
+		self.lock = threading.Lock()
+
+	# blocks until the caller is allowed to make its next request
+	def wait(self):
+		with self.lock:
+			now = time.monotonic()
+			slot = max(now, self.nextSlot)
+			self.nextSlot = slot + self.interval
+
+		if slot > now:
+			time.sleep(slot - now)
+
+
+class Fetcher:
+	"""The one way anything is downloaded from j-archive.
+
+	Requests go over a pooled requests.Session (created on first use, so playing cached games never imports
+	requests), ask for gzip, time out after FETCH_TIMEOUT seconds and pass through a RateLimiter. Connection
+	errors, timeouts, 429s and 5xx responses are retried up to FETCH_RETRIES times with exponential backoff.
+
+	Pages that change over time (season pages) are fetched with revalidate=True: the last response is kept in
+	the Store's responses table, and the request carries its ETag and Last-Modified, so an unchanged page
+	costs a 304 with no body. If such a page can't be fetched at all, the stored copy is used.
+
+	Attributes:
+		- baseUrl: j-archive (or stand-in server) to fetch from
+		- workers: most requests expected at once, which sizes the connection pool
+		- limiter: RateLimiter every request goes through
+		- metrics: {"requests", "fetched", "notModified", "stale", "retries", "failed", "wireBytes", "pageBytes"}
+			totals for this Fetcher: requests sent, 200s, 304s, stored copies used after a failure, retries,
+			requests given up on, bytes received (compressed) and page bytes they decoded to
+		- sharedFetcher: the Fetcher games and seasons are loaded through (see shared())
+
+	Methods:
+		- __init__(self, baseUrl=J_ARCHIVE_URL, workers=1, rate=0)
+		- shared()
+		- session(self)
+		- fetch(self, path, revalidate=False)
+		- send(self, url, headers)
+		- count(self, **deltas)
+		- summary(self)
+	"""
+	sharedFetcher = None
+	sharedLock = threading.Lock()
+
+	def __init__(self, baseUrl=J_ARCHIVE_URL, workers=1, rate=0):
+		self.baseUrl = baseUrl.rstrip('/')
+		self.workers = max(workers, 1)
+		self.limiter = RateLimiter(rate)
+		self.metrics = {"requests": 0, "fetched": 0, "notModified": 0, "stale": 0, "retries": 0, "failed": 0, "wireBytes": 0, "pageBytes": 0}
+		self.lock = threading.Lock()
+		self.httpSession = None
+
+	@classmethod
+	def shared(cls):
+		with cls.sharedLock:
+			if cls.sharedFetcher is None:
+				cls.sharedFetcher = cls()
+			return cls.sharedFetcher
+
+	# the pooled requests.Session, created by the first request
+	def session(self):
+		with self.lock:
+			if self.httpSession is None:
+				with Profiler.span("import requests"):
+					import requests
+				self.httpSession = requests.Session()
+				self.httpSession.headers["Accept-Encoding"] = "gzip, deflate"
+				adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+				self.httpSession.mount('http://', adapter)
+				self.httpSession.mount('https://', adapter)
+			return self.httpSession
+
+	"""
+	fetch(self, path, revalidate=False)
+		returns page text
+
+	GETs {baseUrl}/{path}, retrying as described above; other HTTP errors, and retryable ones that outlast the
+	retries, are raised as requests exceptions (which are OSErrors). With {revalidate}, the request is
+	conditional on the stored copy of the page, and the response is stored for next time.
+	"""
+	def fetch(self, path, revalidate=False):
+		url = f"{self.baseUrl}/{path}"
+		store = Store.local() if revalidate else None
+		cached = store.cachedResponse(url) if revalidate else None
+
+		headers = {}
+		if cached is not None:
+			etag, lastModified, _ = cached
+			if etag:
+				headers["If-None-Match"] = etag
+			if lastModified:
+				headers["If-Modified-Since"] = lastModified
+
+		try:
+			res = self.send(url, headers)
+		except OSError:
+			if cached is None:
+				raise
+			self.count(stale=1)
+			return cached[2]
+
+		if res.status_code == 304 and cached is not None:
+			self.count(notModified=1)
+			return cached[2]
+
+		text = res.text
+		self.count(fetched=1, pageBytes=len(res.content))
+		if revalidate:
+			store.saveResponse(url, res.headers.get("ETag"), res.headers.get("Last-Modified"), text)
+		return text
+
+	"""
+	send(self, url, headers)
+		returns requests.Response, 200 or 304
+
+	One GET with retries and backoff. Counts the requests, retries, failures and bytes received.
+	"""
+	def send(self, url, headers):
+		import requests
+		session = self.session()
+
+		for attempt in range(FETCH_RETRIES + 1):
+			self.limiter.wait()
+			self.count(requests=1, retries=int(attempt > 0))
+			try:
+				with Profiler.span("fetch", url=url, attempt=attempt) as span:
+					res = session.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+					# bytes pulled off the socket, before gzip decoding
+					wireBytes = res.raw.tell() if hasattr(res.raw, 'tell') else len(res.content)
+					if span is not None:
+						span.args.update(status=res.status_code, bytes=wireBytes)
+				self.count(wireBytes=wireBytes)
+
+				if res.status_code != 429 and res.status_code < 500:
+					res.raise_for_status()
+					return res
+				error = requests.HTTPError(f"{res.status_code} Error for url: {url}", response=res)
+			except (requests.ConnectionError, requests.Timeout) as e:
+				error = e
+			except requests.HTTPError:
+				self.count(failed=1)
+				raise
+
+			if attempt < FETCH_RETRIES:
+				time.sleep(FETCH_BACKOFF * 2 ** attempt + random.uniform(0, FETCH_BACKOFF))
+
+		self.count(failed=1)
+		raise error
+
+	def count(self, **deltas):
+		with self.lock:
+			for name, delta in deltas.items():
+				self.metrics[name] += delta
+
+	# one line of the metrics, e.g. for the end of a mirror
+	def summary(self):
+		m = self.metrics
+		line = (f"{m['requests']} requests: {m['fetched']} fetched, {m['notModified']} not modified, {m['stale']} stale, "
+			f"{m['retries']} retries, {m['failed']} failed; {m['wireBytes'] / 2 ** 20:.1f} MiB received")
+		if m["pageBytes"]:
+			line += f" for {m['pageBytes'] / 2 ** 20:.1f} MiB of pages ({1 - m['wireBytes'] / m['pageBytes']:.0%} saved by compression)"
+		return line
+
+
+class Mirror:
+	"""Downloads every game of one or more seasons into the GameCache, so they can be played offline.
+
+	Games are fetched concurrently through one Fetcher, sized for the workers and rate limited across all of
+	them. Progress is the GameCache itself: games that are already cached are skipped, so an interrupted
+	mirror picks up where it left off. Season pages are revalidated every run, which costs a 304 when the
+	season hasn't changed and picks up newly aired games when it has.
+
+	Attributes:
+		- workers: number of concurrent downloads
+		- fetcher: Fetcher shared by all workers
+		- store: Store the season game ids are kept in
+		- counts: {"cached", "mirrored", "missing", "failed"} totals for this run
+
+	Methods:
+		- __init__(self, workers=MIRROR_WORKERS, rate=MIRROR_RATE, baseUrl=J_ARCHIVE_URL)
+		- seasonGameIds(self, season)
+		- mirrorGame(self, gameId)
+		- mirrorSeason(self, season)
+		- discoverSeasons(self)
+		- syncSeasons(self)
+	"""
+
+	def __init__(self, workers=MIRROR_WORKERS, rate=MIRROR_RATE, baseUrl=J_ARCHIVE_URL):
+		self.workers = max(workers, 1)
+		self.fetcher = Fetcher(baseUrl, self.workers, rate)
+		self.counts = {"cached": 0, "mirrored": 0, "missing": 0, "failed": 0}
+		self.countLock = threading.Lock()
+		self.store = Store()
+
+	"""
+	seasonGameIds(self, season)
+		returns list of game IDs, oldest game first
+
+	Revalidates the season page and stores its games if they've changed.
+	"""
+	def seasonGameIds(self, season):
+		games = GameLog.parseSeasonPage(self.fetcher.fetch(f"showseason.php?season={season}", revalidate=True))
+		if games and games != self.store.seasonGames(season):
+			self.store.saveSeasonGames(season, games)
+		return [gameId for gameId, _, _ in games]
+
+	"""
+	mirrorGame(self, gameId)
+		returns "cached", "mirrored" or "missing"
+
+	Makes sure game #{gameId} is in the GameCache. Raises ValueError if its page can't be parsed.
+	"""
+	def mirrorGame(self, gameId):
+		if GameCache.contains(gameId):
+			return "cached"
+
+		html = self.fetcher.fetch(f"showgame.php?game_id={gameId}")
+		try:
+			data = Game.parseGame(html)
+		except Exception as e:
+			raise ValueError(f"couldn't read the page ({type(e).__name__}: {e})") from e
+		if data is None:
+			return "missing"
+
+		GameCache.save(gameId, data)
+		return "mirrored"
+
+	"""
+	mirrorSeason(self, season)
+
+	Mirrors every game in {season}, printing progress as games complete. A game that still fails
+	after all retries, or whose page can't be parsed, is reported and counted, and will be retried by
+	the next run; the rest of the season carries on.
+	"""
+	def mirrorSeason(self, season):
+		import requests
+		gameIds = self.seasonGameIds(season)
+		done = 0
+
+		executor = ThreadPoolExecutor(max_workers=self.workers)
+		try:
+			futures = {executor.submit(self.mirrorGame, gameId): gameId for gameId in gameIds}
+			for future in as_completed(futures):
+				try:
+					status = future.result()
+				except (requests.RequestException, ValueError) as e:
+					print(f"\nGame {futures[future]} failed: {e}")
+					status = "failed"
+
+				with self.countLock:
+					self.counts[status] += 1
+				done += 1
+				print(f"\rSeason {season}: {done}/{len(gameIds)} games", end='', flush=True)
+		finally:
+			# on Ctrl-C, drop the queued games; everything finished so far is already cached
+			executor.shutdown(wait=False, cancel_futures=True)
+
+		print()
+
+	# every season j-archive lists, in order
+	def discoverSeasons(self):
+		return GameLog.parseSeasonList(self.fetcher.fetch("listseasons.php", revalidate=True))
+
+	"""
+	syncSeasons(self)
+		returns {season: game ids, oldest game first}
+
+	Discovers the seasons and fetches all of their pages at once, across the workers, then rebuilds the game
+	lists of every season in one Store transaction. Unchanged season pages are 304s. If any season page can't
+	be fetched, nothing is saved and the error is raised.
+	"""
+	def syncSeasons(self):
+		seasons = self.discoverSeasons()
+		seasonGames = {}
+
+		with ThreadPoolExecutor(max_workers=self.workers) as executor:
+			futures = {executor.submit(self.fetcher.fetch, f"showseason.php?season={season}", True): season for season in seasons}
+			for future in as_completed(futures):
+				seasonGames[futures[future]] = GameLog.parseSeasonPage(future.result())
+				print(f"\rSeasons: {len(seasonGames)}/{len(seasons)}", end='', flush=True)
+		print()
+
+		# seasons j-archive lists but has no games for yet aren't playable
+		seasonGames = {season: seasonGames[season] for season in seasons if seasonGames[season]}
+		self.store.saveSeasons(seasonGames)
+		return {season: [gameId for gameId, _, _ in games] for season, games in seasonGames.items()}
+
+
+class Ingester:
+	"""Turns a directory of saved j-archive game pages into cached games, for --ingest. Pages can be named the way
+	j-archive serves them (showgame.php?game_id=8000) or anything else ending in the game id (8000.html, game_8000.html).
+
+	Parsing is CPU-bound, so pages are parsed in a pool of worker processes, one per core. They're fed from a
+	generator over the directory with only INGEST_QUEUE pages per worker in flight, and each worker reads its pages
+	itself and sends back only the extracted GameData. Games are saved to the GameCache and the search index
+	INGEST_BATCH at a time. A page that can't be parsed is moved to quarantine/ in the directory, with the reason
+	in quarantine/errors.log, and the rest carry on. Games that are already cached are skipped, so an interrupted
+	ingest picks up where it left off.
+
+	Attributes:
+		- directory: directory the pages are in (subdirectories included)
+		- quarantineDir: where pages that can't be parsed are moved to
+		- workers: number of worker processes
+		- counts: {"ingested", "cached", "quarantined"} totals for this run
+
+	Methods:
+		- __init__(self, directory, workers=None)
+		- gameIdOf(path)
+		- pages(self)
+		- parsePage(gameId, path)
+		- parsed(self, executor, pages)
+		- quarantine(self, path, reason)
+		- run(self)
+	"""
+
+	def __init__(self, directory, workers=None):
+		self.directory = Path(directory)
+		self.quarantineDir = self.directory / 'quarantine'
+		self.workers = max(workers or os.cpu_count() or 1, 1)
+		self.counts = {"ingested": 0, "cached": 0, "quarantined": 0}
+
+	# the game id in a page's file name (the game_id parameter, else the last number in the name), or None
+	@staticmethod
+	def gameIdOf(path):
+		match = re.search(r'game_id=(\d+)', path.name) or re.search(r'(\d+)\D*$', path.name)
+		return int(match.group(1)) if match else None
+
+	"""
+	pages(self)
+		yields (gameId, path) of every page in the directory that isn't cached yet
+
+	Files named like a game page (showgame.php... or *.html) that have no game id in their name are quarantined
+	as they're found, and ones that are already cached are counted.
+	"""
+	def pages(self):
+		cached = set(GameCache.gameIds())
+		for dirPath, dirNames, fileNames in os.walk(self.directory):
+			if Path(dirPath) == self.quarantineDir:
+				dirNames.clear()
+				continue
+			dirNames.sort()
+
+			for fileName in sorted(fileNames):
+				path = Path(dirPath, fileName)
+				if not (fileName.startswith('showgame.php') or path.suffix in ('.html', '.htm')):
+					continue
+
+				gameId = self.gameIdOf(path)
+				if gameId is None:
+					self.quarantine(path, "no game id in the file name")
+				elif gameId in cached:
+					self.counts["cached"] += 1
+				else:
+					yield gameId, path
+
+	"""
+	parsePage(gameId, path)
+		returns (gameId, path, GameData or None, what went wrong or None)
+
+	Reads and parses one page, in a worker process. Nothing a malformed page can raise gets out of here: it
+	comes back as the reason to quarantine the page.
+	"""
+	@staticmethod
+	def parsePage(gameId, path):
+		try:
+			data = Game.parseGame(Path(path).read_text(encoding='utf-8', errors='replace'))
+		except Exception as e:
+			return gameId, path, None, f"{type(e).__name__}: {e}"
+
+		return gameId, path, data, None if data is not None else "j-archive has no such game"
+
+	"""
+	parsed(self, executor, pages)
+		yields parsePage() results, in the order they finish
+
+	Keeps INGEST_QUEUE of the {pages} per worker in flight on {executor}, taking more from the generator as
+	results come in, so neither the paths nor the parsed games of the whole directory are ever held at once.
+	"""
+	def parsed(self, executor, pages):
+		pending = set()
+		while True:
+			for gameId, path in pages:
+				pending.add(executor.submit(Ingester.parsePage, gameId, str(path)))
+				if len(pending) >= self.workers * INGEST_QUEUE:
+					break
+			if not pending:
+				return
+
+			done, pending = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				yield future.result()
+
+	# moves the page at {path} into quarantine/, noting the {reason} in quarantine/errors.log
+	def quarantine(self, path, reason):
+		self.quarantineDir.mkdir(exist_ok=True)
+		target = self.quarantineDir / path.name
+		if target.exists():
+			target = target.with_name(f"{path.name}.{time.time_ns()}")
+		shutil.move(path, target)
+		with open(self.quarantineDir / 'errors.log', 'a', encoding='utf-8') as log:
+			log.write(f"{target.name}\t{reason}\n")
+		self.counts["quarantined"] += 1
+
+	"""
+	run(self)
+
+	Ingests every page in the directory, printing progress (pages done and pages per second) as it goes.
+	On Ctrl-C the queued pages are dropped, and the games parsed so far are still saved.
+	"""
+	def run(self):
+		# the workers leave Ctrl-C to this process, which shuts them down
+		executor = ProcessPoolExecutor(max_workers=self.workers, initializer=signal.signal, initargs=(signal.SIGINT, signal.SIG_IGN))
+		start = lastReport = time.perf_counter()
+		done = 0
+		batch = []
+		try:
+			for gameId, path, data, error in self.parsed(executor, self.pages()):
+				if data is None:
+					self.quarantine(Path(path), error)
+				else:
+					batch.append((gameId, data))
+					if len(batch) >= INGEST_BATCH:
+						GameCache.saveMany(batch)
+						self.counts["ingested"] += len(batch)
+						batch = []
+
+				done += 1
+				now = time.perf_counter()
+				if now - lastReport >= 0.5:
+					lastReport = now
+					print(f"\rPages: {done} parsed ({done / (now - start):.1f}/s), {self.counts['quarantined']} quarantined", end='', flush=True)
+		finally:
+			executor.shutdown(wait=False, cancel_futures=True)
+			if batch:
+				GameCache.saveMany(batch)
+				self.counts["ingested"] += len(batch)
+
+		print(f"\rPages: {done} parsed ({done / max(time.perf_counter() - start, 1e-9):.1f}/s), {self.counts['quarantined']} quarantined")
+
+# --------------------------------------------------------------------------------------------------------------------------------------------------------
+
+class GameServer:
+	"""asyncio TCP server for game nights (--serve): several people play the same game from their own
+	terminals (--join), in any number of rooms at once.
+
+	The protocol is one JSON object per line each way (see Room for the messages). Every connection is a
+	Session; its reader stamps each message with the server's clock as it comes in, so buzzes are ordered by
+	when they reached the server, never by what a client claims. Games are loaded once per server and shared
+	by every room playing them.
+
+	Attributes:
+		- host, port: address to listen on
+		- rooms: {room name: Room}
+		- games: {gameId: future of its GameData}, shared across rooms
+		- sessions: number of connections open
 
-		if (self.seasonCachePath.exists()):
-			self.readGameIdsFromCache()
+	Methods:
+		- __init__(self, host="", port=SERVER_PORT)
+		- serve(self)
+		- game(self, gameId)
+		- randomGameId()
+		- handle(self, reader, writer)
+	"""
+
+	def __init__(self, host="", port=SERVER_PORT):
+		self.host = host
+		self.port = port
+		self.rooms = {}
+		self.games = {}
+		self.sessions = 0
+
+	# listens until cancelled; {ready}, if given, is called with the server once it's listening
+	async def serve(self, ready=None):
+		import asyncio
+		server = await asyncio.start_server(self.handle, self.host or None, self.port, limit=SESSION_LINE_LIMIT)
+		self.port = server.sockets[0].getsockname()[1]
+		if ready is not None:
+			ready(self)
+		async with server:
+			await server.serve_forever()
+
+	"""
+	game(self, gameId)
+		returns GameData, or None if the game doesn't exist
+
+	Loads game #{gameId} on a worker thread the first time any room asks for it; rooms asking while it loads
+	wait on the same load. Failed loads aren't kept, so the next room tries again.
+	"""
+	async def game(self, gameId):
+		import asyncio
+		if gameId not in self.games:
+			self.games[gameId] = asyncio.ensure_future(asyncio.to_thread(Game.loadGame, gameId))
+		try:
+			data = await asyncio.shield(self.games[gameId])
+		except OSError:
+			data = None
+		if data is None:
+			self.games.pop(gameId, None)
+		return data
+
+	# id of a random downloaded game, or None if there aren't any
+	@staticmethod
+	def randomGameId():
+		corpus = Corpus.shared()
+		if corpus is not None and corpus.games:
+			return corpus.gameId(random.randrange(corpus.games))
+		gameIds = GameCache.gameIds()
+		return random.choice(gameIds) if gameIds else None
+
+	# one connection: a join, then every message goes to the room's inbox until the client hangs up
+	async def handle(self, reader, writer):
+		import asyncio
+		session = Session(writer)
+		self.sessions += 1
+		try:
+			message = await session.read(reader)
+			if message is None or message.get("type") != "join":
+				session.send({"type": "error", "message": "Send a join message first."})
+				return
+
+			name = str(message.get("room") or "main")
+			room = self.rooms.get(name)
+			if room is None:
+				gameId = message.get("game") or self.randomGameId()
+				data = await self.game(int(gameId)) if gameId else None
+				if data is None:
+					session.send({"type": "error", "message": f"Game {gameId} isn't available." if gameId else "The server has no downloaded games."})
+					return
+				room = self.rooms.get(name)
+				if room is None:
+					room = self.rooms[name] = Room(self, name, int(gameId), data)
+
+			room.join(session, str(message.get("name") or "Player"))
+			while (message := await session.read(reader)) is not None:
+				room.inbox.put_nowait((session.stamp, session, message))
+		except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+			pass
+		finally:
+			self.sessions -= 1
+			if session.room is not None:
+				session.room.leave(session)
+			writer.close()
+
+
+class Session:
+	"""One client connection of the GameServer.
+
+	Attributes:
+		- writer: asyncio StreamWriter of the connection
+		- name: player name, unique within the room
+		- room: Room the player is in, once joined
+		- stamp: server clock (time.monotonic()) when the last message was read
+	"""
+	__slots__ = ('writer', 'name', 'room', 'stamp')
+
+	def __init__(self, writer):
+		self.writer = writer
+		self.name = None
+		self.room = None
+		self.stamp = 0.0
+
+	# next message from the client, or None once it has hung up. Raises ValueError for a line that isn't JSON
+	async def read(self, reader):
+		line = await reader.readline()
+		self.stamp = time.monotonic()
+		if not line:
+			return None
+		message = json.loads(line)
+		if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+			raise ValueError("messages are JSON objects with a type")
+		return message
+
+	# queues {message} (a dict, or a line already encoded by Room.broadcast); a client too slow to keep up is dropped
+	def send(self, message):
+		if self.writer.is_closing():
+			return
+		self.writer.write(message if isinstance(message, bytes) else json.dumps(message).encode('utf-8') + b"\n")
+		if self.writer.transport.get_write_buffer_size() > SESSION_BUFFER_LIMIT:
+			self.writer.close()
+
+
+class Room:
+	"""One game being played on the GameServer. The room owns the board; clients only send what their
+	player does and draw what they're told.
+
+	Clients send:
+		{"type": "start"}, {"type": "choose", "row", "col"}, {"type": "buzz"}, {"type": "wager", "amount"},
+		{"type": "answer", "text"}
+	and get:
+		- {"type": "joined", "room", "name", "title"}, then {"type": "players", "scores"} whenever someone comes or goes
+		- {"type": "board", "round", "categories", "values", "open"[6][5], "scores"} at the start of each round
+		- {"type": "control", "player"}: who picks the next clue
+		- {"type": "clue", "row", "col", "category", "value", "clue", "dailyDouble", "player"}: buzzers are open
+			(for a Daily Double only "player" answers, after a wager)
+		- {"type": "wager", "player", "maximum"}: {player} has to wager (Final Jeopardy asks everyone at once)
+		- {"type": "buzzed", "player"}: {player} answers next
+		- {"type": "judged", "player", "answer", "correct", "score"}
+		- {"type": "reveal", "row", "col", "response"}: the clue is over and its cell is off the board
+		- {"type": "final", "category"}, then the Final Jeopardy clue, judgments and reveal
+		- {"type": "over", "scores"}
+
+	Everything a player does goes through {inbox} as (stamp, session, message), and one task plays the game
+	(play()) by reading it, so the game is plain sequential code. After the first buzz on a clue, buzzes for
+	another BUZZ_WINDOW seconds are collected too and the earliest by server stamp answers first; the rest
+	stay in line, in stamp order, if it's wrong.
+
+	Attributes:
+		- server: GameServer the room is on
+		- name: room name
+		- gameId, data: the game and its GameData
+		- sessions: players in the room, in joining order
+		- scores: {player name: score}
+		- control: Session of the player who picks the next clue
+		- loop: the event loop the room runs on
+		- inbox: asyncio.Queue of (stamp, session, message)
+		- started: whether someone has sent start
+		- task: task running play()
+
+	Methods:
+		- __init__(self, server, name, gameId, data)
+		- join(self, session, name)
+		- leave(self, session)
+		- broadcast(self, message)
+		- receive(self, deadline, accept)
+		- play(self)
+		- chooseClue(self, round, board)
+		- playClue(self, round, row, col)
+		- judge(self, player, answer, matcher, amount)
+		- takeWager(self, session, maximum)
+		- takeAnswer(self, session)
+		- finalJeopardy(self)
+	"""
+
+	def __init__(self, server, name, gameId, data):
+		self.server = server
+		self.name = name
+		self.gameId = gameId
+		self.data = data
+		self.sessions = []
+		self.scores = {}
+		self.control = None
+		import asyncio
+		self.loop = asyncio.get_running_loop()
+		self.inbox = asyncio.Queue()
+		self.started = False
+		self.task = self.loop.create_task(self.play())
+
+	def join(self, session, name):
+		# names are unique within a room, so scores can be keyed on them
+		unique, n = name, 1
+		while unique in self.scores:
+			n += 1
+			unique = f"{name} ({n})"
+
+		session.name, session.room = unique, self
+		self.sessions.append(session)
+		self.scores[unique] = 0
+		session.send({"type": "joined", "room": self.name, "name": unique, "title": self.data.title, "started": self.started})
+		self.broadcast({"type": "players", "scores": self.scores})
+
+	def leave(self, session):
+		self.sessions.remove(session)
+		self.scores.pop(session.name, None)
+		if not self.sessions:
+			self.task.cancel()
+			if self.server.rooms.get(self.name) is self:
+				del self.server.rooms[self.name]
+			return
+
+		self.broadcast({"type": "players", "scores": self.scores})
+		# wakes up anything waiting on the player
+		self.inbox.put_nowait((time.monotonic(), session, {"type": "leave"}))
+
+	# the line is encoded once, however many players get it
+	def broadcast(self, message):
+		line = json.dumps(message).encode('utf-8') + b"\n"
+		for session in self.sessions:
+			session.send(line)
+
+	"""
+	receive(self, deadline, accept)
+		returns (stamp, session, message), or None at {deadline}
+
+	The next inbox message {accept}(session, message) is true for, waiting until {deadline} (loop time, or
+	None to wait for as long as it takes). Messages it isn't true for are dropped, e.g. a buzz while a clue
+	is being picked. Leave messages come from players who are already gone; anything else from them is dropped.
+	"""
+	async def receive(self, deadline, accept):
+		import asyncio
+		loop = self.loop
+		while True:
+			if not self.inbox.empty():
+				item = self.inbox.get_nowait()
+			elif deadline is None:
+				item = await self.inbox.get()
+			else:
+				timeout = deadline - loop.time()
+				if timeout <= 0:
+					return None
+				try:
+					item = await asyncio.wait_for(self.inbox.get(), timeout)
+				except asyncio.TimeoutError:
+					return None
+
+			_, session, message = item
+			if (session in self.sessions or message["type"] == "leave") and accept(session, message):
+				return item
+
+	# waits for someone to send start, then plays the whole game
+	async def play(self):
+		await self.receive(None, lambda session, message: message["type"] == "start")
+		self.started = True
+
+		with Profiler.span("room", room=self.name, gameId=self.gameId):
+			for round in ("jeopardy_round", "double_jeopardy_round"):
+				board = self.data.round(round)
+				if board is None:
+					continue
+				openCells = [[clue is not None for clue in row] for row in board.clues]
+				self.broadcast({"type": "board", "round": round, "categories": board.categories, "values": DOLLAR_AMOUNTS[round],
+					"open": openCells, "scores": self.scores})
+
+				# the lowest score picks first in Double Jeopardy, like on the show
+				if round == "double_jeopardy_round" or self.control is None:
+					self.control = min(self.sessions, key=lambda session: self.scores[session.name])
+
+				while any(map(any, openCells)):
+					row, col = await self.chooseClue(round, openCells)
+					openCells[row][col] = False
+					await self.playClue(round, row, col)
+
+			if self.data.final is not None:
+				await self.finalJeopardy()
+			self.broadcast({"type": "over", "scores": self.scores})
+
+	"""
+	chooseClue(self, round, board)
+		returns (row, col)
+
+	The player in control picks an open cell of {board} ([6][5] booleans). If they take longer than
+	CHOOSE_SECONDS, or leave, the next clue in order is picked for them.
+	"""
+	async def chooseClue(self, round, board):
+		if self.control not in self.sessions:
+			self.control = self.sessions[0]
+		self.broadcast({"type": "control", "player": self.control.name})
+
+		loop = self.loop
+		def accept(session, message):
+			if session is not self.control:
+				return False
+			if message["type"] == "leave":
+				return True
+			row, col = message.get("row"), message.get("col")
+			return message["type"] == "choose" and row in range(6) and col in range(5) and board[row][col]
+
+		item = await self.receive(loop.time() + CHOOSE_SECONDS, accept)
+		if item is not None and item[2]["type"] == "choose":
+			return item[2]["row"], item[2]["col"]
+		return next((row, col) for col in range(5) for row in range(6) if board[row][col])
+
+	"""
+	playClue(self, round, row, col)
+
+	Shows the clue and plays it out: a Daily Double is wagered on and answered by the player in control;
+	any other clue goes to the buzzers, for CLUE_SECONDS or until someone gets it. Whoever gets it right
+	takes control.
+	"""
+	async def playClue(self, round, row, col):
+		board = self.data.round(round)
+		clue, response = board.clues[row][col]
+		value = DOLLAR_AMOUNTS[round][col]
+		matcher = ResponseMatcher(response)
+		message = {"type": "clue", "row": row, "col": col, "category": board.categories[row], "value": value, "clue": clue}
+		loop = self.loop
+
+		if (row, col) in board.dailyDoubles:
+			# the player who picked it may have left since; the Daily Double goes to whoever has control next
+			if self.control not in self.sessions:
+				self.control = self.sessions[0]
+			player = self.control
+			wager = await self.takeWager(player, max(self.scores.get(player.name, 0), DOLLAR_AMOUNTS[round][-1]))
+			self.broadcast(dict(message, dailyDouble=True, player=player.name, value=wager))
+			answer = await self.takeAnswer(player)
+			self.judge(player, answer, matcher, wager)
 		else:
-			self.scrapeGameIdsForSeason()
+			self.broadcast(dict(message, dailyDouble=False, player=None))
+			deadline = loop.time() + CLUE_SECONDS
+			tried = set()
+			waiting = [] # (stamp, session) buzzed in and not yet heard from
+
+			def buzz(session, message):
+				return message["type"] == "buzz" and session not in tried
+
+			while True:
+				if not waiting:
+					item = await self.receive(deadline, buzz)
+					if item is None:
+						break
+					waiting.append(item[:2])
+					# buzzes right behind the first one are still in the running
+					windowEnd = min(deadline, loop.time() + BUZZ_WINDOW)
+					while (item := await self.receive(windowEnd, buzz)) is not None:
+						if all(session is not item[1] for _, session in waiting):
+							waiting.append(item[:2])
+
+				waiting.sort(key=lambda buzzed: buzzed[0])
+				_, player = waiting.pop(0)
+				waiting = [buzzed for buzzed in waiting if buzzed[1] in self.sessions]
+				if player not in self.sessions:
+					continue
+				tried.add(player)
+
+				self.broadcast({"type": "buzzed", "player": player.name})
+				answer = await self.takeAnswer(player)
+				if self.judge(player, answer, matcher, value):
+					self.control = player
+					break
+				# nobody left to buzz in
+				if all(session in tried for session in self.sessions):
+					break
+
+		self.broadcast({"type": "reveal", "row": row, "col": col, "response": response})
+
+	# judges {answer} of {player}, moves {amount} into or out of their score and tells everyone; returns whether it was right
+	def judge(self, player, answer, matcher, amount):
+		correct = bool(answer.strip()) and matcher.matches(answer)
+		if player.name in self.scores:
+			self.scores[player.name] += amount if correct else -amount
+		self.broadcast({"type": "judged", "player": player.name, "answer": answer, "correct": correct, "score": self.scores.get(player.name, 0)})
+		return correct
 
 	"""
-	__del__(self)
+	takeWager(self, session, maximum)
+		returns the wager
 
-	Destructor. Updates the gamelog.
+	Asks {session} to wager between 5 and {maximum}; out-of-range wagers are clamped, and no answer within
+	ANSWER_SECONDS is a wager of 5.
 	"""
-	def __del__(self):
-		self.df.to_csv(Path('.', 'cache', 'gamelog.csv'), index=False, header=False)
+	async def takeWager(self, session, maximum):
+		self.broadcast({"type": "wager", "player": session.name, "maximum": maximum})
+		loop = self.loop
+		item = await self.receive(loop.time() + ANSWER_SECONDS, lambda s, m: s is session and m["type"] in ("wager", "leave"))
+		try:
+			amount = int(item[2]["amount"]) if item is not None else 5
+		except (KeyError, TypeError, ValueError):
+			amount = 5
+		return min(max(amount, 5), maximum)
+
+	# what {session} answers within ANSWER_SECONDS ("" if nothing, or if they leave)
+	async def takeAnswer(self, session):
+		loop = self.loop
+		item = await self.receive(loop.time() + ANSWER_SECONDS, lambda s, m: s is session and m["type"] in ("answer", "leave"))
+		return str(item[2].get("text", "")) if item is not None else ""
 
 	"""
-	scrapeGameIdsForSeason(self)
+	finalJeopardy(self)
 
-	Given a season, scrapes the game IDs for that season and places them into the cache
-	in a file called {self.season}.csv, as well as this object's self.gameIds array
+	Everyone with a positive score wagers and answers at the same time; each has ANSWER_SECONDS for each.
 	"""
-	def scrapeGameIdsForSeason(self):
-		# read in season page
-		res = requests.get(f"https://j-archive.com/showseason.php?season={self.season}")
-		res.raise_for_status()
-		currentSeasonPage = bs4.BeautifulSoup(res.text, features="html.parser")
+	async def finalJeopardy(self):
+		final = self.data.final
+		players = [session for session in self.sessions if self.scores[session.name] > 0]
+		self.broadcast({"type": "final", "category": final.category, "players": [session.name for session in players]})
+		if not players:
+			self.broadcast({"type": "reveal", "row": None, "col": None, "response": final.response})
+			return
 
-		# get game ids
-		self.gameIds = [int(a.get('href').split('=')[1]) for a in currentSeasonPage.table.find_all('a')]
-		self.gameIds.reverse()
+		loop = self.loop
+		wagers = {session: 0 for session in players}
+		for session in players:
+			session.send({"type": "wager", "player": session.name, "maximum": self.scores[session.name]})
+		pending = set(players)
+		deadline = loop.time() + ANSWER_SECONDS
+		while pending and (item := await self.receive(deadline, lambda s, m: s in pending and m["type"] in ("wager", "leave"))) is not None:
+			_, session, message = item
+			pending.discard(session)
+			try:
+				wagers[session] = min(max(int(message.get("amount", 0)), 0), self.scores[session.name])
+			except (KeyError, TypeError, ValueError):
+				pass
+
+		self.broadcast({"type": "clue", "row": None, "col": None, "category": final.category, "value": 0, "clue": final.clue,
+			"dailyDouble": False, "player": None, "final": True})
+		answers = {session: "" for session in players}
+		pending = set(players)
+		deadline = loop.time() + ANSWER_SECONDS
+		while pending and (item := await self.receive(deadline, lambda s, m: s in pending and m["type"] in ("answer", "leave"))) is not None:
+			_, session, message = item
+			pending.discard(session)
+			answers[session] = str(message.get("text", ""))
+
+		matcher = ResponseMatcher(final.response)
+		for session in players:
+			self.judge(session, answers[session], matcher, wagers[session])
+		self.broadcast({"type": "reveal", "row": None, "col": None, "response": final.response})
+
+
+class GameClient:
+	"""Terminal client for a GameServer room (--join). Draws the board with a Screen and sends what the
+	player types; what a typed line means depends on what the server last asked for (see Room).
+
+	Lines are read on a daemon thread and handed to the event loop, so server messages keep being shown
+	while the player is typing.
 
-		# write game IDs to cache
-		with open(self.seasonCachePath, 'w') as cache:
-			for id in self.gameIds[:-1]:
-				cache.write(f"{id},")
-			cache.write(f"{self.gameIds[-1]}")
+	Attributes:
+		- screen: Screen the room is drawn on
+		- name: this player's name in the room
+		- categories, boardState, dollarAmounts, ctgSpacing, score: the board as Screen.showBoard draws it
+		- scores: {player name: score}
+		- finalists: names of the players in Final Jeopardy
+		- recent: lines about the last clue, shown again under the board when it's redrawn
+		- expecting: what the next line typed is ("choose", "buzz", "wager", "answer", "start" or None)
 
+	Methods:
+		- __init__(self, screen)
+		- run(self, host, port, room, name, gameId=None)
+		- handle(self, message)
+		- typed(self, line)
+	"""
 
-	def readGameIdsFromCache(self):
-		with open(self.seasonCachePath, newline='') as cache:
-			reader = csv.reader(cache)
-			self.gameIds = [int(id) for id in list(reader)[0]]
+	def __init__(self, screen):
+		self.screen = screen
+		self.name = None
+		self.categories = ()
+		self.boardState = [[False] * 5 for _ in range(6)]
+		self.dollarAmounts = DOLLAR_AMOUNTS["jeopardy_round"]
+		self.ctgSpacing = 1
+		self.score = 0
+		self.scores = {}
+		self.finalists = []
+		self.recent = []
+		self.expecting = None
+		self.writer = None
 
-	def getCurrentGameId(self):
-		# have we reached the end of the season?
-		if self.idIndex == len(self.gameIds):
-			self.df.iat[self.season - 1, 0] = 0
-			print("END OF SEASON REACHED.")
-			sys.exit()
+	"""
+	run(self, host, port, room, name, gameId=None)
 
-		id = self.gameIds[self.idIndex]
-		self.idIndex += 1
-		self.df.iat[self.season - 1, 0] = self.idIndex
+	Joins {room} on the server at {host}:{port} (creating it with game #{gameId}, or a random game, if it
+	doesn't exist yet) and plays until the game is over or the server hangs up.
+	"""
+	async def run(self, host, port, room, name, gameId=None):
+		import asyncio
+		reader, self.writer = await asyncio.open_connection(host, port, limit=SESSION_LINE_LIMIT)
+		self.send({"type": "join", "room": room, "name": name, "game": gameId})
+
+		loop = asyncio.get_running_loop()
+		lines = asyncio.Queue()
+		def readLines():
+			for line in sys.stdin:
+				loop.call_soon_threadsafe(lines.put_nowait, line.rstrip("\n"))
+		threading.Thread(target=readLines, daemon=True).start()
+
+		async def typing():
+			while True:
+				self.typed(await lines.get())
+		typer = asyncio.ensure_future(typing())
 
-		self.df.to_csv(Path('.', 'cache', 'gamelog.csv'), index=False, header=False)
+		try:
+			while line := await reader.readline():
+				if not self.handle(json.loads(line)):
+					break
+				self.screen.flush()
+		finally:
+			typer.cancel()
+			self.writer.close()
+
+	def send(self, message):
+		self.writer.write(json.dumps(message).encode('utf-8') + b"\n")
+
+	def prompt(self, expecting, text):
+		self.expecting = expecting
+		self.screen.write(text, end='')
+
+	# shows {message} from the server; returns False once the game is over
+	def handle(self, message):
+		kind = message["type"]
+		screen = self.screen
+
+		if kind == "error":
+			screen.write(Fore.RED + message["message"] + Style.RESET_ALL)
+			return False
+		elif kind == "joined":
+			self.name = message["name"]
+			screen.clear()
+			screen.write(f"\n{message['title']}\nJoined room {message['room']} as {self.name}.")
+			if not message["started"]:
+				self.prompt("start", "Press enter to start the game once everyone is in.\n")
+		elif kind == "players":
+			self.scores = message["scores"]
+			if self.expecting == "start":
+				screen.write("Players: " + ", ".join(self.scores))
+		elif kind == "board":
+			self.categories = tuple(message["categories"])
+			self.boardState = message["open"]
+			self.dollarAmounts = message["values"]
+			self.ctgSpacing = max(map(len, self.categories), default=0) + 1
+			self.scores = message["scores"]
+			screen.clear()
+		elif kind == "control":
+			self.score = self.scores.get(self.name, 0)
+			screen.showBoard(self)
+			for line in self.recent:
+				screen.write(line)
+			self.recent = []
+			screen.write("Scores: " + ", ".join(f"{player} {score}" for player, score in self.scores.items()))
+			if message["player"] == self.name:
+				self.prompt("choose", "Enter a clue coordinate (e.g., 14): ")
+			else:
+				self.expecting = None
+				screen.write(f"{message['player']} is picking a clue.")
+		elif kind == "clue":
+			where = "Final Jeopardy" if message.get("final") else f"${message['value']}"
+			screen.write(f"\n{message['category']} for {where}:")
+			screen.write(Fore.YELLOW + message["clue"] + Style.RESET_ALL + "\n")
+			if message.get("final") or message["dailyDouble"]:
+				if self.name in self.finalists or message["player"] == self.name:
+					self.prompt("answer", "Your answer: ")
+			else:
+				self.prompt("buzz", "Press enter to buzz in. ")
+		elif kind == "wager":
+			if message["player"] == self.name:
+				self.prompt("wager", f"\nWager (up to ${message['maximum']}): ")
+			else:
+				screen.write(f"\n{message['player']} is wagering.")
+		elif kind == "buzzed":
+			if message["player"] == self.name:
+				self.prompt("answer", "\nYour answer: ")
+			else:
+				self.expecting = None
+				screen.write(f"\n{message['player']} buzzed in.")
+		elif kind == "judged":
+			self.scores[message["player"]] = message["score"]
+			verdict = Fore.GREEN + "right" if message["correct"] else Fore.RED + "wrong"
+			self.recent.append(f"{message['player']}: {message['answer'] or '(no answer)'} - {verdict}{Style.RESET_ALL}, now ${message['score']}")
+			screen.write(self.recent[-1])
+		elif kind == "reveal":
+			self.expecting = None
+			if message["row"] is not None:
+				self.boardState[message["row"]][message["col"]] = False
+			self.recent.append("Correct response: " + Fore.YELLOW + message["response"] + Style.RESET_ALL)
+			screen.write(self.recent[-1])
+		elif kind == "final":
+			self.finalists = message["players"]
+			screen.clear()
+			screen.write(f"\nFinal Jeopardy! The category is {message['category']}.")
+		elif kind == "over":
+			screen.write("\nFinal scores:")
+			for player, score in sorted(message["scores"].items(), key=lambda item: -item[1]):
+				screen.write(f"    {player}: ${score}")
+			return False
+		return True
+
+	# acts on a line the player typed, if the server is waiting on one
+	def typed(self, line):
+		expecting, self.expecting = self.expecting, None
+		if expecting == "start":
+			self.send({"type": "start"})
+		elif expecting == "choose":
+			if len(line) == 2 and line.isdigit() and 1 <= int(line[0]) <= 6 and 1 <= int(line[1]) <= 5:
+				self.send({"type": "choose", "row": int(line[0]) - 1, "col": int(line[1]) - 1})
+			else:
+				self.prompt("choose", "Enter a category (1-6) and a clue (1-5), e.g. 14: ")
+		elif expecting == "buzz":
+			self.send({"type": "buzz"})
+		elif expecting == "wager":
+			self.send({"type": "wager", "amount": int(line) if line.strip().isdigit() else 0})
+		elif expecting == "answer":
+			self.send({"type": "answer", "text": line})
+		else:
+			self.expecting = expecting
+		self.screen.flush()
 
-		return id
 
+class Daemon:
+	"""Resident game process (--daemon) that jeopardy_client.py hands commands to over a Unix domain socket,
+	so a command doesn't pay for starting Python, importing requests, bs4 and pandas, migrating the Store
+	and mapping the corpus before its first board is drawn.
+
+	All of that is done once, up front. Then every connection is forked off into a child that already has
+	it: the child takes the client's working directory and terminal size, makes the connection its stdin,
+	stdout and stderr, and runs main() with the client's arguments, exactly as if it had been started from
+	the client's terminal. Children share nothing but the copy-on-write memory of the daemon, so each one
+	opens its own Store connection and HTTP session, and games can be played from any number of terminals
+	at once. The corpus is reopened before the next fork whenever --build-corpus has replaced it.
+
+	A client sends a DAEMON_HEADER length and a header of NUL-separated fields: its working directory,
+	terminal columns and lines, "1" if its stdout is a terminal (empty otherwise) and then its arguments.
+	It then relays its terminal both ways until the child closes the connection.
+
+	Attributes:
+		- path: location of the socket
+		- corpusStamp: (inode, modification time) of the corpus file the daemon has mapped, or None
+		- served: number of connections served
+
+	Methods:
+		- available()
+		- __init__(self, path=None)
+		- warm(self)
+		- refreshCorpus(self)
+		- run(self, ready=None)
+		- serveClient(self, connection)
 	"""
-	getNextGameId(self)
+	path = Path('.', 'cache', 'jeopardy.sock')
+
+	# forking is what makes the children start warm; there's no Unix domain socket or fork on Windows
+	@staticmethod
+	def available():
+		return hasattr(os, 'fork') and hasattr(socket, 'AF_UNIX')
+
+	def __init__(self, path=None):
+		if path is not None:
+			self.path = Path(path)
+		self.corpusStamp = None
+		self.served = 0
 
-	Gets the next game ID in the current season you're playing through. If you've reached the end,
-	it tells you and resets your progress in the season to zero.
 	"""
-	def getNextGameId(self):
-		self.idIndex += 1
-		if self.idIndex > len(self.gameIds):
-			self.df.iat[self.season - 1, 0] = 0
-			print("END OF SEASON REACHED.")
-			sys.exit()
+	warm(self)
 
-		self.df.iat[self.season - 1, 0] = self.idIndex
-		return self.getCurrentGameId()
+	Imports everything a command might need and opens the Store once, so that migrations and legacy imports
+	are done before any child runs.
+	"""
+	def warm(self):
+		import asyncio, requests, bs4
+		try:
+			import numpy, pandas
+		except ImportError:
+			pass
+		Store().db.close()
+		self.refreshCorpus()
+
+		# keeps the collector from touching (and so copying) every warm object in every child
+		gc.freeze()
+
+	# maps the corpus at Corpus.path again if the file has been replaced since it was last mapped
+	def refreshCorpus(self):
+		try:
+			stat = os.stat(Corpus.path)
+			stamp = (stat.st_ino, stat.st_mtime_ns)
+		except OSError:
+			stamp = None
+
+		if stamp != self.corpusStamp or Corpus.sharedCorpus is None:
+			with Corpus.sharedLock:
+				if Corpus.sharedCorpus:
+					Corpus.sharedCorpus.close()
+				Corpus.sharedCorpus = None
+			Corpus.shared()
+			self.corpusStamp = stamp
+
+	"""
+	run(self, ready=None)
 
-	
+	Listens on the socket until Ctrl-C or SIGTERM, forking a child for every connection. {ready}, if given, is
+	called with the daemon once it's listening. Raises OSError if another daemon is already listening on it.
+	Games still being played in children carry on after the daemon stops.
+	"""
+	def run(self, ready=None):
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		try:
+			listener.bind(str(self.path))
+		except OSError:
+			# a socket left behind by a daemon that didn't get to clean up answers no one
+			probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			try:
+				probe.connect(str(self.path))
+				raise OSError(f"a daemon is already listening on {self.path}")
+			except (ConnectionRefusedError, FileNotFoundError):
+				self.path.unlink(missing_ok=True)
+				listener.bind(str(self.path))
+			finally:
+				probe.close()
+		listener.listen(DAEMON_BACKLOG)
+
+		# children are reaped by the kernel, and SIGTERM stops the daemon the way Ctrl-C does
+		signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+		def terminate(signum, frame):
+			raise KeyboardInterrupt
+		signal.signal(signal.SIGTERM, terminate)
+
+		try:
+			if ready:
+				ready(self)
+			while True:
+				connection, _ = listener.accept()
+				self.refreshCorpus()
+				sys.stdout.flush()
+				sys.stderr.flush()
+				if os.fork() == 0:
+					listener.close()
+					self.serveClient(connection)
+				connection.close()
+				self.served += 1
+		finally:
+			listener.close()
+			self.path.unlink(missing_ok=True)
+			signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+			signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+	"""
+	serveClient(self, connection)
 
+	Runs in the forked child: reads the client's header and runs main() for it, with the connection as the
+	terminal. Never returns.
+	"""
+	def serveClient(self, connection):
+		code = 0
+		try:
+			# a session of its own, so stopping the daemon from its terminal doesn't stop the game
+			os.setsid()
+			signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+			signal.signal(signal.SIGTERM, signal.SIG_DFL)
+			signal.signal(signal.SIGINT, signal.default_int_handler)
+
+			size = DAEMON_HEADER.unpack(connection.recv(DAEMON_HEADER.size, socket.MSG_WAITALL))[0]
+			cwd, columns, lines, tty, *argv = map(os.fsdecode, connection.recv(size, socket.MSG_WAITALL).split(b"\0"))
+			os.chdir(cwd)
+			os.environ["COLUMNS"], os.environ["LINES"] = columns, lines
+			for fd in (0, 1, 2):
+				os.dup2(connection.fileno(), fd)
+			connection.close()
+
+			# fresh streams over the connection (the daemon's may be closed or redirected), and colorama set up
+			# for the client's terminal rather than the daemon's
+			color_deinit()
+			sys.stdin = open(0, encoding='utf-8', closefd=False)
+			sys.stdout = open(1, 'w', encoding='utf-8', closefd=False, buffering=1)
+			sys.stderr = open(2, 'w', encoding='utf-8', closefd=False, buffering=1)
+			color_init(autoreset=True, strip=not tty)
+			sys.argv = [sys.argv[0]] + argv
+			main()
+		except SystemExit as e:
+			code = e.code if isinstance(e.code, int) else 0 if e.code is None else 1
+		# the client went away (Ctrl-C or a closed terminal); the game was saved after its last clue
+		except (EOFError, BrokenPipeError, ConnectionResetError, KeyboardInterrupt):
+			code = 1
+		except BaseException:
+			traceback.print_exc()
+			code = 1
+		finally:
+			try:
+				atexit._run_exitfuncs()
+				sys.stdout.flush()
+				sys.stderr.flush()
+			except BaseException:
+				pass
+			os._exit(code)
 
 # --------------------------------------------------------------------------------------------------------------------------------------------------------
 
+"""
+parseSeasonRange(text)
+	returns list of season numbers
+
+Reads a season ("39") or an inclusive range of seasons ("36-40").
+"""
+def parseSeasonRange(text):
+	first, _, last = text.partition('-')
+	first = int(first)
+	last = int(last) if last else first
+	return list(range(first, last + 1))
+
+"""
+lookupGame(args)
+	returns gameId, or None if -g or --show doesn't name a game
+
+Finds the game that -g (a game id, or the date it aired as YYYY-MM-DD) or --show (a show number) names. Air dates
+and show numbers are looked up in the Store's index of the season pages read so far, so no request is made; if a
+game isn't in it, says how to fill it in.
+"""
+def lookupGame(args):
+	if args.show is not None:
+		gameId = Store().showGameId(args.show)
+		if gameId is None:
+			print(f"Show #{args.show} isn't in any season you've downloaded. Run --sync-seasons to get every season's games.")
+		return gameId
+
+	date = re.fullmatch(r'(\d{4})-(\d{1,2})-(\d{1,2})', args.game)
+	if date is None:
+		try:
+			gameId = int(args.game)
+		except ValueError:
+			print(f"-g takes a game ID or the date a game aired (YYYY-MM-DD), not {args.game!r}")
+			return None
+		if gameId < 1:
+			print('Game ID must be positive')
+			return None
+		return gameId
+
+	date = f"{int(date[1]):04}-{int(date[2]):02}-{int(date[3]):02}"
+	games = Store().gamesAired(date)
+	if not games:
+		print(f"No game that aired on {date} is in a season you've downloaded. Run --sync-seasons to get every season's games.")
+		return None
+	if len(games) > 1:
+		print(f"{len(games)} games aired on {date}; pick one with --show: " + ", ".join(f"#{show}" for _, show in games))
+		return None
+	return games[0][0]
+
+"""
+search(args)
+
+Prints the clues matching --search (narrowed down by --round, --value and --season), and with --play
+plays them as a board.
+"""
+def search(args):
+	store = Store()
+	clues = store.searchClues(args.search, args.round, args.value, int(args.season) if args.season else None, args.limit)
+	if not clues:
+		print("No clues found.")
+		return
+
+	for gameId, round, value, category, clue, response in clues:
+		print(f"{category} ({round} ${value}, game {gameId})")
+		print(Fore.YELLOW + f"    {clue}")
+		print(f"    {response}\n")
+
+	# a board has one round: the one asked for with --round, or else the best match's
+	if args.play:
+		rounds = [round for _, round, *_ in clues if round != "FJ"]
+		if not rounds:
+			print("Final Jeopardy clues can't be played as a board.")
+			return
+		round = next(name for name, code in ROUND_CODES.items() if code == rounds[0])
+		if len(set(rounds)) > 1:
+			print(f"Playing the {rounds.count(rounds[0])} {'Jeopardy' if rounds[0] == 'J' else 'Double Jeopardy'} results; "
+				f"use --round to play the others.")
+
+		screen = Screen()
+		player = ScriptedPlayer(screen, Path(args.answers).read_text(encoding='utf-8').splitlines()) if args.answers else Player(screen)
+		game = Game(0, GameData.fromClues(f"Search: {args.search}", clues, round), screen, player)
+		game.play()
+
+"""
+review(args)
+
+Goes through the clues due for review (up to --limit), asking each one like a clue in a game and grading the
+answer for ReviewQueue: 4 if it was right, 3 if you overrode a wrong call, 1 if it was wrong and 0 for a pass.
+"""
+def review(args):
+	store = Store()
+	queue = ReviewQueue(store)
+	if not queue.loadDue(args.limit):
+		nextDue = store.nextReviewDue()
+		if nextDue is None:
+			print("No clues to review yet. Clues you miss in a game are saved for review.")
+		else:
+			print(f"Nothing due for review. The next clue is due {time.strftime('%Y-%m-%d %H:%M', time.localtime(nextDue))}.")
+		return
+
+	screen = Screen()
+	player = ScriptedPlayer(screen, Path(args.answers).read_text(encoding='utf-8').splitlines()) if args.answers else Player(screen)
+
+	total = store.countDueReviews(queue.now)
+	reviewed = 0
+	while queue.heap:
+		review = queue.next()
+		_, _, category, round, value, clue, response, _, _, _ = review
+		reviewed += 1
+
+		screen.clear()
+		screen.write(f"\nReview {reviewed} ({len(queue.heap)} to go this session, {total} due)\n")
+		screen.write(f"{category} ({round}" + (f" ${value}" if value else "") + ")")
+		screen.write(Fore.YELLOW + clue + Style.RESET_ALL)
+		screen.write()
+
+		answer = player.respond(None, "Type answer here or press enter to pass: ", response)
+		screen.write()
+
+		passed = answer.strip() == ''
+		if not passed and ResponseMatcher(response).matches(answer):
+			quality = 4
+			screen.write(Back.GREEN + Fore.BLACK + "Correct!" + Style.RESET_ALL)
+		else:
+			screen.write("Correct response: " + (Fore.YELLOW if passed else Fore.RED) + response + Style.RESET_ALL)
+			overridden = player.override(None, "Press enter to continue, or another key and then enter if you actually got it right. ")
+			quality = 3 if overridden else 0 if passed else 1
+
+		days = queue.grade(review, quality)
+		screen.write(f"\nNext review in {days:g} day{'s' if days != 1 else ''}.")
+		player.pause(None, "Press enter to continue.")
+
+	print(f"\nReviewed {reviewed} clues.")
+
+"""
+syncSeasons(args)
+
+Runs Mirror.syncSeasons for --sync-seasons and reports what changed since the last sync.
+"""
+def syncSeasons(args):
+	mirror = Mirror(args.workers or SYNC_WORKERS, args.rate or SYNC_RATE, args.archive_url)
+	before = {season: mirror.store.seasonGameIds(season) for season in mirror.store.seasons()}
+
+	start = time.perf_counter()
+	try:
+		seasonGameIds = mirror.syncSeasons()
+	except OSError as e:
+		print(f"Couldn't sync the seasons: {e}")
+		return
+	elapsed = time.perf_counter() - start
+
+	changed = [season for season, gameIds in seasonGameIds.items() if before.get(season) != gameIds]
+	print(f"Synced {len(seasonGameIds)} seasons ({sum(map(len, seasonGameIds.values()))} games) in {elapsed:.1f} s; "
+		+ (f"updated season{'s' if len(changed) > 1 else ''} {', '.join(map(str, changed))}." if changed else "nothing changed."))
+	print(mirror.fetcher.summary())
+
+"""
+practice(args)
+
+Plays boards of 6 categories drawn from the whole Corpus, narrowed down by --round, --value, --season (a
+season or range of seasons) and the --practice keyword, for as long as you want another one.
+"""
+def practice(args):
+	corpus = Corpus.shared()
+	if corpus is None:
+		print("Practice boards are drawn from the corpus. Download some games with --mirror-season and pack them with --build-corpus first.")
+		return
+
+	gameIds = None
+	if args.season:
+		store = Store()
+		gameIds = {gameId for season in parseSeasonRange(args.season) for gameId in store.seasonGameIds(season)}
+
+	# without --round, a board has a round of each, like a real game
+	index = PracticeIndex(corpus, args.seed)
+	pools = [index.pool(round, args.value, gameIds, args.practice) if args.round in (None, round) else None for round in ("J", "DJ")]
+	if not any(pools):
+		print("No categories match. Try fewer filters, or mirror and pack more seasons.")
+		return
+
+	filters = [f"\"{args.practice}\"" if args.practice else None, args.round, f"${args.value}" if args.value else None,
+		f"season {args.season}" if args.season else None]
+	title = "Practice: " + (", ".join(filter(None, filters)) or "any category")
+
+	screen = Screen()
+	player = ScriptedPlayer(screen, Path(args.answers).read_text(encoding='utf-8').splitlines()) if args.answers else Player(screen)
+	print(f"Drawing from {sum(len(pool) for pool in pools if pool)} categories.")
+
+	game = Game(0, index.board(title, *pools), screen, player)
+	game.play()
+	while player.ask("Play another practice board? Y/N: ").lower() == 'y':
+		game.newGame(0, index.board(title, *pools))
+		game.play()
+
+"""
+serve(args)
+
+Runs a GameServer on --serve ([HOST:]PORT) until Ctrl-C.
+"""
+def serve(args):
+	import asyncio
+	host, _, port = args.serve.rpartition(':')
+	server = GameServer(host, int(port))
+	try:
+		asyncio.run(server.serve(lambda server: print(f"Serving game nights on port {server.port}. Players join with "
+			f"--join HOST:{server.port} --room NAME. Press Ctrl-C to stop.")))
+	except KeyboardInterrupt:
+		print(f"\nStopped with {len(server.rooms)} rooms open.")
+
+"""
+join(args)
+
+Joins --room on the GameServer at --join (HOST[:PORT]) as --name, creating the room with -g's (or --show's) game if it's new.
+"""
+def join(args):
+	import asyncio
+	host, _, port = args.join.partition(':')
+	gameId = None
+	if args.game or args.show is not None:
+		gameId = lookupGame(args)
+		if gameId is None:
+			return
+	client = GameClient(Screen())
+	try:
+		asyncio.run(client.run(host, int(port or SERVER_PORT), args.room, args.name or getpass.getuser(), gameId))
+	except (OSError, KeyboardInterrupt) as e:
+		print(f"\nDisconnected{': ' + str(e) if isinstance(e, OSError) else ''}.")
+
+"""
+daemon(args)
+
+Runs a Daemon until Ctrl-C or SIGTERM, for jeopardy_client.py to hand commands to.
+"""
+def daemon(args):
+	if not Daemon.available():
+		print("--daemon needs Unix domain sockets and fork, which this system doesn't have.")
+		return
+	server = Daemon()
+	print("Warming up...")
+	started = time.perf_counter()
+	server.warm()
+	try:
+		server.run(lambda server: print(f"Ready in {time.perf_counter() - started:.2f}s, listening on {server.path}. "
+			"Run commands with python3 jeopardy_client.py [options]. Press Ctrl-C to stop."))
+	except OSError as e:
+		print(f"Can't start the daemon: {e}.")
+	except KeyboardInterrupt:
+		print(f"\nStopped after {server.served} commands.")
+
+"""
+showStats(args)
+
+Prints the Analytics breakdowns for --stats, over the attempts at categories with the --stats keyword in them
+if one was given.
+"""
+def showStats(args):
+	try:
+		with Profiler.span("import pandas"):
+			import pandas
+	except ImportError:
+		print("--stats needs pandas and numpy: pip install -r requirements.txt")
+		return
+
+	start = time.perf_counter()
+	analytics = Analytics.load(Store(), args.stats)
+	overall = analytics.overall()
+	if not overall["clues"] and not overall["games"]:
+		print("No clues recorded" + (f" in categories with \"{args.stats}\" in them." if args.stats else " yet."))
+		return
+	report = analytics.report()
+	elapsed = time.perf_counter() - start
+
+	print(f"{overall['clues']} clues" + (f" in categories with \"{args.stats}\" in them" if args.stats else "") +
+		f", {overall['accuracy']:.1%} right ({overall['overridden']} overridden), {overall['games']} Final Jeopardy clues")
+	for title, table in report:
+		if len(table):
+			print(f"\n{title}")
+			print(table.to_string(formatters={column: "{:.1%}".format for column in table.columns if column not in ("attempts", "correct")}))
+	print(f"\n({len(analytics.attempts)} attempts analyzed in {elapsed * 1000:.0f} ms)")
+
+"""
+ingest(args)
+
+Runs an Ingester over --ingest with --workers processes and reports what it did.
+"""
+def ingest(args):
+	if not Path(args.ingest).is_dir():
+		print(f"{args.ingest} is not a directory.")
+		return
+
+	ingester = Ingester(args.ingest, args.workers)
+	print(f"Parsing pages in {args.ingest} with {ingester.workers} process{'es' if ingester.workers > 1 else ''}...")
+	start = time.perf_counter()
+	try:
+		ingester.run()
+	except KeyboardInterrupt:
+		print("\nIngest interrupted. Run the same command again to pick up where it stopped.")
+	elapsed = time.perf_counter() - start
+
+	counts = ingester.counts
+	print(f"Added {counts['ingested']} games in {elapsed:.1f} s; {counts['cached']} were already cached" + (f", {counts['quarantined']} page{'s' if counts['quarantined'] > 1 else ''} "
+		f"couldn't be read (moved to {ingester.quarantineDir}, see errors.log there)." if counts['quarantined'] else "."))
+
+"""
+cacheStats()
+
+Reports the size of the GameCache, how well it compresses and how often it has been hit, for --cache-stats.
+"""
+def cacheStats():
+	stats = Store().cacheStats()
+	hits, misses = stats["hits"], stats["misses"]
+
+	print(f"Games cached: {stats['games']}, {stats['bytes'] / 2 ** 20:.1f} MiB of {stats['limit'] / 2 ** 20:g} MiB "
+		f"({stats['bytes'] / stats['limit']:.0%} full)")
+	if stats["bytes"]:
+		print(f"Compression: {stats['rawBytes'] / 2 ** 20:.1f} MiB of game data in {stats['bytes'] / 2 ** 20:.1f} MiB "
+			f"({stats['rawBytes'] / stats['bytes']:.1f}x)")
+	if hits + misses:
+		print(f"Hit rate: {hits / (hits + misses):.1%} ({hits} hits, {misses} misses)")
+	if stats["oldest"] is not None:
+		print(f"Least recently used game: last used {time.strftime('%Y-%m-%d %H:%M', time.localtime(stats['oldest']))}")
+	print(f"Season pages kept for revalidation: {stats['pages']}, {stats['pageBytes'] / 2 ** 10:.0f} KiB compressed")
+
+"""
+buildCorpus()
+
+Packs every game in the GameCache into the Corpus, for --build-corpus, along with the games of the old
+Corpus that have been evicted from the GameCache since. Reading them doesn't count as using them.
+"""
+def buildCorpus():
+	cached = set(GameCache.gameIds())
+	corpus = Corpus.shared()
+	packed = {corpus.gameId(index) for index in range(corpus.games)} if corpus is not None else set()
+
+	def load(gameId):
+		if gameId in cached:
+			try:
+				return GameCache.read(GameCache.path(gameId))
+			except GameCache.readErrors:
+				pass
+		return corpus.game(gameId) if gameId in packed else None
+	games = ((gameId, load(gameId)) for gameId in sorted(cached | packed))
+
+	start = time.perf_counter()
+	gameCount, clueCount = Corpus.build((gameId, data) for gameId, data in games if data is not None)
+	elapsed = time.perf_counter() - start
+
+	size = Corpus.path.stat().st_size
+	print(f"Packed {clueCount} clues from {gameCount} games into {Corpus.path} ({size / 2 ** 20:.1f} MiB) in {elapsed:.1f} s.")
+
+"""
+simulate(args)
+
+Plays --simulate games back to back with a BotPlayer and no terminal I/O, cycling through the cached
+games of --season (or every cached game), and reports how fast they were played. Stats go to a throwaway
+in-memory Store, not your own.
+"""
+def simulate(args):
+	gameIds = GameCache.gameIds()
+	if args.season:
+		cached = set(gameIds)
+		gameIds = [gameId for gameId in Store().seasonGameIds(int(args.season)) if gameId in cached]
+
+	games = [(gameId, GameCache.load(gameId)) for gameId in gameIds]
+	games = [(gameId, data) for gameId, data in games if data is not None]
+	if not games:
+		where = f"season {args.season}" if args.season else "the cache"
+		print(f"No downloaded games in {where}. Download some with --mirror-season first.")
+		return
+
+	stats = Stats(Store(':memory:', legacy=False))
+	game = None
+	scores = []
+	clues = 0
+
+	start = time.perf_counter()
+	for i in range(args.simulate):
+		gameId, data = games[i % len(games)]
+		if game is None:
+			screen = NullScreen()
+			game = Game(gameId, data, screen, BotPlayer(screen, args.accuracy, args.seed), stats)
+		else:
+			game.newGame(gameId, data)
+		game.play()
+
+		scores.append(game.score)
+		clues += sum(clue is not None for round in (data.jeopardyRound, data.doubleJeopardyRound) if round for row in round.clues for clue in row)
+	elapsed = time.perf_counter() - start
+
+	print(f"Played {args.simulate} games ({len(games)} different, {clues} clues) in {elapsed:.2f} s: "
+		f"{args.simulate / elapsed:.1f} games/s, {clues / elapsed:.0f} clues/s")
+	print(f"Average score: {sum(scores) / len(scores):.0f}, best: {max(scores)}, worst: {min(scores)}")
+	stats.close()
+
 def main():
 	parser = argparse.ArgumentParser()
 
 	parser.add_argument('-s', '--season', help='Season you would like to start or continue playing through.')
-	parser.add_argument('-g', '--game', metavar='gameID', help='ID of specific game you would like to play.')
+	parser.add_argument('-g', '--game', metavar='gameID', help='ID of specific game you would like to play, or the date it aired (YYYY-MM-DD).')
+	parser.add_argument('--show', type=int, metavar='N', help='Play show #N (its number on j-archive, e.g. 8961) instead of giving -g.')
+	parser.add_argument('--resume', action='store_true', help='Pick your last unfinished game back up where you left it (and the season it is part of, if any).')
+	parser.add_argument('--prefetch', metavar='N', type=int, default=PREFETCH_DEPTH, help='Number of upcoming season games to load in the background (0 to disable).')
+	parser.add_argument('--mirror-season', metavar='N[-M]', help='Download every game of a season (or range of seasons) for offline play.')
+	parser.add_argument('--sync-seasons', action='store_true', help='Find every season on j-archive and download all of their game lists at once.')
+	parser.add_argument('--ingest', metavar='DIR', help='Add every saved j-archive game page (showgame.php?game_id=N, N.html, ...) in DIR to the game cache.')
+	parser.add_argument('--workers', type=int, help=f'Number of concurrent downloads when mirroring ({MIRROR_WORKERS} by default) or syncing ({SYNC_WORKERS}), or of processes parsing pages for --ingest (one per core).')
+	parser.add_argument('--rate', type=float, help=f'Maximum requests per second when mirroring ({MIRROR_RATE:g} by default) or syncing ({SYNC_RATE:g}).')
+	parser.add_argument('--archive-url', metavar='URL', default=J_ARCHIVE_URL, help='j-archive server to download from.')
+
+	parser.add_argument('--search', metavar='QUERY', help='Search the clues, responses and categories of every downloaded game.')
+	parser.add_argument('--round', choices=['J', 'DJ', 'FJ'], help='Only search (or --practice with) this round.')
+	parser.add_argument('--value', type=int, help='Only search clues of this dollar value (for --practice, categories with a clue of this value).')
+	parser.add_argument('--limit', type=int, default=SEARCH_LIMIT, help='Maximum number of search results, or of clues in a --review session.')
+	parser.add_argument('--play', action='store_true', help='Play the search results as a board.')
+
+	parser.add_argument('--cache-stats', action='store_true', help='Show how many games are cached, how much space they take, how well they compress and how often games are found in the cache.')
+	parser.add_argument('--cache-limit', metavar='MiB', type=float, help=f'Cap the game cache at this size from now on ({GAME_CACHE_LIMIT // 2 ** 20} MiB by default), deleting the games played longest ago to make room.')
+	parser.add_argument('--build-corpus', action='store_true', help='Pack every downloaded game into one file that games are loaded from.')
+	parser.add_argument('--practice', nargs='?', const='', metavar='KEYWORD', help='Play boards of random categories from every packed game (see --build-corpus), optionally only ones with KEYWORD in their name; --round, --value and --season narrow them down.')
+	parser.add_argument('--stats', nargs='?', const='', metavar='KEYWORD', help='Show your accuracy by round, dollar value, Daily Double, season, category word and week (only for categories with KEYWORD in them, if given).')
+	parser.add_argument('--review', action='store_true', help='Review the clues you have missed, spaced out over time (SM-2).')
+	parser.add_argument('--answers', metavar='FILE', help='Read your answers from FILE, one line per prompt, instead of the keyboard.')
+	parser.add_argument('--simulate', metavar='N', type=int, help='Have a bot play N downloaded games (of --season, if given) with no output, and report games per second.')
+	parser.add_argument('--accuracy', type=float, default=0.5, help='Fraction of clues the --simulate bot gets right.')
+	parser.add_argument('--seed', type=int, help='Random seed for the --simulate bot.')
+	parser.add_argument('--serve', nargs='?', const=str(SERVER_PORT), metavar='[HOST:]PORT', help=f'Host game nights: other people join rooms on this server with --join (port {SERVER_PORT} by default).')
+	parser.add_argument('--join', metavar='HOST[:PORT]', help='Play in a room of a --serve server with other people; -g or --show picks the game if the room is new.')
+	parser.add_argument('--room', default='main', help='Room to --join.')
+	parser.add_argument('--name', help='Your name in a --join room (your user name by default).')
+	parser.add_argument('--daemon', action='store_true', help='Stay running with everything loaded, so commands run with jeopardy_client.py start instantly.')
+	parser.add_argument('--profile', nargs='?', const=PROFILE_PATH, metavar='FILE', help=f'Time network, parsing, rendering and stats; writes a Chrome trace to FILE ({PROFILE_PATH} by default) and a summary at exit.')
 
 	args = parser.parse_args()
+	if args.game and args.show is not None:
+		parser.error("-g and --show both pick the game to play; give only one of them")
+
+	Fetcher.sharedFetcher = Fetcher(args.archive_url)
+	if args.profile:
+		Profiler.enable(args.profile)
+		# network metrics, printed just before the Profiler's summary (atexit goes in reverse order)
+		def printFetchSummary():
+			if Fetcher.sharedFetcher.metrics["requests"]:
+				print("\n" + Fetcher.sharedFetcher.summary())
+		atexit.register(printFetchSummary)
+
+	# search downloaded clues (--season narrows the search down instead of starting a season)
+	if args.search:
+		search(args)
+		return
+
+	# download seasons for offline play
+	if args.mirror_season:
+		mirror = Mirror(args.workers or MIRROR_WORKERS, args.rate or MIRROR_RATE, args.archive_url)
+		try:
+			for season in parseSeasonRange(args.mirror_season):
+				mirror.mirrorSeason(season)
+		except KeyboardInterrupt:
+			print("\nMirror interrupted. Run the same command again to pick up where it stopped.")
+
+		print(", ".join(f"{count} {status}" for status, count in mirror.counts.items()))
+		print(mirror.fetcher.summary())
+		return
+
+	# cache size cap, which sticks for every command after this one
+	if args.cache_limit is not None:
+		evicted = GameCache.setLimit(args.cache_limit * 2 ** 20)
+		print(f"Game cache capped at {args.cache_limit:g} MiB" + (f"; evicted {evicted} games." if evicted else "."))
+	if args.cache_stats:
+		cacheStats()
+		return
+
+	# game lists of every season, e.g. once a new season has started
+	if args.sync_seasons:
+		syncSeasons(args)
+		return
+
+	# game pages downloaded some other way
+	if args.ingest:
+		ingest(args)
+		return
+
+	if args.build_corpus:
+		buildCorpus()
+		return
+
+	# boards of categories sampled across seasons (--season narrows the draw down instead of starting a season)
+	if args.practice is not None:
+		if args.round == 'FJ':
+			parser.error("--practice boards are made of Jeopardy and Double Jeopardy categories")
+		practice(args)
+		return
+
+	# performance breakdowns over every recorded clue
+	if args.stats is not None:
+		showStats(args)
+		return
+
+	# spaced-repetition review of missed clues
+	if args.review:
+		review(args)
+		return
+
+	# game nights: several terminals playing the same game
+	if args.serve:
+		serve(args)
+		return
+	if args.join:
+		join(args)
+		return
+
+	# resident process that jeopardy_client.py runs commands in
+	if args.daemon:
+		daemon(args)
+		return
+
+	# bot plays through downloaded games
+	if args.simulate:
+		simulate(args)
+		return
+
+	# with --answers, the answers come from a file instead of the keyboard
+	screen = Screen()
+	if args.answers:
+		player = ScriptedPlayer(screen, Path(args.answers).read_text(encoding='utf-8').splitlines())
+	else:
+		player = Player(screen)
+
+	# an unfinished game is picked back up instead of handing out a new one, and so is its season
+	checkpoint = None
+	season = int(args.season) if args.season else None
+	if args.resume:
+		if args.season or args.game or args.show is not None:
+			parser.error("--resume picks up the game (and season) you left off in; it can't be combined with -s, -g or --show")
+
+		checkpoint = Store().latestCheckpoint()
+		if checkpoint is None:
+			print("No unfinished game to resume.")
+			return
+		_, (_, season, *_) = checkpoint
 
 	# play through season
-	if args.season:
+	if season is not None:
 		print("Loading season data...")
-		gl = GameLog(int(args.season))
-		gameId = gl.getCurrentGameId()
-
-		print("Loading your Jeopardy game...")
-		game = Game(gameId)
-		game.play()
-
-		# do we want to keep playing?
-		keepPlaying = input("Play next game in season? Y/N: ").lower()
-		while keepPlaying == 'y':
+		gl = GameLog(season)
+		if checkpoint is None:
 			gameId = gl.getCurrentGameId()
 
-			print("Loading your Jeopardy game...")
-			game.newGame(gameId)
+		# load the next games while this one is being played
+		prefetcher = Prefetcher(max(args.prefetch, 0))
+		prefetcher.schedule(gl.upcomingGameIds(prefetcher.depth))
+
+		try:
+			if checkpoint is None:
+				print("Loading your Jeopardy game...")
+				game = Game(gameId, screen=screen, player=player, season=season)
+			else:
+				print("Resuming your Jeopardy game...")
+				game = Game.resume(checkpoint, screen, player)
 			game.play()
-			keepPlaying = input("Play next game in season? Y/N: ").lower()
 
+			# do we want to keep playing?
+			keepPlaying = player.ask("Play next game in season? Y/N: ").lower()
+			while keepPlaying == 'y':
+				gameId = gl.getCurrentGameId()
+				prefetcher.schedule(gl.upcomingGameIds(prefetcher.depth))
+
+				print("Loading your Jeopardy game...")
+				game.newGame(gameId, prefetcher.get(gameId))
+				game.play()
+				keepPlaying = player.ask("Play next game in season? Y/N: ").lower()
+		finally:
+			prefetcher.cancel()
+
+
+	# pick one unfinished game back up
+	elif checkpoint is not None:
+		print("Resuming your Jeopardy game...")
+		game = Game.resume(checkpoint, screen, player)
+		game.play()
 
 	# play one game only
-	elif args.game:
-		gameId = int(args.game)
-		if gameId < 1:
-			print('Game ID must positive')
+	elif args.game or args.show is not None:
+		gameId = lookupGame(args)
+		if gameId is None:
 			sys.exit()
-		
+
 		print("Loading your Jeopardy game...")
-		game = Game(gameId)
+		game = Game(gameId, screen=screen, player=player)
 		game.play()
 
 	print("\nOh boy, that was fun! Bye!")
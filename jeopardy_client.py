@@ -0,0 +1,77 @@
+# Thin client for jeopardy.py --daemon: hands its arguments to the daemon over cache/jeopardy.sock and relays the
+# terminal both ways. It only uses the standard library and imports as little as it can, since how fast it starts
+# is the whole point (json and shutil alone would pull in re). With no daemon running, it runs jeopardy.py itself.
+import sys, os, socket, struct, select
+
+# must match Daemon.path and DAEMON_HEADER in jeopardy.py
+SOCKET_PATH = os.path.join('.', 'cache', 'jeopardy.sock')
+HEADER = struct.Struct('!I')
+
+"""
+connect()
+	returns connected socket, or None if no daemon is listening
+
+Connects to the daemon listening in the current directory's cache folder.
+"""
+def connect():
+	if not hasattr(socket, 'AF_UNIX'):
+		return None
+	client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	try:
+		client.connect(SOCKET_PATH)
+	except OSError:
+		client.close()
+		return None
+	return client
+
+"""
+relay(client)
+
+Copies the terminal's input to the daemon and the daemon's output to the terminal until the daemon closes the
+connection. When input runs out (e.g. answers piped in from a file), the daemon is told so it sees end of file too.
+"""
+def relay(client):
+	sources = [client, sys.stdin.fileno()]
+	while True:
+		readable, _, _ = select.select(sources, [], [])
+		if client in readable:
+			data = client.recv(65536)
+			if not data:
+				return
+			view = memoryview(data)
+			while view:
+				view = view[os.write(sys.stdout.fileno(), view):]
+		if sys.stdin.fileno() in readable:
+			data = os.read(sys.stdin.fileno(), 65536)
+			if data:
+				client.sendall(data)
+			else:
+				client.shutdown(socket.SHUT_WR)
+				sources.remove(sys.stdin.fileno())
+
+def main():
+	client = connect()
+	if client is None:
+		script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jeopardy.py')
+		os.execv(sys.executable, [sys.executable, script] + sys.argv[1:])
+
+	try:
+		columns, lines = os.get_terminal_size(sys.stdout.fileno())
+	except OSError:
+		columns, lines = 80, 24
+	fields = [os.getcwd(), str(columns), str(lines), "1" if sys.stdout.isatty() else ""] + sys.argv[1:]
+	header = b"\0".join(map(os.fsencode, fields))
+	try:
+		client.sendall(HEADER.pack(len(header)) + header)
+		relay(client)
+	# the game is saved after every clue, so --resume picks it back up
+	except KeyboardInterrupt:
+		print()
+	except (BrokenPipeError, ConnectionResetError):
+		pass
+	finally:
+		client.close()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,34 @@
+import sys, threading
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+PAGES_DIR = TESTS_DIR.parent / 'benchmarks' / 'pages'
+
+sys.path.insert(0, str(TESTS_DIR.parent))
+import jeopardy
+
+# every test gets a cache folder of its own, so nothing touches (or depends on) the real cache/
+@pytest.fixture(autouse=True)
+def cacheDir(tmp_path, monkeypatch):
+	cacheDir = tmp_path / 'cache'
+	monkeypatch.setattr(jeopardy.Store, 'path', cacheDir / 'jeopardy.db')
+	monkeypatch.setattr(jeopardy.Store, 'threadStores', threading.local())
+	monkeypatch.setattr(jeopardy.GameCache, 'cacheDir', cacheDir / 'games')
+	monkeypatch.setattr(jeopardy.Corpus, 'path', cacheDir / 'corpus.bin')
+	monkeypatch.setattr(jeopardy.Corpus, 'sharedCorpus', None)
+	return cacheDir
+
+@pytest.fixture
+def store():
+	return jeopardy.Store(legacy=False)
+
+# GameData of the saved game pages, by page name
+@pytest.fixture(scope='session')
+def games():
+	return {page.stem: jeopardy.Game.parseGame(page.read_text(encoding='utf-8')) for page in sorted(PAGES_DIR.glob('game_*.html'))}
+
+@pytest.fixture(scope='session')
+def seasonPage():
+	return (PAGES_DIR / 'season_39.html').read_text(encoding='utf-8')
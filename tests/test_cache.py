@@ -0,0 +1,107 @@
+import gzip, itertools, json
+
+import pytest
+
+import jeopardy
+
+# time.time() that moves on a second every call, so every save and load is used at a time of its own
+@pytest.fixture
+def clock(monkeypatch):
+	ticks = itertools.count(1700000000)
+	monkeypatch.setattr(jeopardy.time, 'time', lambda: next(ticks))
+
+def test_least_recently_used_games_are_evicted(store, clock):
+	store.setCacheLimit(1000)
+	assert store.addCachedGames([(1, 300, 900), (2, 300, 900), (3, 300, 900)]) == []
+
+	store.recordCacheLoad(1, True) # game 2 is now the one used longest ago
+	assert store.addCachedGames([(4, 300, 900)]) == [2]
+	assert store.cachedGameIds() == [1, 3, 4]
+
+	assert store.addCachedGames([(5, 500, 900)]) == [3, 1]
+	assert store.cachedGameIds() == [4, 5]
+
+def test_games_just_added_are_never_evicted(store, clock):
+	store.setCacheLimit(1000)
+	store.addCachedGames([(1, 300, 900)])
+
+	# the batch is over the cap by itself: everything else goes, but the batch stays
+	assert store.addCachedGames([(2, 800, 900), (3, 800, 900)]) == [1]
+	assert store.cachedGameIds() == [2, 3]
+
+def test_lowering_the_limit_evicts_right_away(store, clock):
+	store.addCachedGames([(1, 300, 900), (2, 300, 900), (3, 300, 900)])
+	assert store.cacheLimit() == jeopardy.GAME_CACHE_LIMIT
+
+	assert store.setCacheLimit(650) == [1]
+	assert store.cacheLimit() == 650
+	assert store.setCacheLimit(0) == [2, 3]
+
+def test_misses_do_not_refresh_a_game(store, clock):
+	store.setCacheLimit(600)
+	store.addCachedGames([(1, 300, 900), (2, 300, 900)])
+	store.recordCacheLoad(1, False)
+	store.recordCacheLoad(2, True)
+
+	assert store.addCachedGames([(3, 300, 900)]) == [1]
+	stats = store.cacheStats()
+	assert (stats["games"], stats["bytes"], stats["rawBytes"], stats["limit"]) == (2, 600, 1800, 600)
+	assert (stats["hits"], stats["misses"]) == (1, 1)
+
+def test_evicted_games_are_deleted(games, clock):
+	data = games['game_standard']
+	jeopardy.GameCache.save(1, data)
+	size = jeopardy.GameCache.path(1).stat().st_size
+	jeopardy.GameCache.setLimit(2 * size)
+	jeopardy.GameCache.save(2, data)
+
+	assert jeopardy.GameCache.load(1).toDict() == data.toDict()
+	jeopardy.GameCache.save(3, data)
+
+	assert jeopardy.GameCache.gameIds() == [1, 3]
+	assert not jeopardy.GameCache.path(2).exists()
+	assert jeopardy.GameCache.load(2) is None
+	assert jeopardy.GameCache.contains(1) and not jeopardy.GameCache.contains(2)
+
+	# evicted games stay searchable
+	assert {gameId for gameId, *_ in jeopardy.Store.local().searchClues(data.final.category)} == {1, 2, 3}
+
+def test_set_limit_deletes_files(games, clock):
+	data = games['game_standard']
+	jeopardy.GameCache.saveMany([(1, data), (2, data), (3, data)])
+
+	assert jeopardy.GameCache.setLimit(1) == 3
+	assert jeopardy.GameCache.gameIds() == []
+	assert not any(jeopardy.GameCache.cacheDir.iterdir())
+
+def test_out_of_date_entries_are_misses(games):
+	data = games['game_standard']
+	jeopardy.GameCache.save(1, data)
+	path = jeopardy.GameCache.path(1)
+	old = data.toDict()
+	old["version"] = jeopardy.GAME_CACHE_VERSION - 1
+	path.write_bytes(gzip.compress(json.dumps(old).encode('utf-8')))
+
+	misses = jeopardy.GameCache.misses
+	assert jeopardy.GameCache.load(1) is None
+	assert jeopardy.GameCache.misses == misses + 1
+
+def test_unfinished_games_are_not_evicted(store, games, clock):
+	data = games['game_standard']
+	jeopardy.GameCache.save(1, data)
+	store.saveCheckpoint(None, (1, None, "J", 0, 0, 0, 0, None))
+	size = jeopardy.GameCache.path(1).stat().st_size
+	jeopardy.GameCache.setLimit(2 * size)
+	jeopardy.GameCache.save(2, data)
+	jeopardy.GameCache.save(3, data)
+
+	# game 1 was used longest ago, but --resume needs it
+	assert jeopardy.GameCache.gameIds() == [1, 3]
+	assert jeopardy.GameCache.path(1).exists()
+	assert jeopardy.GameCache.load(1).toDict() == data.toDict()
+
+	# once the game is over, it goes like any other
+	assert jeopardy.GameCache.setLimit(0) == 1
+	store.saveCheckpoint(store.latestCheckpoint()[0], None)
+	assert jeopardy.GameCache.setLimit(0) == 1
+	assert jeopardy.GameCache.gameIds() == []
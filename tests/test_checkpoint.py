@@ -0,0 +1,104 @@
+import pytest
+
+import jeopardy
+
+class Quit(Exception):
+	pass
+
+# BotPlayer that walks away from the game when it's asked for answer #{answers} + 1, like a Ctrl-C mid-clue
+class QuittingBot(jeopardy.BotPlayer):
+	def __init__(self, answers=None):
+		super().__init__(jeopardy.NullScreen(), 0.5, seed=1)
+		self.answers = answers
+
+	def respond(self, game, prompt, response):
+		if self.answers == 0:
+			raise Quit()
+		if self.answers is not None:
+			self.answers -= 1
+		return super().respond(game, prompt, response)
+
+@pytest.fixture
+def stats(store):
+	stats = jeopardy.Stats(store)
+	stats.closed = True # nothing to show at exit
+	return stats
+
+def clueCount(data):
+	return sum(clue is not None for round in (data.jeopardyRound, data.doubleJeopardyRound) for row in round.clues for clue in row)
+
+# plays game #{gameId} until {answers} clues have been answered, then picks it back up from its checkpoint
+def quitAndResume(gameId, data, stats, answers):
+	game = jeopardy.Game(gameId, data, jeopardy.NullScreen(), QuittingBot(answers), stats, season=39)
+	with pytest.raises(Quit):
+		game.play()
+
+	checkpoint = stats.store.latestCheckpoint()
+	assert checkpoint is not None
+	return game, jeopardy.Game.resume(checkpoint, jeopardy.NullScreen(), QuittingBot(), stats)
+
+def assertSameGame(game, resumed):
+	assert (resumed.gameId, resumed.season, resumed.round, resumed.score) == (game.gameId, game.season, game.round, game.score)
+	assert (resumed.boardState, resumed.boardMask, resumed.cluesRemaining) == (game.boardState, game.boardMask, game.cluesRemaining)
+	assert (resumed.categories, resumed.clues, resumed.autoMode) == (game.categories, game.clues, game.autoMode)
+	assert resumed.checkpointId == game.checkpointId
+
+	# the quit game had already moved on to the clue it was giving; the resumed one gets there from the last one played
+	resumed.stepToNextClue()
+	assert (resumed.currentCtg, resumed.currentAmt) == (game.currentCtg, game.currentAmt)
+
+def test_resume_in_jeopardy_round(stats, games):
+	data = games['game_standard']
+	jeopardy.GameCache.save(7001, data)
+	game, resumed = quitAndResume(7001, data, stats, 7)
+
+	assert game.round == "jeopardy_round"
+	assertSameGame(game, resumed)
+
+def test_resume_in_double_jeopardy_round(stats, games):
+	data = games['game_standard']
+	jeopardy.GameCache.save(7001, data)
+	jeopardyClues = sum(clue is not None for row in data.jeopardyRound.clues for clue in row)
+	game, resumed = quitAndResume(7001, data, stats, jeopardyClues + 4)
+
+	assert game.round == "double_jeopardy_round"
+	assertSameGame(game, resumed)
+
+def test_resume_in_final_jeopardy(stats, games):
+	data = games['game_standard']
+	jeopardy.GameCache.save(7001, data)
+	game, resumed = quitAndResume(7001, data, stats, clueCount(data))
+
+	assert resumed.round == game.round == "final_jeopardy_round"
+	assert resumed.score == game.score
+
+# boards with no game id of their own (search results, practice boards) keep their data in the checkpoint
+def test_resume_board_without_game_id(stats, games):
+	data = games['game_missing_clues']
+	game, resumed = quitAndResume(0, data, stats, 5)
+
+	assertSameGame(game, resumed)
+	assert resumed.data.toDict() == data.toDict()
+
+def test_resumed_game_plays_every_clue_once(stats, store, games):
+	data = games['game_standard']
+	jeopardy.GameCache.save(7001, data)
+	_, resumed = quitAndResume(7001, data, stats, 20)
+	resumed.play()
+
+	attempts = store.db.execute("SELECT round, category, value FROM attempts WHERE game_id = 7001").fetchall()
+	assert len(attempts) == len(set(attempts)) == clueCount(data) + 1
+	assert store.latestCheckpoint() is None
+	assert store.totals()["GamesPlayed"] == 1
+
+def test_checkpoint_is_kept_with_every_attempt(stats, store, games):
+	data = games['game_standard']
+	game = jeopardy.Game(7001, data, jeopardy.NullScreen(), QuittingBot(3), stats)
+	with pytest.raises(Quit):
+		game.play()
+
+	# one checkpoint for the game, updated in place, with the three clues played off its board
+	assert store.db.execute("SELECT count(*) FROM checkpoints").fetchone()[0] == 1
+	checkpointId, (gameId, season, round, board, score, *_) = store.latestCheckpoint()
+	assert (checkpointId, gameId, season, round, score) == (game.checkpointId, 7001, None, "J", game.score)
+	assert bin(board).count('1') == game.cluesRemaining == sum(clue is not None for row in data.jeopardyRound.clues for clue in row) - 3
@@ -0,0 +1,88 @@
+import argparse, sqlite3, zlib
+
+import pytest
+
+import jeopardy
+
+@pytest.fixture
+def season(store, seasonPage):
+	games = jeopardy.GameLog.parseSeasonPage(seasonPage)
+	store.saveSeasonGames(39, games)
+	return games
+
+def lookup(game=None, show=None):
+	return jeopardy.lookupGame(argparse.Namespace(game=game, show=show))
+
+def test_season_page_games_are_read_in_order(season):
+	assert len(season) == 230
+	assert season[0] == (7500, 8701, "2022-09-12")
+	assert [show for _, show, _ in season] == list(range(8701, 8931))
+	assert [aired for _, _, aired in season] == sorted(aired for _, _, aired in season)
+
+def test_show_number_lookup(store, season):
+	for gameId, show, _ in season:
+		assert store.showGameId(show) == gameId
+	assert lookup(show=8961) is None
+
+def test_air_date_lookup(season):
+	assert lookup("2022-09-12") == 7500
+	# dates don't need leading zeroes
+	assert lookup("2023-7-28") == 7729
+	assert lookup("2022-09-10") is None
+
+def test_game_id_is_passed_through(store):
+	assert lookup("7001") == 7001
+	assert lookup("0") is None
+
+@pytest.mark.parametrize("game", ["2023/09/11", "abc", "12.5", ""])
+def test_neither_game_id_nor_date(store, game, capsys):
+	assert lookup(game) is None
+	assert "YYYY-MM-DD" in capsys.readouterr().out
+
+def test_game_and_show_are_not_combined(monkeypatch, capsys):
+	monkeypatch.setattr(jeopardy.sys, 'argv', ['jeopardy.py', '-g', '7001', '--show', '8701'])
+	with pytest.raises(SystemExit):
+		jeopardy.main()
+	assert "-g and --show" in capsys.readouterr().err
+
+def test_two_games_on_one_day(store, season, capsys):
+	store.saveSeasonGames(40, [(9000, 8702, "2022-09-13")])
+	assert store.gamesAired("2022-09-13") == [(7501, 8702), (9000, 8702)]
+
+	assert lookup("2022-09-13") is None
+	assert "2 games aired on 2022-09-13" in capsys.readouterr().out
+
+def test_resyncing_a_season_replaces_its_games(store, season):
+	store.saveSeasons({39: season[:10], 40: [(9000, 9001, "2023-09-11")]})
+
+	assert store.seasons() == [39, 40]
+	assert store.seasonGames(39) == season[:10]
+	assert store.showGameId(8930) is None
+	assert store.showGameId(9001) == 9000
+
+# a database from before show numbers and air dates, with season 39's page kept for revalidation
+def test_shows_are_filled_in_from_kept_season_pages(cacheDir, seasonPage):
+	cacheDir.mkdir()
+	db = sqlite3.connect(cacheDir / 'jeopardy.db')
+	db.executescript("""
+		CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+		INSERT INTO meta VALUES ('version', 4);
+		CREATE TABLE season_games (season INTEGER NOT NULL, position INTEGER NOT NULL, game_id INTEGER NOT NULL, PRIMARY KEY (season, position));
+		CREATE TABLE responses (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, fetched INTEGER NOT NULL, body BLOB NOT NULL);
+	""")
+	games = jeopardy.GameLog.parseSeasonPage(seasonPage)
+	db.executemany("INSERT INTO season_games VALUES (39, ?, ?)", [(position, gameId) for position, (gameId, _, _) in enumerate(games)])
+	db.executemany("INSERT INTO season_games VALUES (38, ?, ?)", [(0, 7400), (1, 7401)])
+	db.execute("INSERT INTO responses VALUES (?, NULL, NULL, 0, ?)",
+		(f"{jeopardy.J_ARCHIVE_URL}/showseason.php?season=39", zlib.compress(seasonPage.encode('utf-8'))))
+	db.commit()
+	db.close()
+
+	store = jeopardy.Store()
+
+	assert store.seasonGames(39) == games
+	# season 38's page wasn't kept: its games get their shows the next time it's read
+	assert store.seasonGames(38) == [(7400, None, None), (7401, None, None)]
+	indexes = {name for _, name, *_ in store.db.execute("PRAGMA index_list(season_games)")}
+	assert {"season_games_show", "season_games_aired"} <= indexes
+	assert int(store.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]) == jeopardy.STORE_VERSION
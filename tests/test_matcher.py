@@ -0,0 +1,66 @@
+import pytest
+
+import jeopardy
+
+@pytest.mark.parametrize("text, normalized", [
+	("What is the Eiffel Tower?", "eiffel tower"),
+	("who are The Beatles", "beatles"),
+	("Simon & Garfunkel", "simon and garfunkel"),
+	("  to  be, or not to be  ", "be or not to be"),
+	("an apple", "apple"),
+	# "what is" only goes when there's something after it
+	("What is", "what is"),
+])
+def test_normalize(text, normalized):
+	assert jeopardy.ResponseMatcher.normalize(text) == normalized
+
+@pytest.mark.parametrize("response, answer", [
+	("the Eiffel Tower", "eiffel tower"),
+	("the Eiffel Tower", "What is the Eiffel Tower?"),
+	("(Emily) Dickinson", "Dickinson"),
+	("(Emily) Dickinson", "emily dickinson"),
+	("Comet (or Quartz)", "quartz"),
+	("Comet (or Quartz)", "comet"),
+	("Truman (Harry S. Truman accepted)", "Harry S Truman"),
+	("Mississippi", "Missisippi"),
+	("Leonardo da Vinci", "leonardo davinci"),
+])
+def test_accepted_answers(response, answer):
+	assert jeopardy.ResponseMatcher(response).matches(answer)
+
+@pytest.mark.parametrize("response, answer", [
+	("the Eiffel Tower", ""),
+	("the Eiffel Tower", "Big Ben"),
+	# short responses allow no typos, longer ones at most MATCH_MAX_EDITS
+	("Ohio", "Iowa"),
+	("Mars", "Mar"),
+	("Mississippi River", "Misisipi Rivr"),
+	# responses with numbers have to be exact
+	("1984", "1985"),
+	("Apollo 13", "Apollo 11"),
+])
+def test_rejected_answers(response, answer):
+	assert not jeopardy.ResponseMatcher(response).matches(answer)
+
+def test_typos_allowed_grow_with_the_response():
+	matcher = jeopardy.ResponseMatcher("Constantinople") # 14 characters: 2 typos
+	assert matcher.matches("Konstantinople")
+	assert matcher.matches("Konstantinopl")
+	assert not matcher.matches("Konstantinopel")
+
+	matcher = jeopardy.ResponseMatcher("the Rosetta Stone and the Nile Delta") # long, but never more than MATCH_MAX_EDITS
+	assert matcher.matches("roseta ston and the nile delt")
+	assert not matcher.matches("roseta ston and th nile delt")
+
+@pytest.mark.parametrize("a, b, maxDistance, within", [
+	("kitten", "sitting", 3, True),
+	("kitten", "sitting", 2, False),
+	("", "abc", 3, True),
+	("abc", "", 2, False),
+	("flaw", "lawn", 2, True),
+	("abcdef", "abcdef", 0, True),
+	("abcdefgh", "ab", 3, False),
+])
+def test_within_distance(a, b, maxDistance, within):
+	assert jeopardy.ResponseMatcher.withinDistance(a, b, maxDistance) == within
+	assert jeopardy.ResponseMatcher.withinDistance(b, a, maxDistance) == within
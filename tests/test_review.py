@@ -0,0 +1,78 @@
+import pytest
+
+import jeopardy
+
+DAY = 86400
+NOW = 1700000000
+
+# three clues of the standard game, missed so they came due a day, two days and three days before NOW
+@pytest.fixture
+def missed(store, games):
+	data = games['game_standard']
+	store.indexGame(7001, data)
+	clues = [clue[0] for clue in data.jeopardyRound.clues[0] if clue][:3]
+	for daysAgo, clue in zip((1, 2, 3), clues):
+		store.addReview(7001, clue, NOW - daysAgo * DAY - jeopardy.REVIEW_FIRST_INTERVAL * DAY)
+	return clues
+
+def test_schedule_intervals_grow():
+	schedule = jeopardy.ReviewQueue.schedule
+	interval, ease, repetitions = schedule(0, 2.5, 0, 5)
+	assert (interval, repetitions) == (jeopardy.REVIEW_FIRST_INTERVAL, 1)
+	interval, ease, repetitions = schedule(interval, ease, repetitions, 5)
+	assert (interval, repetitions) == (jeopardy.REVIEW_SECOND_INTERVAL, 2)
+	interval, ease, repetitions = schedule(interval, ease, repetitions, 5)
+	assert (interval, ease, repetitions) == (round(6 * 2.8, 1), pytest.approx(2.8), 3)
+
+@pytest.mark.parametrize("quality, ease", [(5, 2.6), (4, 2.5), (3, 2.36)])
+def test_schedule_ease_follows_the_grade(quality, ease):
+	assert jeopardy.ReviewQueue.schedule(6, 2.5, 2, quality)[1] == pytest.approx(ease)
+
+def test_schedule_miss_starts_over():
+	assert jeopardy.ReviewQueue.schedule(40, 2.2, 5, 2) == (jeopardy.REVIEW_FIRST_INTERVAL, 2.2, 0)
+	assert jeopardy.ReviewQueue.schedule(40, jeopardy.REVIEW_MIN_EASE, 5, 3)[1] == jeopardy.REVIEW_MIN_EASE
+
+def test_missing_a_clue_again_lowers_its_ease(store, missed):
+	store.addReview(7001, missed[0], NOW)
+	ease, lapses, due = store.db.execute("SELECT r.ease, r.lapses, r.due FROM reviews r JOIN clues c ON c.id = r.clue_id "
+		"WHERE c.clue = ?", (missed[0],)).fetchone()
+	assert (ease, lapses, due) == (pytest.approx(jeopardy.REVIEW_EASE - 0.2), 1, NOW + jeopardy.REVIEW_FIRST_INTERVAL * DAY)
+
+def test_clues_of_unindexed_games_are_not_reviewed(store):
+	store.addReview(404, "a clue of a simulated game", NOW)
+	assert store.nextReviewDue() is None
+
+def test_only_due_clues_are_loaded_soonest_first(store, missed):
+	store.addReview(7001, missed[1], NOW) # missed again just now: due tomorrow
+	queue = jeopardy.ReviewQueue(store, NOW)
+
+	assert queue.loadDue(10) == 2
+	assert [queue.next()[5] for _ in range(2)] == [missed[2], missed[0]]
+	assert store.countDueReviews(NOW) == 2
+	assert store.nextReviewDue() == NOW - 3 * DAY
+
+def test_grading_reschedules(store, missed):
+	queue = jeopardy.ReviewQueue(store, NOW)
+	queue.loadDue(10)
+	review = queue.next()
+
+	assert queue.grade(review, 5) == jeopardy.REVIEW_FIRST_INTERVAL
+	assert store.countDueReviews(NOW) == 2
+	assert store.dueReviews(NOW + DAY, 10)[-1][1:] == (review[1], *review[2:7], jeopardy.REVIEW_FIRST_INTERVAL, pytest.approx(2.6), 1)
+
+def test_misses_come_back_at_the_end_of_the_session(store, missed):
+	queue = jeopardy.ReviewQueue(store, NOW)
+	queue.loadDue(10)
+	first = queue.next()
+	queue.grade(first, 1)
+
+	# the two clues that were due come first, then the missed one once more
+	assert [queue.next()[5] for _ in range(2)] == [missed[1], missed[0]]
+	again = queue.next()
+	assert again[5] == first[5] and queue.relearned == 1 and not queue.heap
+
+	# it was already rescheduled the first time round, so answering it now changes nothing
+	before = store.db.execute("SELECT due, interval, ease, repetitions FROM reviews WHERE clue_id = ?", (first[1],)).fetchone()
+	queue.grade(again, 5)
+	assert store.db.execute("SELECT due, interval, ease, repetitions FROM reviews WHERE clue_id = ?", (first[1],)).fetchone() == before
+	assert before == (NOW + jeopardy.REVIEW_FIRST_INTERVAL * DAY, jeopardy.REVIEW_FIRST_INTERVAL, jeopardy.REVIEW_EASE, 0)
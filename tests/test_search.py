@@ -0,0 +1,73 @@
+import jeopardy
+
+# a game with one clue per category, "{word} single clue {row}" in J and "{word} double clue {row}" in DJ, and a Final Jeopardy
+def smallGame(word):
+	def roundData(name):
+		categories = tuple(f"{word.upper()} {name} {row}" for row in range(6))
+		clues = tuple(tuple((f"{word} {name} clue {row}", f"{word} response {row}") if col == row % 5 else None for col in range(5)) for row in range(6))
+		return jeopardy.RoundData(categories, clues, (), ())
+	final = jeopardy.FinalData(f"{word.upper()} FINAL", f"{word} final clue", f"{word} final response", ())
+	return jeopardy.GameData(f"{word} game", roundData("single"), roundData("double"), final)
+
+def test_every_word_has_to_match(store):
+	store.indexGame(1, smallGame("apple"))
+	store.indexGame(2, smallGame("banana"))
+
+	assert {result[0] for result in store.searchClues("final")} == {1, 2}
+	assert [result[4] for result in store.searchClues("banana final clue")] == ["banana final clue"]
+	assert store.searchClues("apple banana") == []
+
+def test_results_are_narrowed_down(store):
+	store.indexGame(1, smallGame("apple"))
+	store.indexGame(2, smallGame("banana"))
+	store.saveSeasonGames(39, [(2, 8000, "2022-09-12")])
+
+	assert {result[1] for result in store.searchClues("apple", round="DJ")} == {"DJ"}
+	assert [(result[1], result[2]) for result in store.searchClues("apple", round="J", value=600)] == [("J", 600)]
+	assert [result[2] for result in store.searchClues("apple", round="FJ")] == [0]
+	assert {result[0] for result in store.searchClues("response", season=39)} == {2}
+	assert len(store.searchClues("response", limit=3)) == 3
+
+def test_query_punctuation_is_not_fts_syntax(store):
+	store.indexGame(1, smallGame("apple"))
+
+	assert store.searchClues("") == []
+	for query in ['apple"', 'apple AND', 'apple*', '(apple', 'NEAR(apple', "apple's"]:
+		store.searchClues(query)
+
+def test_games_are_only_indexed_once(store):
+	store.indexGame(1, smallGame("apple"))
+	store.indexGames([(1, smallGame("apple")), (2, smallGame("banana"))])
+
+	assert len(store.searchClues("apple final")) == 1
+	assert store.db.execute("SELECT count(*) FROM clues").fetchone()[0] == 2 * (6 + 6 + 1)
+
+def test_games_missing_rounds_are_indexed(store):
+	data = smallGame("apple")
+	store.indexGame(1, jeopardy.GameData(data.title, data.jeopardyRound, None, None))
+
+	assert {result[1] for result in store.searchClues("apple")} == {"J"}
+
+def test_search_results_make_a_board_of_their_round(store):
+	store.indexGame(1, smallGame("apple"))
+	store.indexGame(2, smallGame("banana"))
+	clues = store.searchClues("clue")
+
+	board = jeopardy.GameData.fromClues("Search", clues, "double_jeopardy_round")
+	assert board.jeopardyRound is None and board.final is None
+	roundData = board.doubleJeopardyRound
+	assert len(roundData.categories) == 6
+	for row, cells in enumerate(roundData.clues):
+		for col, clue in enumerate(cells):
+			if clue is not None:
+				# the clue is in the column of its value, and its source game is kept
+				gameId, _, value = next(result[:3] for result in clues if result[4] == clue[0])
+				assert jeopardy.DOLLAR_AMOUNTS["double_jeopardy_round"][col] == value
+				assert roundData.sources[row][col] == gameId
+				assert "double" in clue[0]
+
+def test_search_results_of_another_round_make_no_board(store):
+	store.indexGame(1, smallGame("apple"))
+
+	assert jeopardy.GameData.fromClues("Search", store.searchClues("final"), "jeopardy_round") is None
+	assert jeopardy.GameData.fromClues("Search", store.searchClues("double"), "jeopardy_round") is None
@@ -0,0 +1,93 @@
+import json, time
+
+import jeopardy
+
+EVENTS = [
+	"1700000000,5000,J,HISTORY,200,0,1,0\n",
+	"1700000001,5000,J,HISTORY,400,1,0,0\n",
+	"1700000002,5000,DJ,SCIENCE,800,1,1,1\n",
+	"1700000003,5000,FJ,AUTHORS,0,0,1,0\n",
+]
+
+def writeLegacyCache(cacheDir, snapshot=None):
+	cacheDir.mkdir(parents=True, exist_ok=True)
+	(cacheDir / '39.csv').write_text("7001,7002,7003\n")
+	(cacheDir / '40.csv').write_text("8001,8002\n")
+	(cacheDir / 'gamelog.csv').write_text("0\n" * 38 + "2\n1\n")
+	(cacheDir / 'events.log').write_text(",".join(jeopardy.EVENT_COLUMNS) + "\n" + "".join(EVENTS))
+	(cacheDir / 'stats.csv').write_text("GamesPlayed,CorrectResponseTotal,CorrectDailyDoubleTotal,CorrectFinalJeopardyTotal\n"
+		"2,70,3,1\n")
+	if snapshot is not None:
+		(cacheDir / 'stats_snapshot.json').write_text(json.dumps(snapshot))
+
+def test_legacy_cache_is_imported(cacheDir):
+	writeLegacyCache(cacheDir)
+	store = jeopardy.Store()
+
+	assert store.seasonGameIds(39) == [7001, 7002, 7003]
+	assert store.seasonGameIds(40) == [8001, 8002]
+	assert (store.progress(39), store.progress(40), store.progress(1)) == (2, 1, 0)
+	assert store.db.execute("SELECT count(*) FROM attempts").fetchone()[0] == len(EVENTS)
+
+	# stats.csv only had correct answers; attempts are estimated at 60 clues, 3 Daily Doubles per game
+	assert store.totals() == {
+		'GamesPlayed': 2 + 1, 'CluesAttempted': 120 + 3, 'CorrectResponseTotal': 70 + 2, 'DailyDoublesAttempted': 6 + 2,
+		'CorrectDailyDoubleTotal': 3 + 1, 'CorrectFinalJeopardyTotal': 1 + 1, 'OverriddenTotal': 1
+	}
+
+def test_snapshot_only_counts_events_past_its_offset(cacheDir):
+	header = ",".join(jeopardy.EVENT_COLUMNS) + "\n"
+	totals = {'GamesPlayed': 10, 'CluesAttempted': 600, 'CorrectResponseTotal': 400}
+	writeLegacyCache(cacheDir, {'totals': totals, 'offset': len(header) + len(EVENTS[0]) + len(EVENTS[1])})
+	store = jeopardy.Store()
+
+	# every event is imported as an attempt, but only the last two are added to the snapshot's totals
+	assert store.db.execute("SELECT count(*) FROM attempts").fetchone()[0] == len(EVENTS)
+	assert store.totals() == {
+		'GamesPlayed': 11, 'CluesAttempted': 601, 'CorrectResponseTotal': 401, 'DailyDoublesAttempted': 1,
+		'CorrectDailyDoubleTotal': 1, 'CorrectFinalJeopardyTotal': 1, 'OverriddenTotal': 1
+	}
+
+def test_migrations_only_run_once(cacheDir):
+	writeLegacyCache(cacheDir)
+	totals = jeopardy.Store().totals()
+
+	store = jeopardy.Store()
+	assert store.totals() == totals
+	assert store.db.execute("SELECT count(*) FROM attempts").fetchone()[0] == len(EVENTS)
+	assert int(store.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]) == jeopardy.STORE_VERSION
+
+def test_new_store_skips_legacy_import(cacheDir):
+	writeLegacyCache(cacheDir)
+	store = jeopardy.Store(legacy=False)
+
+	assert store.seasonGameIds(39) == []
+	assert store.totals() == {name: 0 for name in jeopardy.STATS_TOTALS}
+
+def test_plain_json_games_are_indexed_and_compressed(cacheDir, games):
+	gamesDir = cacheDir / 'games'
+	gamesDir.mkdir(parents=True)
+	data = games['game_standard']
+	(gamesDir / '7001.json').write_text(json.dumps(data.toDict()))
+	(gamesDir / 'notes.json').write_text("{}")
+
+	store = jeopardy.Store()
+
+	assert not (gamesDir / '7001.json').exists()
+	assert jeopardy.GameCache.read(jeopardy.GameCache.path(7001)).toDict() == data.toDict()
+	assert store.cachedGameIds() == [7001]
+	assert store.db.execute("SELECT count(*) FROM clues WHERE game_id = 7001").fetchone()[0] > 0
+	assert (gamesDir / 'notes.json').exists()
+
+def test_clues_missed_before_reviews_are_scheduled(store, games):
+	data = games['game_standard']
+	store.indexGame(7001, data)
+	category = data.jeopardyRound.categories[0]
+	store.db.executemany("INSERT INTO attempts (time, game_id, round, category, value, daily_double, correct, overridden) "
+		"VALUES (?, 7001, 'J', ?, ?, 0, ?, 0)", [(1000, category, 200, 0), (5000, category, 200, 0), (2000, category, 400, 1)])
+	store.db.execute("UPDATE meta SET value = 2 WHERE key = 'version'")
+
+	store = jeopardy.Store(legacy=False)
+
+	reviews = store.dueReviews(time.time(), 10)
+	assert [(review[2], review[4], review[0]) for review in reviews] == [(category, 200, 5000 + 86400)]